@@ -0,0 +1,87 @@
+# Server-side processing of tables on admin panel (DataTables).
+# Browser asks for one page of rows, sorting and searching are done in SQL, so the admin page
+# doesn't get all users and grades at once.
+
+# Tables on admin panel: view, columns (the same order as in html table) and table used to count all rows
+TABLES = {
+    'users': ('vw_users', ['id', 'email', 'first_name', 'second_name', 'role'], 'user'),
+    'subjects': ('vw_subjects', ['id', 'name'], 'subject'),
+    'classes': ('vw_classes', ['id', 'name', 'profile'], 'class'),
+    'grades': ('vw_grades', ['ID', 'Value', 'Weight', 'ID: Student', 'ID: Teacher'], 'grade'),
+    'assigns': ('vw_assigns', ['ID', 'Teacher', 'Class and profile', 'subject'], 'teacher_class'),
+}
+
+MAX_PAGE_LENGTH = 1000
+
+def quote(column):
+    return '"' + column.replace('"', '""') + '"'
+
+# Integer from request parameter, default if it's missing or not a number
+def int_arg(args, name, default):
+    try:
+        return int(args.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+# One page of table for DataTables request parameters (draw, start, length, search[value], order[0][column], order[0][dir]).
+# Extra parameters after/before (id of the last/first row of the previous page) move to the next/previous page
+# with keyset pagination (WHERE id > ?), which is used when table is sorted by id, other sorting uses OFFSET.
+def table_page(conn, table, args):
+    view, columns, count_table = TABLES[table]
+    key = quote(columns[0]) # The first column is id of the row
+    start = max(int_arg(args, 'start', 0), 0)
+    length = int_arg(args, 'length', 10)
+    if length < 0 or length > MAX_PAGE_LENGTH: # -1 means "All" in DataTables
+        length = MAX_PAGE_LENGTH
+    order_column = int_arg(args, 'order[0][column]', 0)
+    if not 0 <= order_column < len(columns):
+        order_column = 0
+    descending = args.get('order[0][dir]') == 'desc'
+    direction = 'DESC' if descending else 'ASC'
+    search = args.get('search[value]', '').strip()
+
+    # Searching in every column
+    conditions = []
+    params = []
+    if search:
+        pattern = '%' + search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        conditions.append('(' + ' OR '.join(f"{quote(column)} LIKE ? ESCAPE '\\'" for column in columns) + ')')
+        params.extend([pattern] * len(columns))
+
+    records_total = conn.execute(f'SELECT COUNT(*) FROM {count_table}').fetchone()[0]
+    if conditions:
+        records_filtered = conn.execute(f'SELECT COUNT(*) FROM {view} WHERE {" AND ".join(conditions)}', params).fetchone()[0]
+    else:
+        records_filtered = records_total
+
+    order = f'ORDER BY {quote(columns[order_column])} {direction}, {key} {direction}'
+    after = int_arg(args, 'after', None)
+    before = int_arg(args, 'before', None)
+    reverse = False
+    if order_column == 0 and after is not None:
+        # Next page: rows after the last row of the previous page
+        conditions.append(f'{key} {"<" if descending else ">"} ?')
+        params.append(after)
+        limit = f'LIMIT {length}'
+    elif order_column == 0 and before is not None:
+        # Previous page: rows before the first row of the next page, read in opposite order
+        conditions.append(f'{key} {">" if descending else "<"} ?')
+        params.append(before)
+        order = f'ORDER BY {key} {"ASC" if descending else "DESC"}'
+        limit = f'LIMIT {length}'
+        reverse = True
+    else:
+        limit = f'LIMIT {length} OFFSET {start}'
+    where = f'WHERE {" AND ".join(conditions)}' if conditions else ''
+    rows = conn.execute(f'SELECT {", ".join(quote(column) for column in columns)} FROM {view} {where} {order} {limit}', params).fetchall()
+    if reverse:
+        rows.reverse()
+
+    return {
+        'draw': int_arg(args, 'draw', 0),
+        'recordsTotal': records_total,
+        'recordsFiltered': records_filtered,
+        'data': [list(row) for row in rows],
+        'first_key': rows[0][0] if rows else None,
+        'last_key': rows[-1][0] if rows else None,
+    }
@@ -0,0 +1,146 @@
+from collections import namedtuple
+import numpy as np
+from rankings import OVERALL, RANK_DIGITS
+
+# Analytics of the whole school calculated at once with NumPy.
+# Grades are loaded to compact columns (value int8, weight float32, ids int32) and every sum is made with
+# np.bincount over the whole column, so averages and ranks of all students, classes and subjects are ready
+# after one pass instead of one SQL query per dashboard. Used to rebuild student_ranking (rebuild_rankings)
+# and for reports. numpy is imported only by code which uses this module, not at app startup.
+
+# Columns of grade table (one element for every grade of student who is in a class)
+GradeColumns = namedtuple('GradeColumns', ['value', 'weight', 'student_id', 'subject_id', 'class_id'])
+
+GRADE_DTYPE = np.dtype([('value', np.int8), ('weight', np.float32), ('student_id', np.int32),
+                        ('subject_id', np.int32), ('class_id', np.int32)])
+
+# Read all grades to GradeColumns, rows are read straight from cursor to one array (no list of tuples)
+def load_grade_columns(conn):
+    count = conn.execute('''SELECT COUNT(*) FROM grade g JOIN student s ON s.id = g.student_id
+                            WHERE g.subject_id IS NOT NULL AND s.class_id IS NOT NULL''').fetchone()[0]
+    cursor = conn.execute('''SELECT g.value, g.weight, g.student_id, g.subject_id, s.class_id
+                             FROM grade g JOIN student s ON s.id = g.student_id
+                             WHERE g.subject_id IS NOT NULL AND s.class_id IS NOT NULL
+                             ORDER BY g.id''')
+    rows = np.fromiter(cursor, dtype=GRADE_DTYPE, count=count)
+    return GradeColumns(*(rows[name] for name in GRADE_DTYPE.names))
+
+# Rank 1, 2, 3, ... inside every group, order is sorted by group and position inside the group
+def ranks_in_groups(order, group):
+    sorted_group = group[order]
+    starts = np.flatnonzero(np.r_[True, sorted_group[1:] != sorted_group[:-1]])
+    group_start = np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+    ranks = np.empty(len(order), dtype=np.int32)
+    ranks[order] = np.arange(len(order)) - group_start + 1
+    return ranks
+
+# Weighted averages for keys which are small numbers (ids): (keys with weight > 0, averages).
+# np.bincount adds values in order of the array, so sums are rounded like sums made one by one in SQL.
+def weighted_averages(keys, weighted, weight):
+    sums = np.bincount(keys, weighted)
+    weights = np.bincount(keys, weight)
+    present = np.flatnonzero(weights > 0)
+    return present, sums[present] / weights[present]
+
+# Results for the whole school. Keys of averages are id * key_base + subject_id (subject_id 0 = all subjects).
+class SchoolAnalytics():
+
+    def __init__(self, columns):
+        # Weights are decimals saved as float32, rounding gives back the same double as in database
+        # (so averages and ties in ranks are the same as in grade_aggregate and rankings.py)
+        weight = np.round(columns.weight.astype(np.float64), 6)
+        weighted = columns.value * weight
+        self.key_base = int(columns.subject_id.max(initial=0)) + 1
+        student_id = columns.student_id.astype(np.int64)
+        class_id = columns.class_id.astype(np.int64)
+        subject_id = columns.subject_id.astype(np.int64)
+
+        # Averages of every student from every subject and from all subjects, the average from all subjects is made
+        # from sums of subjects like in rankings.py. Sums can still differ in the last bit from grade_aggregate
+        # (other order of adding), so averages are rounded to RANK_DIGITS like in student_ranking.
+        # Number of (student, subject) pairs can be too big for bincount by key, so pairs are numbered with np.unique.
+        pair_keys, pair_index = np.unique(student_id * self.key_base + subject_id, return_inverse=True)
+        pair_sums = np.bincount(pair_index, weighted, len(pair_keys))
+        pair_weights = np.bincount(pair_index, weight, len(pair_keys))
+        valid = pair_weights > 0
+        overall_ids, overall_averages = weighted_averages(pair_keys // self.key_base, pair_sums, pair_weights)
+        self.student_keys = np.concatenate([overall_ids * self.key_base + OVERALL, pair_keys[valid]])
+        self.student_averages = np.concatenate([overall_averages, pair_sums[valid] / pair_weights[valid]])
+        order = np.argsort(self.student_keys)
+        self.student_keys = self.student_keys[order]
+        self.student_averages = np.round(self.student_averages[order], RANK_DIGITS)
+
+        # Class of every student (the same for all his grades)
+        student_class = np.zeros(int(student_id.max(initial=0)) + 1, dtype=np.int64)
+        student_class[student_id] = class_id
+        self.ranking_student_id = self.student_keys // self.key_base
+        self.ranking_subject_id = self.student_keys % self.key_base
+        self.ranking_class_id = student_class[self.ranking_student_id]
+        # Ranks in school and in class, separately for every subject and for all subjects:
+        # order by subject, average (the highest first) and id, then the same order grouped by class (stable sort)
+        school_order = np.lexsort((self.ranking_student_id, -self.student_averages, self.ranking_subject_id))
+        self.school_ranks = ranks_in_groups(school_order, self.ranking_subject_id)
+        class_group = self.ranking_class_id * self.key_base + self.ranking_subject_id
+        class_order = school_order[np.argsort(class_group[school_order], kind='stable')]
+        self.class_ranks = ranks_in_groups(class_order, class_group)
+
+        # Averages of all grades of every class and subject
+        class_keys, class_averages = weighted_averages(class_id * self.key_base + subject_id, weighted, weight)
+        class_overall_ids, class_overall_averages = weighted_averages(class_id, weighted, weight)
+        self.class_keys = np.concatenate([class_overall_ids * self.key_base + OVERALL, class_keys])
+        self.class_averages = np.concatenate([class_overall_averages, class_averages])
+        order = np.argsort(self.class_keys)
+        self.class_keys = self.class_keys[order]
+        self.class_averages = self.class_averages[order]
+        self.subject_ids, self.subject_averages = weighted_averages(subject_id, weighted, weight)
+        self.school_average = weighted.sum() / weight.sum() if len(weight) else None
+
+    def _find(self, keys, values, key):
+        index = np.searchsorted(keys, key)
+        if index < len(keys) and keys[index] == key:
+            return values[index]
+        return None
+
+    def student_average(self, student_id, subject_id=OVERALL):
+        average = self._find(self.student_keys, self.student_averages, student_id * self.key_base + subject_id)
+        return None if average is None else float(average)
+
+    # Position of the student (class_rank, school_rank, average), None if the student has no grades
+    def student_rank(self, student_id, subject_id=OVERALL):
+        index = self._find(self.student_keys, np.arange(len(self.student_keys)), student_id * self.key_base + subject_id)
+        if index is None:
+            return None
+        return int(self.class_ranks[index]), int(self.school_ranks[index]), float(self.student_averages[index])
+
+    def class_average(self, class_id, subject_id=OVERALL):
+        average = self._find(self.class_keys, self.class_averages, class_id * self.key_base + subject_id)
+        return None if average is None else float(average)
+
+    def subject_average(self, subject_id):
+        average = self._find(self.subject_ids, self.subject_averages, subject_id)
+        return None if average is None else float(average)
+
+    # Rows of student_ranking table (student_id, subject_id, class_id, average, class_rank),
+    # school ranks are counted when they are read (rankings.school_rank_sql)
+    def ranking_rows(self):
+        return zip(self.ranking_student_id.tolist(), self.ranking_subject_id.tolist(), self.ranking_class_id.tolist(),
+                   self.student_averages.tolist(), self.class_ranks.tolist())
+
+def compute_school(conn):
+    return SchoolAnalytics(load_grade_columns(conn))
+
+# Rankings of the whole school calculated again at once (instead of refreshing changed classes one by one,
+# e.g. after loading many grades). Grades are read under the write lock, so no grade is missed.
+def rebuild_rankings(conn):
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        analytics = compute_school(conn)
+        conn.execute('DELETE FROM student_ranking')
+        conn.executemany('''INSERT INTO student_ranking (student_id, subject_id, class_id, average, class_rank)
+                            VALUES (?, ?, ?, ?, ?)''', analytics.ranking_rows())
+        conn.execute('DELETE FROM ranking_dirty')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return analytics
@@ -0,0 +1,72 @@
+# Time of calculating averages and rankings of the whole school with NumPy (analytics.py).
+# Without --database grades are random columns in memory (--grades, default 1M), with --database grades are
+# read from the database file and the result is compared with rankings calculated in SQL (rankings.py).
+# Run from the main folder: python -m benchmarks.analytics [--grades 1000000] [--database school_10k.db]
+import argparse
+import shutil
+import sqlite3
+import tempfile
+import os
+import time
+import numpy as np
+from analytics import GradeColumns, SchoolAnalytics, load_grade_columns
+from rankings import refresh_rankings
+
+def random_columns(grades, students_per_class=25, subjects=20, grades_per_student=20):
+    rand = np.random.default_rng(0)
+    students = max(grades // grades_per_student, 1)
+    student_id = rand.integers(1, students + 1, grades, dtype=np.int32)
+    return GradeColumns(value=rand.integers(1, 7, grades, dtype=np.int8),
+                        weight=rand.choice(np.array([0.1, 0.2, 0.3, 0.5, 0.7, 1.0], dtype=np.float32), grades),
+                        student_id=student_id,
+                        subject_id=rand.integers(1, subjects + 1, grades, dtype=np.int32),
+                        class_id=(student_id - 1) // students_per_class + 1)
+
+def measure(function, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+def main():
+    parser = argparse.ArgumentParser(description='Time of whole school analytics')
+    parser.add_argument('--grades', type=int, default=1000000, help='number of random grades (without --database)')
+    parser.add_argument('--database', help='database file with grades (it is copied, not changed)')
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.database is None:
+        columns = random_columns(args.grades)
+    else:
+        folder = tempfile.mkdtemp()
+        path = os.path.join(folder, 'analytics.db')
+        shutil.copyfile(args.database, path)
+        conn = sqlite3.connect(path)
+        load_seconds, columns = measure(lambda: load_grade_columns(conn), args.runs)
+        print(f'load {len(columns.value)} grades: {load_seconds * 1000:.0f} ms')
+
+    compute_seconds, analytics = measure(lambda: SchoolAnalytics(columns), args.runs)
+    print(f'compute averages and ranks of {len(columns.value)} grades: {compute_seconds * 1000:.0f} ms')
+
+    if args.database is not None:
+        # The same rankings calculated in SQL for all classes
+        conn.execute('INSERT OR IGNORE INTO ranking_dirty (class_id) SELECT DISTINCT class_id FROM student WHERE class_id IS NOT NULL')
+        conn.commit()
+        start = time.perf_counter()
+        refresh_rankings(conn)
+        print(f'SQL refresh of all rankings: {(time.perf_counter() - start) * 1000:.0f} ms')
+        # School ranks of all rows at once (the same order as rankings.school_rank_sql)
+        sql_rows = sorted(conn.execute('''SELECT student_id, subject_id, class_id, average, class_rank,
+                                                 ROW_NUMBER() OVER (PARTITION BY subject_id ORDER BY average DESC, student_id)
+                                          FROM student_ranking'''))
+        rows = sorted((*row, school_rank) for row, school_rank in zip(analytics.ranking_rows(), analytics.school_ranks.tolist()))
+        different = sum(1 for sql_row, row in zip(sql_rows, rows) if sql_row != row)
+        different += abs(len(sql_rows) - len(analytics.student_keys))
+        print(f'rows different from SQL rankings: {different}')
+        conn.close()
+        shutil.rmtree(folder)
+
+if __name__ == '__main__':
+    main()
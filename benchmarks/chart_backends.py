@@ -0,0 +1,38 @@
+# Render time and size of dashboard charts for every chart backend (charts.py).
+# Run from the main folder: python -m benchmarks.chart_backends [--renders 50]
+import argparse
+import random
+import statistics
+import time
+from charts import BACKENDS, get_backend
+
+def measure(render, renders):
+    times = []
+    for _ in range(renders):
+        start = time.perf_counter()
+        image = render()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), max(times), len(image)
+
+def main():
+    parser = argparse.ArgumentParser(description='Render time and size of charts for every backend')
+    parser.add_argument('--renders', type=int, default=50)
+    args = parser.parse_args()
+
+    # Data like on dashboards: 20 subjects of a student, 30 students in a class
+    subjects = [f'Subject {i}' for i in range(20)]
+    subject_averages = [random.uniform(1, 6) for _ in subjects]
+    students = [f'Student Name{i}' for i in range(30)]
+    student_averages = [random.uniform(1, 6) for _ in students]
+
+    print(f'{"backend":12} {"chart":8} {"median ms":>10} {"max ms":>10} {"bytes":>10}')
+    for name in BACKENDS:
+        backend = get_backend(name)
+        charts = {'student': lambda: backend.student_chart(subjects, subject_averages),
+                  'class': lambda: backend.class_chart('1A', students, student_averages)}
+        for chart, render in charts.items():
+            median_ms, max_ms, size = measure(render, args.renders)
+            print(f'{name:12} {chart:8} {median_ms:10.2f} {max_ms:10.2f} {size:10d}')
+
+if __name__ == '__main__':
+    main()
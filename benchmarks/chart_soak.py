@@ -0,0 +1,47 @@
+# Memory of the process while drawing many dashboard charts (charts.py, matplotlib backend by default).
+# Resident memory (RSS) is printed every --step renders, it should stay flat after the first renders.
+# Exit code is 1 if RSS grows more than --max-growth MB between the first and the last step.
+# Run from the main folder: python -m benchmarks.chart_soak [--renders 10000]
+import argparse
+import os
+import random
+import sys
+import time
+from charts import BACKENDS, get_backend
+
+# Current resident memory of this process in MB (Linux)
+def rss_mb():
+    with open('/proc/self/statm') as statm:
+        pages = int(statm.read().split()[1])
+    return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+def main():
+    parser = argparse.ArgumentParser(description='Memory of the process while drawing charts')
+    parser.add_argument('--renders', type=int, default=10000)
+    parser.add_argument('--step', type=int, default=500)
+    parser.add_argument('--backend', default='matplotlib', choices=list(BACKENDS))
+    parser.add_argument('--max-growth', type=float, default=20.0, help='allowed RSS growth in MB')
+    args = parser.parse_args()
+
+    backend = get_backend(args.backend)
+    subjects = [f'Subject {i}' for i in range(20)]
+    students = [f'Student {i}' for i in range(30)]
+    samples = []
+    start = time.perf_counter()
+    for render in range(1, args.renders + 1):
+        # Student and teacher charts in turns, with random data like on dashboards
+        if render % 2:
+            backend.student_chart(subjects, [random.uniform(1, 6) for _ in subjects])
+        else:
+            backend.class_chart('1A', students, [random.uniform(1, 6) for _ in students])
+        if render % args.step == 0:
+            samples.append(rss_mb())
+            print(f'{render:6d} renders  RSS {samples[-1]:7.1f} MB  {(time.perf_counter() - start) / render * 1000:6.1f} ms/render')
+
+    growth = samples[-1] - samples[0] if samples else 0.0
+    print(f'RSS growth after the first {args.step} renders: {growth:.1f} MB')
+    if growth > args.max_growth:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
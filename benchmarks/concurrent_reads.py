@@ -0,0 +1,95 @@
+# Read throughput of the student dashboard query while a teacher is saving grades.
+# Compares SQLite defaults with every profile from database.DATABASE_PROFILES.
+# Readers and the writer are separate processes, like gunicorn workers sharing one database file.
+# Run from the main folder: python -m benchmarks.concurrent_reads [--seconds 5] [--readers 4]
+import argparse
+import os
+import shutil
+import sqlite3
+import tempfile
+import multiprocessing
+import time
+from database import DATABASE_PROFILES, apply_pragmas
+
+# Query used on student dashboard to calculate the class ranking
+READ_QUERY = '''SELECT s.id, SUM(g.value * g.weight) / SUM(g.weight) AS avg_grade
+                FROM student s
+                JOIN grade g ON s.id = g.student_id
+                WHERE s.class_id = ?
+                GROUP BY s.id
+                ORDER BY avg_grade DESC'''
+
+def connect(path, pragmas):
+    conn = sqlite3.connect(path, check_same_thread=False)
+    apply_pragmas(conn, pragmas)
+    return conn
+
+def writer(path, pragmas, stop, writes):
+    conn = connect(path, pragmas)
+    grade_ids = [row[0] for row in conn.execute('SELECT id FROM grade LIMIT 30')]
+    weight = 0.5
+    while not stop.is_set():
+        try:
+            # One "enter grades" submit: 30 grades written in one transaction
+            # (existing rows are changed, so the size of the table is the same for every profile)
+            weight = 1.5 - weight
+            conn.executemany('UPDATE grade SET weight = ? WHERE id = ?', [(weight, grade_id) for grade_id in grade_ids])
+            time.sleep(0.002) # transaction stays open for a while like in a real request
+            conn.commit()
+            with writes.get_lock():
+                writes.value += 1
+        except sqlite3.OperationalError:
+            conn.rollback()
+    conn.close()
+
+def reader(path, pragmas, stop, reads, errors):
+    conn = connect(path, pragmas)
+    class_id = 1
+    done = failed = 0
+    while not stop.is_set():
+        try:
+            conn.execute(READ_QUERY, (class_id,)).fetchall()
+            done += 1
+        except sqlite3.OperationalError: # database is locked
+            failed += 1
+        class_id = class_id % 15 + 1
+    conn.close()
+    with reads.get_lock():
+        reads.value += done
+        errors.value += failed
+
+def run(path, pragmas, seconds, readers):
+    stop = multiprocessing.Event()
+    reads = multiprocessing.Value('q', 0)
+    errors = multiprocessing.Value('q', 0)
+    writes = multiprocessing.Value('q', 0)
+    processes = [multiprocessing.Process(target=writer, args=(path, pragmas, stop, writes))]
+    processes += [multiprocessing.Process(target=reader, args=(path, pragmas, stop, reads, errors)) for _ in range(readers)]
+    for process in processes:
+        process.start()
+    time.sleep(seconds)
+    stop.set()
+    for process in processes:
+        process.join()
+    return reads.value / seconds, errors.value, writes.value / seconds
+
+def main():
+    parser = argparse.ArgumentParser(description='Read throughput during concurrent writes')
+    parser.add_argument('--database', default='school_database.db', help='database copied for every run')
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--readers', type=int, default=4)
+    args = parser.parse_args()
+
+    # Settings used before profiles (rollback journal, python's default 5 seconds timeout)
+    profiles = {'default': {'journal_mode': 'DELETE'}}
+    profiles.update(DATABASE_PROFILES)
+    print(f'{"profile":10} {"reads/s":>10} {"locked":>8} {"writes/s":>10}')
+    for name, pragmas in profiles.items():
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'bench.db')
+            shutil.copy(args.database, path)
+            reads, errors, writes = run(path, pragmas, args.seconds, args.readers)
+        print(f'{name:10} {reads:10.0f} {errors:8d} {writes:10.1f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+# Aggregate queries on grade table with TEXT values (CAST in every query) and with INTEGER values (migration 5).
+# Both databases have the same random grades (--grades, default 1M), the typed one is made by rebuild_grade_table,
+# so the time of the migration is measured too.
+# Run from the main folder: python -m benchmarks.grade_types [--grades 1000000]
+import argparse
+import os
+import random
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+from migrations import rebuild_grade_table
+
+# The same queries before and after migration, {value} is the grade value as integer (g is grade table)
+QUERIES = {
+    'class averages': '''SELECT s.id, SUM({value} * g.weight) / SUM(g.weight) AS avg_grade
+                         FROM student s
+                         JOIN grade g ON s.id = g.student_id
+                         WHERE s.class_id = ?
+                         GROUP BY s.id
+                         ORDER BY avg_grade DESC''',
+    'subject averages': '''SELECT g.subject_id, SUM({value} * g.weight) / SUM(g.weight) FROM grade g GROUP BY g.subject_id''',
+    'histogram': '''SELECT {value}, COUNT(*) FROM grade g GROUP BY {value}''',
+    'student histogram': '''SELECT g.subject_id, {value}, COUNT(*) FROM grade g WHERE g.student_id = ? GROUP BY g.subject_id, {value}''',
+}
+
+def create_text_database(path, grades, students_per_class=25, grades_per_student=30):
+    rand = random.Random(0)
+    students = max(grades // grades_per_student, 1)
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA journal_mode = MEMORY')
+    conn.execute('PRAGMA synchronous = OFF')
+    conn.execute('CREATE TABLE student (id INTEGER PRIMARY KEY, class_id INTEGER)')
+    conn.execute('''CREATE TABLE grade (id INTEGER PRIMARY KEY, value TEXT, weight INTEGER,
+                                        subject_id INTEGER, student_id INTEGER, teacher_id INTEGER)''')
+    conn.execute('CREATE TABLE schema_view (name TEXT PRIMARY KEY, definition_hash TEXT NOT NULL)')
+    conn.executemany('INSERT INTO student (id, class_id) VALUES (?, ?)',
+                     ((student_id, (student_id - 1) // students_per_class + 1) for student_id in range(1, students + 1)))
+    conn.executemany('INSERT INTO grade (value, weight, subject_id, student_id, teacher_id) VALUES (?, ?, ?, ?, ?)',
+                     ((str(rand.randint(1, 6)), rand.choice([0.1, 0.2, 0.3, 0.5, 0.7, 1]), rand.randint(1, 20),
+                       rand.randint(1, students), rand.randint(1, 100)) for _ in range(grades)))
+    conn.execute('CREATE INDEX idx_grade_student_subject ON grade(student_id, subject_id, value, weight)')
+    conn.execute('CREATE INDEX idx_student_class ON student(class_id, id)')
+    conn.commit()
+    conn.close()
+    return students, (students - 1) // students_per_class + 1
+
+# Median time (ms) of the query, parameters are changed for every run
+def measure(conn, sql, params, runs):
+    times = []
+    for run in range(runs):
+        start = time.perf_counter()
+        conn.execute(sql, params(run)).fetchall()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+def main():
+    parser = argparse.ArgumentParser(description='Aggregate queries with TEXT and INTEGER grade values')
+    parser.add_argument('--grades', type=int, default=1000000)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        text_path = os.path.join(folder, 'text.db')
+        typed_path = os.path.join(folder, 'typed.db')
+        students, classes = create_text_database(text_path, args.grades)
+        shutil.copyfile(text_path, typed_path)
+
+        typed = sqlite3.connect(typed_path)
+        start = time.perf_counter()
+        typed.execute('BEGIN IMMEDIATE')
+        rebuild_grade_table(typed)
+        typed.commit()
+        print(f'migration of {args.grades} grades: {time.perf_counter() - start:.1f} s')
+        text = sqlite3.connect(text_path)
+
+        params = {'class averages': lambda run: (run % classes + 1,),
+                  'student histogram': lambda run: (run * 7919 % students + 1,)}
+        print(f'{"query":20} {"TEXT + CAST ms":>15} {"INTEGER ms":>12} {"speedup":>8}')
+        for name, sql in QUERIES.items():
+            text_ms = measure(text, sql.format(value='CAST(g.value AS INTEGER)'), params.get(name, lambda run: ()), args.runs)
+            typed_ms = measure(typed, sql.format(value='g.value'), params.get(name, lambda run: ()), args.runs)
+            print(f'{name:20} {text_ms:15.2f} {typed_ms:12.2f} {text_ms / typed_ms:7.1f}x')
+        text.close()
+        typed.close()
+
+if __name__ == '__main__':
+    main()
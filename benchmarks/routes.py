@@ -0,0 +1,210 @@
+# Latency and throughput of the main pages with a generated school of a few sizes (dataset.py).
+# For every scale a database is generated once (kept in --data-dir), every run measures a fresh copy of it
+# (saved grades don't change the next run). A new process imports the app with this database
+# (config is read at import) and sends requests with the Flask test client, logged in as student, teacher and admin.
+# Dashboards are measured with unchanged rankings and directly after a teacher saves grades of the student's class
+# (the read refreshes rankings of the class), admin tables with keyset pages, OFFSET pages and search.
+# Results (p50/p95/p99 in ms and requests per second) are printed and can be saved to json and compared
+# with results from other commit: exit code is 1 if p95 of any page is slower than baseline * threshold.
+# Run from the main folder: python -m benchmarks.routes [--scales small,10k,100k] [--output results.json]
+#                                                       [--compare baseline.json --threshold 1.25]
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataset import SCALES, school_size
+from snapshots import restore_snapshot
+
+# Password of every generated user and admin created by generate_dataset
+PASSWORD = 'password'
+ADMIN_EMAIL = 'admin@admin.uw.edu.pl'
+
+# Generate school in a new database file with the same command as users (tables, migrations, dataset, rankings)
+def generate_database(path, scale, profile):
+    env = dict(os.environ, SCHOOL_DATABASE=path, SCHOOL_DATABASE_PROFILE=profile)
+    subprocess.run([sys.executable, '-m', 'flask', '--app', 'main', 'generate-dataset', '--scale', scale],
+                   env=env, check=True, capture_output=True, text=True)
+
+# p50, p95, p99 (ms) and requests per second of one page
+def summary(times, elapsed):
+    percentiles = statistics.quantiles(times, n=100, method='inclusive') if len(times) > 1 else [times[0]] * 99
+    return {'requests': len(times),
+            'p50': percentiles[49] * 1000,
+            'p95': percentiles[94] * 1000,
+            'p99': percentiles[98] * 1000,
+            'rps': len(times) / elapsed}
+
+def check_status(response, status):
+    if response.status_code != status:
+        raise RuntimeError(f'{response.request.method} {response.request.path}: status {response.status_code}, expected {status}')
+    return response
+
+# Send request() count times (after warmup requests which are not measured), check the status of every response.
+# before() is sent before every request and not measured (e.g. saving grades before a dashboard),
+# requests per second count only measured requests.
+def measure(request, count, warmup, status, before=None):
+    for _ in range(warmup):
+        if before is not None:
+            before()
+        request()
+    times = []
+    for _ in range(count):
+        if before is not None:
+            before()
+        request_start = time.perf_counter()
+        response = request()
+        times.append(time.perf_counter() - request_start)
+        check_status(response, status)
+    return summary(times, sum(times))
+
+# Code of the process which imports the app (SCHOOL_DATABASE is already set), prints json with results
+def run_pages(requests, login_requests, warmup):
+    import main
+    app = main.app
+    app.config['TESTING'] = True
+    with main.pool.connection() as conn:
+        # Teacher gives grades in the student's class, so every write changes rankings read by the student
+        teacher_email, class_id, subject_id = conn.execute('''SELECT u.email, tc.class_id, tc.subject_id FROM user u
+                                                              JOIN teacher_class tc ON tc.teacher_id = u.id
+                                                              ORDER BY u.id, tc.class_id LIMIT 1''').fetchone()
+        student_email = conn.execute('''SELECT u.email FROM user u JOIN student s ON s.id = u.id
+                                        WHERE s.class_id = ? ORDER BY u.id LIMIT 1''', (class_id,)).fetchone()[0]
+        class_size = conn.execute('SELECT COUNT(*) FROM student WHERE class_id = ?', (class_id,)).fetchone()[0]
+        # Admin tables: the middle of grades (keyset page after this id, OFFSET page from this position)
+        grade_count = conn.execute('SELECT COUNT(*) FROM grade').fetchone()[0]
+        middle_grade = conn.execute('SELECT id FROM grade ORDER BY id LIMIT 1 OFFSET ?', (grade_count // 2,)).fetchone()
+        search = conn.execute('SELECT second_name FROM user WHERE id = (SELECT teacher_id FROM teacher_class LIMIT 1)').fetchone()[0]
+
+    def logged_client(login, email):
+        client = app.test_client()
+        response = client.post(login, data={'email': email, 'password': PASSWORD})
+        if response.status_code != 302 or login in response.headers.get('Location', ''):
+            raise RuntimeError(f'Login of {email} failed.')
+        return client
+
+    student = logged_client('/login_student', student_email)
+    teacher = logged_client('/login_teacher', teacher_email)
+    admin = logged_client('/login_admin', ADMIN_EMAIL)
+    anonymous = app.test_client()
+    grades = {'gradeaction': 'update2', 'selectedClass': str(class_id), 'weight': '0.5', 'grades': ['4'] * class_size}
+
+    def save_grades():
+        check_status(teacher.post('/enter_grades', data=grades), 302)
+
+    table = {'draw': '1', 'length': '50'}
+    keyset = dict(table, after=str(middle_grade[0] if middle_grade else 0))
+    offset = dict(table, start=str(grade_count // 2), **{'order[0][column]': '1', 'order[0][dir]': 'desc'})
+    searched = dict(table, **{'search[value]': search})
+
+    # name, request, measured requests, status, request sent before every measured one (not measured)
+    pages = [
+        ('GET /student_dashboard', lambda: student.get('/student_dashboard'), requests, 200, None),
+        ('POST /student_dashboard', lambda: student.post('/student_dashboard', data={'selected_subject': str(subject_id)}), requests, 200, None),
+        ('POST /teacher_dashboard', lambda: teacher.post('/teacher_dashboard', data={'selected_class': str(class_id)}), requests, 200, None),
+        ('GET /admin_panel', lambda: admin.get('/admin_panel'), requests, 200, None),
+        ('GET /admin_panel/data keyset', lambda: admin.get('/admin_panel/data/grades', query_string=keyset), requests, 200, None),
+        ('GET /admin_panel/data offset', lambda: admin.get('/admin_panel/data/grades', query_string=offset), requests, 200, None),
+        ('GET /admin_panel/data search', lambda: admin.get('/admin_panel/data/grades', query_string=searched), requests, 200, None),
+        ('POST /enter_grades update2', lambda: teacher.post('/enter_grades', data=grades), requests, 302, None),
+        ('GET /student_dashboard after write', lambda: student.get('/student_dashboard'), requests, 200, save_grades),
+        ('POST /teacher_dashboard after write', lambda: teacher.post('/teacher_dashboard', data={'selected_class': str(class_id)}), requests, 200, save_grades),
+        ('POST /login_student', lambda: anonymous.post('/login_student', data={'email': student_email, 'password': PASSWORD}), login_requests, 302, None),
+        ('POST /login_teacher', lambda: anonymous.post('/login_teacher', data={'email': teacher_email, 'password': PASSWORD}), login_requests, 302, None),
+        ('POST /login_admin', lambda: anonymous.post('/login_admin', data={'email': ADMIN_EMAIL, 'password': PASSWORD}), login_requests, 302, None),
+    ]
+    results = {}
+    for name, request, count, status, before in pages:
+        # Login is slow on purpose (password hash), one warmup request starts the password pool
+        results[name] = measure(request, count, min(warmup, 1) if name.startswith('POST /login') else warmup, status, before)
+    main.password_pool.close()
+    print(json.dumps(results))
+
+def run_scale(database, args):
+    env = dict(os.environ, SCHOOL_DATABASE=database, SCHOOL_DATABASE_PROFILE=args.profile)
+    output = subprocess.run([sys.executable, '-m', 'benchmarks.routes', '--pages', '--requests', str(args.requests),
+                             '--login-requests', str(args.login_requests), '--warmup', str(args.warmup)],
+                            env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# Pages of baseline which are slower now: p95 above baseline * threshold and at least min_delta ms slower
+def regressions(results, baseline, threshold, min_delta):
+    found = []
+    for scale, scale_results in results['scales'].items():
+        baseline_pages = baseline.get('scales', {}).get(scale, {}).get('pages', {})
+        for name, page in scale_results['pages'].items():
+            if name not in baseline_pages:
+                continue
+            before = baseline_pages[name]['p95']
+            if page['p95'] > before * threshold and page['p95'] - before > min_delta:
+                found.append((scale, name, before, page['p95']))
+    return found
+
+def main():
+    parser = argparse.ArgumentParser(description='Latency and throughput of pages with generated schools')
+    parser.add_argument('--scales', default='small,10k,100k', help=f'comma separated scales from: {", ".join(SCALES)}')
+    parser.add_argument('--requests', type=int, default=50, help='measured requests of every page')
+    parser.add_argument('--login-requests', type=int, default=10, help='measured requests of every login page')
+    parser.add_argument('--warmup', type=int, default=3, help='requests sent before measuring')
+    parser.add_argument('--profile', default='prod', help='SQLite settings (database.DATABASE_PROFILES)')
+    parser.add_argument('--data-dir', help='folder for generated databases, existing databases are used again')
+    parser.add_argument('--output', help='save results to json file')
+    parser.add_argument('--compare', help='json file with baseline results (--output of other commit)')
+    parser.add_argument('--threshold', type=float, default=1.25, help='maximum ratio of p95 to baseline p95')
+    parser.add_argument('--min-delta', type=float, default=1.0, help='smaller differences of p95 (ms) are not regressions')
+    parser.add_argument('--pages', action='store_true', help=argparse.SUPPRESS) # process which measures one database
+    args = parser.parse_args()
+
+    if args.pages:
+        run_pages(args.requests, args.login_requests, args.warmup)
+        return
+
+    scales = [scale.strip() for scale in args.scales.split(',') if scale.strip()]
+    unknown = [scale for scale in scales if scale not in SCALES]
+    if unknown:
+        parser.error(f'unknown scales: {", ".join(unknown)}')
+
+    results = {'commit': commit(), 'python': platform.python_version(), 'profile': args.profile, 'scales': {}}
+    with tempfile.TemporaryDirectory() as folder:
+        data_dir = args.data_dir or folder
+        os.makedirs(data_dir, exist_ok=True)
+        for scale in scales:
+            database = os.path.join(data_dir, f'routes_{scale}.db')
+            if not os.path.exists(database):
+                start = time.perf_counter()
+                generate_database(database, scale, args.profile)
+                print(f'{scale}: database generated in {time.perf_counter() - start:.1f} s')
+            copy = os.path.join(folder, f'routes_{scale}_run.db')
+            restore_snapshot(database, copy)
+            pages = run_scale(copy, args)
+            os.remove(copy)
+            results['scales'][scale] = {'size': school_size(scale), 'pages': pages}
+            print(f'{scale}:')
+            for name, page in pages.items():
+                print(f'  {name:<36} p50 {page["p50"]:8.2f} ms  p95 {page["p95"]:8.2f} ms  p99 {page["p99"]:8.2f} ms  {page["rps"]:8.1f} req/s')
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        found = regressions(results, baseline, args.threshold, args.min_delta)
+        for scale, name, before, after in found:
+            print(f'{scale} {name}: p95 {before:.2f} ms -> {after:.2f} ms (more than x{args.threshold})')
+        if found:
+            sys.exit(1)
+        print(f'No regressions compared with {args.compare} (commit {baseline.get("commit")}).')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+# Cold start of the app: time of "import main" in a new python process (like a new gunicorn worker).
+# Exit code is 1 if the median time is above --budget seconds or if chart/seeding work is done at import
+# (matplotlib imported or database touched before the first request).
+# Run from the main folder: python -m benchmarks.startup [--budget 0.5], tests check the same (tests/test_startup.py).
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BUDGET = 0.5 # Maximum median import time (seconds)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # Main folder, main.py is imported from it
+
+# Code run in the new process, prints json with import time and loaded modules
+PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+import main
+print(json.dumps({"seconds": time.perf_counter() - start, "matplotlib": "matplotlib" in sys.modules}))
+'''
+
+# Import main in new processes runs times: (import times in seconds, matplotlib was imported, database was created)
+def measure_startup(runs):
+    times = []
+    matplotlib = False
+    with tempfile.TemporaryDirectory() as folder:
+        # Not existing database: import must not create or fill it
+        database = os.path.join(folder, 'startup.db')
+        env = dict(os.environ, SCHOOL_DATABASE=database)
+        for _ in range(runs):
+            output = subprocess.run([sys.executable, '-c', PROBE], env=env, cwd=ROOT, capture_output=True, text=True, check=True).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            times.append(result['seconds'])
+            matplotlib = matplotlib or result['matplotlib']
+        created = os.path.exists(database)
+    return times, matplotlib, created
+
+def main():
+    parser = argparse.ArgumentParser(description='Cold start time of the app')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=BUDGET, help='maximum median import time in seconds')
+    args = parser.parse_args()
+
+    failed = False
+    times, matplotlib, created = measure_startup(args.runs)
+    if matplotlib:
+        print('matplotlib is imported at startup')
+        failed = True
+    if created:
+        print('database is created at import, it should be done by "flask --app main init-db"')
+        failed = True
+
+    median = statistics.median(times)
+    print(f'import main: median {median * 1000:.0f} ms, min {min(times) * 1000:.0f} ms, max {max(times) * 1000:.0f} ms (budget {args.budget * 1000:.0f} ms)')
+    if median > args.budget:
+        failed = True
+    if failed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
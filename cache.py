@@ -0,0 +1,138 @@
+import threading
+import hashlib
+import time
+from collections import OrderedDict
+
+# Least recently used cache limited by number of entries and by size of values in bytes.
+# It can be shared by request threads, every operation is done under one lock.
+class LRUCache():
+
+    def __init__(self, max_entries=1024, max_bytes=None):
+        self.max_entries = max_entries # Maximum number of values
+        self.max_bytes = max_bytes # Maximum size of all values (None = no limit)
+        self.size = 0 # Current size of all values in bytes
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict() # key: (value, size), the most recently used at the end
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, _ = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, size=0):
+        with self._lock:
+            return self._put(key, value, size)
+
+    def _put(self, key, value, size):
+        # Value bigger than the whole cache is not saved
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+        self._remove(key)
+        self._data[key] = (value, size)
+        self.size += size
+        # Remove the least recently used values until limits are kept
+        while len(self._data) > self.max_entries or (self.max_bytes is not None and self.size > self.max_bytes):
+            self._remove(next(iter(self._data)))
+        return True
+
+    def invalidate(self, key):
+        with self._lock:
+            return self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.size = 0
+
+    def _remove(self, key):
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return False
+        self.size -= entry[1]
+        return True
+
+    def __len__(self):
+        return len(self._data)
+
+    def hit_rate(self):
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+# LRU cache in which every value is valid only for ttl seconds after it was saved,
+# so values changed outside of this process (other workers) are read again after some time.
+class TTLCache(LRUCache):
+
+    def __init__(self, max_entries=1024, ttl=60, clock=time.monotonic):
+        super().__init__(max_entries)
+        self.ttl = ttl # Seconds after which value is read again
+        self.clock = clock
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0][0] <= self.clock(): # Missing or expired
+                self._remove(key)
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0][1]
+
+    def put(self, key, value, size=0):
+        return super().put(key, (self.clock() + self.ttl, value), size)
+
+# Cache of rendered charts. Key is (kind, scope, version), e.g. ('student', 24, version) or ('class', (1, 5), version),
+# version is made from the data drawn on chart (data_version), so chart with changed data is never taken from cache.
+class ChartCache(LRUCache):
+
+    def __init__(self, max_entries=512, max_bytes=64 * 1024 * 1024):
+        super().__init__(max_entries, max_bytes)
+        self._versions = {} # (kind, scope): version saved in cache, only for charts which are in cache
+
+    def get_chart(self, kind, scope, version):
+        return self.get((kind, scope, version))
+
+    def put_chart(self, kind, scope, version, chart):
+        with self._lock:
+            # Only the newest version of chart for each scope is kept
+            old_version = self._versions.get((kind, scope))
+            if old_version is not None and old_version != version:
+                self._remove((kind, scope, old_version))
+            if not self._put((kind, scope, version), chart, len(chart)):
+                return False
+            self._versions[(kind, scope)] = version
+            return True
+
+    def invalidate_chart(self, kind, scope):
+        # Called after new grades for this scope are saved
+        with self._lock:
+            version = self._versions.get((kind, scope))
+            if version is not None:
+                self._remove((kind, scope, version))
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._versions.clear()
+            self.size = 0
+
+    # Version of the scope is forgotten with its chart (also when the chart is removed by LRU limits)
+    def _remove(self, key):
+        if not super()._remove(key):
+            return False
+        kind, scope, version = key
+        if self._versions.get((kind, scope)) == version:
+            del self._versions[(kind, scope)]
+        return True
+
+# Short text which is the same only for the same data (used as version of cached chart)
+def data_version(*data):
+    return hashlib.sha1(repr(data).encode('utf-8')).hexdigest()[:16]
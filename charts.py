@@ -0,0 +1,159 @@
+from io import BytesIO
+from html import escape
+
+# Drawing charts for dashboards. There are 2 backends (chosen by CHART_BACKEND in main.py):
+# - svg: bar charts written directly as SVG text, fast and small, without matplotlib
+# - matplotlib: PNG images drawn by matplotlib (the first version of charts)
+# Every backend draws the same 2 charts: student_chart and class_chart.
+
+# Base class of backends, image is returned as bytes
+class ChartBackend():
+    name = None
+    extension = None # Extension in chart links (.png/.svg)
+    mimetype = None
+
+    # Chart on student dashboard: average grade from every subject
+    def student_chart(self, subject_list, avg_grade):
+        raise NotImplementedError
+
+    # Chart on teacher dashboard: average grade of every student in class from teacher's subject
+    def class_chart(self, class_name, student_names, avg_grades):
+        raise NotImplementedError
+
+# Every chart is a separate Figure with its own Agg canvas, pyplot (global figure shared by all threads)
+# is not used, so requests can draw at the same time and the figure is freed as soon as the image is saved.
+# matplotlib is imported when the first chart is drawn, not when the app starts.
+class MatplotlibBackend(ChartBackend):
+    name = 'matplotlib'
+    extension = 'png'
+    mimetype = 'image/png'
+
+    # New empty figure (size in inches, 100 pixels per inch)
+    def new_figure(self, figsize):
+        from matplotlib.figure import Figure
+        return Figure(figsize=figsize)
+
+    # Save the figure as PNG and free it, returns bytes of image
+    def render_png(self, figure):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        FigureCanvasAgg(figure)
+        buffer = BytesIO()
+        try:
+            figure.savefig(buffer, format='png')
+            return buffer.getvalue()
+        finally:
+            figure.clear()
+            buffer.close()
+
+    def student_chart(self, subject_list, avg_grade):
+        figure = self.new_figure((15, 5))
+        ax = figure.subplots()
+        ax.barh(subject_list, avg_grade, color='skyblue', edgecolor='black')
+        ax.set_title('Average Grades per Subject')
+        ax.set_xlabel('Average Grade')
+        ax.set_ylabel('Subjects')
+        for index, value in enumerate(avg_grade):
+            ax.text(value + 0.1, index, f'{value:.2f}', ha='center', fontsize=10)
+        return self.render_png(figure)
+
+    def class_chart(self, class_name, student_names, avg_grades):
+        figure = self.new_figure((15, 10))
+        ax = figure.subplots()
+        bars = ax.bar(student_names, avg_grades, color='skyblue', width=0.5, edgecolor='black')
+        ax.set_xticks([])
+        ax.set_title(f"Grades Bar Chart - class {class_name}", fontsize=16, weight='bold')
+        ax.set_xlabel("Students")
+        ax.set_ylabel("Average Grades")
+        ax.set_ylim(0, 6.49)
+        for bar, grade, student_name in zip(bars, avg_grades, student_names):
+            ax.text(bar.get_x() + bar.get_width() / 2 - 0.1, bar.get_height() + 0.1, f'{grade:.2f}',
+                    ha='center', color='black')
+            # Add student name on the bar
+            ax.text(bar.get_x() + bar.get_width() / 2, 0.09, f'{student_name}', ha='center', color='black',
+                    rotation=90, fontsize=10)
+        return self.render_png(figure)
+
+# Bar charts written as SVG elements, sizes in pixels are the same as matplotlib figures (100 dpi)
+class SvgBackend(ChartBackend):
+    name = 'svg'
+    extension = 'svg'
+    mimetype = 'image/svg+xml'
+    font = 'font-family="DejaVu Sans, Arial, sans-serif"'
+
+    def document(self, width, height, elements):
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+                f'viewBox="0 0 {width} {height}" {self.font} font-size="12">'
+                f'<rect width="{width}" height="{height}" fill="white"/>'
+                + ''.join(elements) + '</svg>').encode('utf-8')
+
+    def text(self, x, y, value, anchor='middle', size=12, weight=None, rotate=False):
+        weight = f' font-weight="{weight}"' if weight else ''
+        position = f'transform="translate({x:.1f},{y:.1f}) rotate(-90)"' if rotate else f'x="{x:.1f}" y="{y:.1f}"'
+        return f'<text {position} text-anchor="{anchor}" font-size="{size}"{weight}>{escape(str(value))}</text>'
+
+    def bar(self, x, y, width, height):
+        return (f'<rect x="{x:.1f}" y="{y:.1f}" width="{width:.1f}" height="{height:.1f}" '
+                f'fill="skyblue" stroke="black"/>')
+
+    def frame(self, left, top, width, height):
+        return f'<rect x="{left}" y="{top}" width="{width}" height="{height}" fill="none" stroke="black"/>'
+
+    def student_chart(self, subject_list, avg_grade):
+        width, height = 1500, 500
+        # Space on the left for names of subjects
+        left = 60 + 7 * max((len(subject) for subject in subject_list), default=0)
+        top, right, bottom = 40, 40, 55
+        plot_width, plot_height = width - left - right, height - top - bottom
+        max_value = max(6, int(max(avg_grade, default=0) + 1))
+        scale = plot_width / max_value
+        elements = [self.frame(left, top, plot_width, plot_height)]
+        # Axis x with a tick for every grade
+        for tick in range(max_value + 1):
+            x = left + tick * scale
+            elements.append(f'<line x1="{x:.1f}" y1="{top + plot_height}" x2="{x:.1f}" y2="{top + plot_height + 5}" stroke="black"/>')
+            elements.append(self.text(x, top + plot_height + 18, tick))
+        # One bar for every subject, the first subject at the bottom (like barh)
+        band = plot_height / max(len(subject_list), 1)
+        for index, (subject, value) in enumerate(zip(subject_list, avg_grade)):
+            center = top + plot_height - (index + 0.5) * band
+            elements.append(self.bar(left, center - 0.4 * band, value * scale, 0.8 * band))
+            elements.append(self.text(left - 8, center + 4, subject, anchor='end'))
+            elements.append(self.text(left + value * scale + 0.1 * scale, center + 4, f'{value:.2f}', size=10))
+        elements.append(self.text(left + plot_width / 2, top - 12, 'Average Grades per Subject', size=14))
+        elements.append(self.text(left + plot_width / 2, height - 12, 'Average Grade'))
+        elements.append(self.text(16, top + plot_height / 2, 'Subjects', rotate=True))
+        return self.document(width, height, elements)
+
+    def class_chart(self, class_name, student_names, avg_grades):
+        width, height = 1500, 1000
+        left, top, right, bottom = 70, 60, 40, 50
+        plot_width, plot_height = width - left - right, height - top - bottom
+        max_value = 6.49
+        scale = plot_height / max_value
+        base = top + plot_height
+        elements = [self.frame(left, top, plot_width, plot_height)]
+        # Axis y with a tick for every grade
+        for tick in range(7):
+            y = base - tick * scale
+            elements.append(f'<line x1="{left - 5}" y1="{y:.1f}" x2="{left}" y2="{y:.1f}" stroke="black"/>')
+            elements.append(self.text(left - 8, y + 4, tick, anchor='end'))
+        # One bar for every student with average above and name on the bar
+        band = plot_width / max(len(student_names), 1)
+        for index, (student_name, grade) in enumerate(zip(student_names, avg_grades)):
+            center = left + (index + 0.5) * band
+            bar_height = min(grade, max_value) * scale
+            elements.append(self.bar(center - 0.25 * band, base - bar_height, 0.5 * band, bar_height))
+            elements.append(self.text(center, base - bar_height - 0.1 * scale, f'{grade:.2f}'))
+            elements.append(self.text(center + 4, base - 0.09 * scale, student_name, anchor='start', size=10, rotate=True))
+        elements.append(self.text(left + plot_width / 2, top - 20, f'Grades Bar Chart - class {class_name}', size=16, weight='bold'))
+        elements.append(self.text(left + plot_width / 2, height - 15, 'Students'))
+        elements.append(self.text(18, top + plot_height / 2, 'Average Grades', rotate=True))
+        return self.document(width, height, elements)
+
+BACKENDS = {backend.name: backend for backend in (SvgBackend, MatplotlibBackend)}
+
+# Backend chosen by name (CHART_BACKEND)
+def get_backend(name):
+    if name not in BACKENDS:
+        raise ValueError(f'Unknown chart backend {name!r}, use one of: {", ".join(BACKENDS)}.')
+    return BACKENDS[name]()
@@ -0,0 +1,67 @@
+import json
+from collections import namedtuple
+from rankings import OVERALL, recalculate_rankings, school_rank_sql
+
+# Data of student dashboard read with one SQL statement (common table expressions), instead of one query
+# for every number on the page. Lists (subjects, latest grade) are returned as JSON (json_group_array) in the same row.
+# Only rows of the student and his class are read: number of students in school is kept by triggers (student_count),
+# CROSS JOIN makes SQLite read students of the class first (not the selected subject of the whole school).
+
+# subjects: [(id, name)] sorted by name, latest_grade: (value, subject name, teacher name) or None,
+# subject_* fields are None if no subject is selected
+StudentDashboard = namedtuple('StudentDashboard', [
+    'class_id', 'class_name', 'class_profile', 'num_students', 'num_school_students', 'subjects', 'latest_grade',
+    'total_average', 'class_rank', 'school_rank', 'subject_average', 'class_subject_average', 'subject_rank'])
+
+STUDENT_DASHBOARD_QUERY = f'''
+    WITH me AS (SELECT id, class_id FROM student WHERE id = :student_id),
+    totals AS (SELECT TOTAL(weighted_sum) AS weighted_sum, TOTAL(total_weight) AS total_weight
+               FROM grade_aggregate WHERE student_id = :student_id),
+    subject_totals AS (SELECT TOTAL(weighted_sum) AS weighted_sum, TOTAL(total_weight) AS total_weight
+                       FROM grade_aggregate WHERE student_id = :student_id AND subject_id = :subject_id),
+    class_subject_totals AS (SELECT TOTAL(ga.weighted_sum) AS weighted_sum, TOTAL(ga.total_weight) AS total_weight
+                             FROM student s
+                             CROSS JOIN grade_aggregate ga ON ga.student_id = s.id AND ga.subject_id = :subject_id
+                             WHERE s.class_id = (SELECT class_id FROM me)),
+    subjects AS (SELECT s.id, s.name
+                 FROM subject s
+                 JOIN teacher_class tc ON s.id = tc.subject_id
+                 WHERE tc.class_id = (SELECT class_id FROM me))
+    SELECT c.id, c.name, c.profile,
+           (SELECT COUNT(*) FROM student WHERE class_id = me.class_id),
+           (SELECT students FROM student_count WHERE id = 1),
+           (SELECT json_group_array(json_array(id, name)) FROM subjects),
+           (SELECT json_array(g.value, s.name, u.first_name || ' ' || u.second_name)
+            FROM grade g
+            JOIN subject s ON g.subject_id = s.id
+            JOIN teacher_class tc ON tc.subject_id = s.id AND tc.class_id = me.class_id
+            JOIN user u ON tc.teacher_id = u.id
+            JOIN teacher t ON t.id = u.id
+            WHERE g.student_id = me.id
+            ORDER BY g.id DESC LIMIT 1),
+           (SELECT CASE WHEN total_weight > 0 THEN weighted_sum / total_weight ELSE 0 END FROM totals),
+           r.class_rank, CASE WHEN r.student_id IS NOT NULL THEN {school_rank_sql('r')} END,
+           (SELECT CASE WHEN total_weight > 0 THEN weighted_sum / total_weight ELSE 0 END
+            FROM subject_totals WHERE :subject_id IS NOT NULL),
+           (SELECT CASE WHEN total_weight > 0 THEN weighted_sum / total_weight ELSE 0 END
+            FROM class_subject_totals WHERE :subject_id IS NOT NULL),
+           (SELECT class_rank FROM student_ranking WHERE student_id = me.id AND subject_id = :subject_id),
+           (SELECT class_id FROM ranking_dirty WHERE class_id = me.class_id)
+    FROM me
+    LEFT JOIN class c ON c.id = me.class_id
+    LEFT JOIN student_ranking r ON r.student_id = me.id AND r.subject_id = {OVERALL}'''
+
+# All data of the dashboard of one student (subject_id: subject selected on the page or None),
+# None if the student doesn't exist. Usually one query, if grades of his class changed: query, refresh of rankings
+# of his class (one transaction) and query again. Changes in other classes don't make his page slower.
+def student_dashboard_data(conn, student_id, subject_id=None):
+    params = {'student_id': student_id, 'subject_id': subject_id}
+    row = conn.execute(STUDENT_DASHBOARD_QUERY, params).fetchone()
+    if row is not None and row[-1] is not None: # Rankings of his class are not up to date
+        recalculate_rankings(conn, row[-1])
+        row = conn.execute(STUDENT_DASHBOARD_QUERY, params).fetchone()
+    if row is None:
+        return None
+    subjects = sorted((tuple(subject) for subject in json.loads(row[5])), key=lambda subject: subject[1])
+    latest_grade = tuple(json.loads(row[6])) if row[6] is not None else None
+    return StudentDashboard(*row[:5], subjects, latest_grade, *row[7:-1])
@@ -0,0 +1,139 @@
+import sqlite3
+import queue
+import pathlib
+import threading
+from contextlib import contextmanager
+from flask import g, current_app
+
+# Settings (PRAGMA) applied to every new connection, profile is chosen by environment.
+# WAL journal lets students and teachers read while a teacher saves grades, busy_timeout (ms) makes
+# writers wait for the lock instead of failing with "database is locked".
+DATABASE_PROFILES = {
+    'dev': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -16000, # negative number is size in KiB (16 MB)
+        'busy_timeout': 5000,
+    },
+    'prod': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -64000, # 64 MB
+        'mmap_size': 268435456, # 256 MB
+        'temp_store': 'MEMORY',
+        'busy_timeout': 10000,
+    },
+    'bench': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -256000, # 256 MB, whole benchmark database stays in memory
+        'mmap_size': 1073741824, # 1 GB
+        'temp_store': 'MEMORY',
+        'busy_timeout': 30000,
+    },
+}
+
+# Raised when every connection of the pool is checked out for longer than the timeout
+class PoolTimeout(Exception):
+    pass
+
+# This is class to share a bounded number of SQLite connections between request threads.
+# Every request borrows one connection (and its own cursor), so dashboards don't wait on one global cursor.
+class ConnectionPool():
+
+    def __init__(self, database, max_size=8, timeout=30, pragmas=None, factory=None):
+        self.database = database # Path to the database file
+        self.factory = factory or sqlite3.Connection # Class of connections, e.g. with metrics (metrics.py)
+        self.pragmas = pragmas or {} # Settings applied to every new connection (DATABASE_PROFILES)
+        self.max_size = max_size # Maximum number of opened connections
+        self.timeout = timeout # How long (seconds) request waits for a free connection
+        self._idle = queue.LifoQueue() # Opened connections which are not used right now
+        self._slots = threading.BoundedSemaphore(max_size) # One slot for every connection (idle or used)
+
+    def connect(self):
+        # Open new connection, it can be used by other thread after returning it to the pool
+        conn = sqlite3.connect(self.database, check_same_thread=False, factory=self.factory)
+        apply_pragmas(conn, self.pragmas)
+        return conn
+
+    def connect_readonly(self):
+        # Own read-only connection (not counted in the pool) for long reads, e.g. streamed exports:
+        # a slow client keeps only this connection busy, pages still get connections from the pool.
+        # journal_mode is left as it is (read-only connection can't change it)
+        uri = pathlib.Path(self.database).absolute().as_uri() + '?mode=ro'
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False, factory=self.factory)
+        apply_pragmas(conn, {name: value for name, value in self.pragmas.items() if name != 'journal_mode'})
+        return conn
+
+    def acquire(self):
+        # Wait for a free slot, then reuse idle connection or open new one
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolTimeout(f'No free database connection after {self.timeout} seconds.')
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            try:
+                return self.connect()
+            except Exception:
+                self._slots.release()
+                raise
+
+    def release(self, conn):
+        # Never give back connection with not finished transaction
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+        except sqlite3.Error:
+            conn.close() # Broken connection, next acquire will open new one
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        # Connection for code outside of requests (startup, command line)
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self):
+        # Close all idle connections
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+# Set PRAGMA values on the connection (journal_mode first, it must be set outside of transaction)
+def apply_pragmas(conn, pragmas):
+    for name, value in pragmas.items():
+        conn.execute(f'PRAGMA {name} = {value}')
+
+# Connect the pool with flask app, the connection is returned when app context ends
+def init_app(app, factory=None):
+    profile = app.config.get('DATABASE_PROFILE', 'dev')
+    if profile not in DATABASE_PROFILES:
+        raise ValueError(f'Unknown database profile {profile!r}, use one of: {", ".join(DATABASE_PROFILES)}.')
+    app.extensions['db_pool'] = ConnectionPool(app.config['DATABASE'],
+                                               max_size=app.config.get('DATABASE_POOL_SIZE', 8),
+                                               timeout=app.config.get('DATABASE_POOL_TIMEOUT', 30),
+                                               pragmas=DATABASE_PROFILES[profile],
+                                               factory=factory)
+    app.teardown_appcontext(close_db)
+    return app.extensions['db_pool']
+
+def get_pool():
+    return current_app.extensions['db_pool']
+
+# Connection of the current request (checked out on first use)
+def get_db():
+    if 'db' not in g:
+        g.db = get_pool().acquire()
+    return g.db
+
+def close_db(exception=None):
+    conn = g.pop('db', None)
+    if conn is not None:
+        get_pool().release(conn)
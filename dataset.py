@@ -0,0 +1,144 @@
+import random
+from contextlib import contextmanager
+from werkzeug.security import generate_password_hash
+
+# Synthetic school of any size for scale tests and benchmarks (flask --app main generate-dataset).
+# Rows are generated lazily and written with executemany in batches, in one transaction,
+# with journal in memory and without fsync during the load (relaxed_journal).
+
+# Sizes of generated school: number of classes, students in class, teachers, grades of every student
+SCALES = {
+    'small': {'classes': 15, 'students_per_class': 20, 'teachers': 20, 'grades_per_student': 20},
+    '10k': {'classes': 400, 'students_per_class': 25, 'teachers': 400, 'grades_per_student': 30},
+    '100k': {'classes': 4000, 'students_per_class': 25, 'teachers': 4000, 'grades_per_student': 30},
+    '1m': {'classes': 40000, 'students_per_class': 25, 'teachers': 40000, 'grades_per_student': 20},
+}
+
+SUBJECTS = ['Mathematics', 'Polish', 'English', 'German', 'French', 'Physics', 'Chemistry', 'Biology',
+            'Geography', 'History', 'Civics', 'Informatics', 'Physical Education', 'Music', 'Art',
+            'Philosophy', 'Economics', 'Latin', 'Religion', 'Ethics']
+PROFILES = ['Information Technology', 'Medical', 'Humanities', 'Mathematics and Physics', 'Languages', 'General']
+FIRST_NAMES = ['Anna', 'Adam', 'Barbara', 'Bartosz', 'Celina', 'Dawid', 'Ewa', 'Filip', 'Gabriela', 'Hubert',
+               'Irena', 'Jakub', 'Karolina', 'Leon', 'Maria', 'Norbert', 'Olga', 'Piotr', 'Roksana', 'Szymon',
+               'Tamara', 'Urszula', 'Wiktor', 'Zofia']
+SECOND_NAMES = ['Nowak', 'Kowalski', 'Wisniewski', 'Wojcik', 'Kowalczyk', 'Kaminski', 'Lewandowski', 'Zielinski',
+                'Szymanski', 'Wozniak', 'Dabrowski', 'Kozlowski', 'Jankowski', 'Mazur', 'Kwiatkowski', 'Krawczyk',
+                'Piotrowski', 'Grabowski', 'Pawlowski', 'Michalski']
+
+# Grade values and weights with their frequency: most grades are 3-5, most weights are small (activity, short tests)
+GRADE_VALUES = ([1, 2, 3, 4, 5, 6], [4, 10, 25, 32, 22, 7])
+GRADE_WEIGHTS = ([0.1, 0.2, 0.3, 0.5, 0.7, 1.0], [10, 25, 25, 20, 10, 10])
+
+# Size of school from scale (SCALES) with chosen values changed, e.g. school_size('10k', grades_per_student=5)
+def school_size(scale='small', **sizes):
+    size = dict(SCALES[scale])
+    size.update({name: value for name, value in sizes.items() if value is not None})
+    return size
+
+# Faster load: journal in memory and no waiting for the disk, settings are restored after the load.
+# Database file can be broken if the computer stops during the load, so it is only for generated data.
+@contextmanager
+def relaxed_journal(conn):
+    journal_mode = conn.execute('PRAGMA journal_mode').fetchone()[0]
+    synchronous = conn.execute('PRAGMA synchronous').fetchone()[0]
+    conn.execute('PRAGMA journal_mode = MEMORY')
+    conn.execute('PRAGMA synchronous = OFF')
+    try:
+        yield conn
+    finally:
+        conn.execute(f'PRAGMA journal_mode = {journal_mode}')
+        conn.execute(f'PRAGMA synchronous = {synchronous}')
+
+# Write rows from iterable in batches, returns number of rows
+def insert_rows(cursor, sql, rows, batch_size):
+    count = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            cursor.executemany(sql, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        cursor.executemany(sql, batch)
+        count += len(batch)
+    return count
+
+def class_name(number):
+    return f'{number // 26 + 1}{chr(ord("A") + number % 26)}'
+
+# Generate school in empty database (tables from DatabaseOperations.generate_database and migrations).
+# Every generated user has the same password, id 1 is admin (admin@admin.uw.edu.pl).
+# Returns number of written rows for every table.
+def generate_dataset(conn, classes, students_per_class, teachers, grades_per_student, subjects=len(SUBJECTS),
+                     password='password', seed=0, batch_size=10000):
+    if conn.execute('SELECT COUNT(*) FROM user').fetchone()[0]:
+        raise ValueError('Database is not empty, generate dataset in a new database file.')
+    if teachers < subjects:
+        raise ValueError(f'At least one teacher for every subject is needed ({subjects}).')
+    rand = random.Random(seed)
+    password_hash = generate_password_hash(password, method='pbkdf2:sha256') # one hash for all users
+    students = classes * students_per_class
+    first_teacher = 2
+    first_student = first_teacher + teachers
+
+    def name():
+        return rand.choice(FIRST_NAMES), rand.choice(SECOND_NAMES)
+
+    def users():
+        yield (1, 'admin@admin.uw.edu.pl', 'Admin', 'Admin', password_hash, 'admin')
+        for user_id in range(first_teacher, first_student + students):
+            first_name, second_name = name()
+            if user_id < first_student:
+                email = f'{first_name[0]}{second_name}{user_id}@uw.edu.pl'.lower()
+                yield (user_id, email, first_name, second_name, password_hash, 'teacher')
+            else:
+                email = f'{first_name[0]}{second_name}{user_id}@student.uw.edu.pl'.lower()
+                yield (user_id, email, first_name, second_name, password_hash, 'student')
+
+    # Teacher i teaches subject i % subjects, classes of every subject are shared by its teachers in turn
+    teacher_subject = {teacher_id: (teacher_id - first_teacher) % subjects + 1 for teacher_id in range(first_teacher, first_student)}
+    subject_teachers = {}
+    for teacher_id, subject_id in teacher_subject.items():
+        subject_teachers.setdefault(subject_id, []).append(teacher_id)
+    class_teacher = {(class_id, subject_id): teachers_of_subject[class_id % len(teachers_of_subject)]
+                     for subject_id, teachers_of_subject in subject_teachers.items()
+                     for class_id in range(1, classes + 1)}
+
+    def grades():
+        values, value_weights = GRADE_VALUES
+        weights, weight_weights = GRADE_WEIGHTS
+        for index in range(students):
+            student_id = first_student + index
+            class_id = index // students_per_class + 1
+            # Grades of one student sorted by subject, aggregates of one (student, subject) are updated one after another
+            for subject_id in sorted(rand.choices(range(1, subjects + 1), k=grades_per_student)):
+                yield (rand.choices(values, value_weights)[0], rand.choices(weights, weight_weights)[0],
+                       subject_id, student_id, class_teacher[(class_id, subject_id)])
+
+    counts = {}
+    cursor = conn.cursor()
+    with relaxed_journal(conn):
+        cursor.execute('BEGIN')
+        try:
+            counts['subject'] = insert_rows(cursor, 'INSERT INTO subject (id, name) VALUES (?, ?)',
+                                            ((i, SUBJECTS[i - 1] if i <= len(SUBJECTS) else f'Subject {i}') for i in range(1, subjects + 1)), batch_size)
+            counts['class'] = insert_rows(cursor, 'INSERT INTO class (id, name, profile) VALUES (?, ?, ?)',
+                                          ((i, class_name(i - 1), rand.choice(PROFILES)) for i in range(1, classes + 1)), batch_size)
+            counts['user'] = insert_rows(cursor, 'INSERT INTO user (id, email, first_name, second_name, password, role) VALUES (?, ?, ?, ?, ?, ?)',
+                                         users(), batch_size)
+            counts['teacher'] = insert_rows(cursor, 'INSERT INTO teacher (id, subject_id) VALUES (?, ?)',
+                                            teacher_subject.items(), batch_size)
+            counts['student'] = insert_rows(cursor, 'INSERT INTO student (id, class_id) VALUES (?, ?)',
+                                            ((first_student + i, i // students_per_class + 1) for i in range(students)), batch_size)
+            counts['teacher_class'] = insert_rows(cursor, 'INSERT INTO teacher_class (teacher_id, class_id, subject_id) VALUES (?, ?, ?)',
+                                                  ((teacher_id, class_id, subject_id) for (class_id, subject_id), teacher_id in sorted(class_teacher.items())), batch_size)
+            counts['grade'] = insert_rows(cursor, 'INSERT INTO grade (value, weight, subject_id, student_id, teacher_id) VALUES (?, ?, ?, ?, ?)',
+                                          grades(), batch_size)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+    return counts
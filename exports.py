@@ -0,0 +1,59 @@
+import csv
+import json
+from admin_tables import quote
+
+# Export of tables to CSV or NDJSON (one JSON object in every line).
+# Rows are read in batches (fetchmany) and sent one by one, so exporting the whole grade table
+# doesn't keep it in memory.
+
+# Exports: table or view and exported columns (password hashes are never exported)
+EXPORTS = {
+    'grades': ('grade', ['id', 'value', 'weight', 'subject_id', 'student_id', 'teacher_id']),
+    'users': ('user', ['id', 'email', 'first_name', 'second_name', 'role']),
+    'assigns': ('teacher_class', ['id', 'teacher_id', 'class_id', 'subject_id']),
+    'grades_view': ('vw_grades', ['ID', 'Value', 'Weight', 'ID: Student', 'ID: Teacher']),
+}
+
+FORMATS = {'csv': 'text/csv', 'ndjson': 'application/x-ndjson'}
+
+# Rows of the export, read from database in batches
+def export_rows(conn, name, batch_size=1000):
+    table, columns = EXPORTS[name]
+    cursor = conn.cursor()
+    cursor.arraysize = batch_size
+    try:
+        cursor.execute(f'SELECT {", ".join(quote(column) for column in columns)} FROM {table} ORDER BY 1')
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            yield from rows
+    finally:
+        cursor.close()
+
+# csv.writer writes to this object, the written line is returned instead of saved
+class LineBuffer():
+    def write(self, line):
+        return line
+
+# Lines of the export in chosen format (csv/ndjson), the first csv line is header
+def export_lines(conn, name, output_format='csv', batch_size=1000):
+    columns = EXPORTS[name][1]
+    rows = export_rows(conn, name, batch_size)
+    if output_format == 'csv':
+        writer = csv.writer(LineBuffer())
+        yield writer.writerow(columns)
+        for row in rows:
+            yield writer.writerow(row)
+    elif output_format == 'ndjson':
+        for row in rows:
+            yield json.dumps(dict(zip(columns, row))) + '\n'
+    else:
+        raise ValueError(f'Unknown export format {output_format!r}, use one of: {", ".join(FORMATS)}.')
+
+# Lines of the download, its own connection is closed when the download ends or the client disconnects
+def stream_export(conn, name, output_format='csv', batch_size=1000):
+    try:
+        yield from export_lines(conn, name, output_format, batch_size)
+    finally:
+        conn.close()
@@ -0,0 +1,79 @@
+# Statistics of grades calculated from the number of every grade value (1-6), not from the list of grades.
+# Numbers come from grade_aggregate (count_1 ... count_6, kept up to date by triggers), so statistics of a class
+# or of the whole school cost the same as statistics of one student: 6 numbers are read and checked.
+
+GRADE_VALUES = (1, 2, 3, 4, 5, 6)
+
+class GradeStats():
+
+    def __init__(self, counts, weighted_sum=0.0, total_weight=0.0):
+        self.counts = tuple(int(count) for count in counts) # Number of grades 1, 2, ..., 6
+        self.weighted_sum = weighted_sum # Sum of value * weight
+        self.total_weight = total_weight # Sum of weights
+        self.count = sum(self.counts)
+
+    # Number of every grade value: {1: count, ..., 6: count}
+    def histogram(self):
+        return dict(zip(GRADE_VALUES, self.counts))
+
+    def mean(self):
+        if not self.count:
+            return None
+        return sum(value * count for value, count in zip(GRADE_VALUES, self.counts)) / self.count
+
+    def weighted_mean(self):
+        if not self.total_weight:
+            return None
+        return self.weighted_sum / self.total_weight
+
+    # Grade at position index (from 0) in the sorted list of grades
+    def value_at(self, index):
+        for value, count in zip(GRADE_VALUES, self.counts):
+            if index < count:
+                return value
+            index -= count
+        raise IndexError('Grade index out of range.')
+
+    # The same result as statistics.median: middle grade, or average of the two middle grades if count is even
+    def median(self):
+        if not self.count:
+            return None
+        middle = self.count // 2
+        if self.count % 2:
+            return self.value_at(middle)
+        return (self.value_at(middle - 1) + self.value_at(middle)) / 2
+
+    # The most frequent grades (all of them if more grades are equally frequent, like statistics.multimode), lowest first
+    def modes(self):
+        if not self.count:
+            return []
+        return [value for value, count in zip(GRADE_VALUES, self.counts) if count == max(self.counts)]
+
+    # Percentile 0-100 with linear interpolation between neighbouring grades (like numpy.percentile)
+    def percentile(self, percent):
+        if not self.count:
+            return None
+        if not 0 <= percent <= 100:
+            raise ValueError('Percentile must be between 0 and 100.')
+        position = (self.count - 1) * percent / 100
+        lower = int(position)
+        lower_value = self.value_at(lower)
+        if lower == position:
+            return lower_value
+        return lower_value + (self.value_at(lower + 1) - lower_value) * (position - lower)
+
+# Sums of grade_aggregate rows of students chosen by condition on grade_aggregate ga and student s
+def aggregate_stats(conn, condition='1', params=()):
+    row = conn.execute(f'''SELECT TOTAL(ga.count_1), TOTAL(ga.count_2), TOTAL(ga.count_3),
+                                  TOTAL(ga.count_4), TOTAL(ga.count_5), TOTAL(ga.count_6),
+                                  TOTAL(ga.weighted_sum), TOTAL(ga.total_weight)
+                           FROM grade_aggregate ga
+                           JOIN student s ON ga.student_id = s.id
+                           WHERE {condition}''', params).fetchone()
+    return GradeStats(row[:6], row[6], row[7])
+
+# Grades of one class, from one subject or from all subjects (subject_id None)
+def class_stats(conn, class_id, subject_id=None):
+    if subject_id is None:
+        return aggregate_stats(conn, 's.class_id = ?', (class_id,))
+    return aggregate_stats(conn, 's.class_id = ? AND ga.subject_id = ?', (class_id, subject_id))
@@ -0,0 +1,142 @@
+import csv
+import sqlite3
+from collections import namedtuple
+
+# Checking and saving grades: enter grades page and import of grades from CSV file.
+
+# Wrong grade or weight, message is shown to the teacher
+class GradeError(ValueError):
+    pass
+
+# Weight must be a number between 0 (exclusive) and 1 (inclusive)
+def parse_weight(weight):
+    try:
+        weight = float(weight)
+    except (TypeError, ValueError):
+        raise GradeError('Invalid weight. Must be a numeric value.')
+    if not (0 < weight <= 1):
+        raise GradeError('Invalid weight. Must be between 0 (exclusive) and 1 (inclusive).')
+    return weight
+
+# Grade must be an integer between 1 and 6
+def parse_grade(value):
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise GradeError('Invalid grade. Must be an integer value.')
+    if not (1 <= value <= 6):
+        raise GradeError('Invalid grade. Must be an integer between 1 and 6 (inclusive).')
+    return value
+
+# Students of the class in the order shown on enter grades page: (id, first name, second name)
+def class_roster(conn, class_id):
+    return conn.execute('''SELECT u.id, u.first_name, u.second_name FROM user u
+                           LEFT JOIN student s ON s.id = u.id
+                           WHERE u.role = 'student' AND s.class_id = ?''', (class_id,)).fetchall()
+
+# Saved grades: number of rows, subject of the teacher, students and classes which got grades
+WriteResult = namedtuple('WriteResult', ['inserted', 'subject_id', 'student_ids', 'class_ids'])
+
+# Saving grades of one teacher. Grades are inserted with executemany in one transaction (BEGIN IMMEDIATE),
+# the number of inserted rows is checked before commit. Hooks hook(conn, result) are called in the same
+# transaction before commit, e.g. to update derived data or caches (grade_aggregate and ranking_dirty
+# are updated by triggers of grade table, migrations.py).
+class GradeWriter():
+    INSERT = 'INSERT INTO grade(value, weight, subject_id, student_id, teacher_id) VALUES (?, ?, ?, ?, ?)'
+
+    def __init__(self, conn, teacher_id, batch_size=1000):
+        teacher = conn.execute('SELECT id, subject_id FROM teacher WHERE id = ?', (teacher_id,)).fetchone()
+        if teacher is None:
+            raise GradeError('Teacher does not exist.')
+        self.conn = conn
+        self.teacher_id = teacher[0]
+        self.subject_id = teacher[1]
+        self.batch_size = batch_size
+        self.hooks = []
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+        return hook
+
+    # Classes taught by the teacher
+    def class_ids(self):
+        return {class_id for (class_id,) in self.conn.execute('SELECT class_id FROM teacher_class WHERE teacher_id = ?', (self.teacher_id,))}
+
+    # Save checked grades: iterable of (student id, class id, value, weight), read in batches
+    def write(self, grades):
+        inserted = 0
+        student_ids = set()
+        class_ids = set()
+        cursor = self.conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            batch = []
+            for student_id, class_id, value, weight in grades:
+                batch.append((value, weight, self.subject_id, student_id, self.teacher_id))
+                student_ids.add(student_id)
+                class_ids.add(class_id)
+                if len(batch) >= self.batch_size:
+                    inserted += self._insert(cursor, batch)
+                    batch = []
+            if batch:
+                inserted += self._insert(cursor, batch)
+            result = WriteResult(inserted, self.subject_id, student_ids, class_ids)
+            for hook in self.hooks:
+                hook(self.conn, result)
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+        return result
+
+    def _insert(self, cursor, batch):
+        cursor.executemany(self.INSERT, batch)
+        if cursor.rowcount != len(batch): # Every grade must be saved, if not nothing is saved
+            raise sqlite3.DatabaseError(f'Only {cursor.rowcount} of {len(batch)} grades were saved.')
+        return len(batch)
+
+    # Grades from enter grades page: values in the order of class roster ('' = no grade), one weight for all
+    def write_class(self, class_id, values, weight):
+        if class_id not in self.class_ids():
+            raise GradeError('You don\'t teach this class.')
+        weight = parse_weight(weight)
+        grades = [(student[0], class_id, parse_grade(value), weight)
+                  for student, value in zip(class_roster(self.conn, class_id), values) if value != '']
+        return self.write(grades)
+
+# Result of import: number of saved grades, wrong rows [(line, message)], students and classes which got grades
+ImportResult = namedtuple('ImportResult', ['inserted', 'errors', 'student_ids', 'class_ids'])
+
+IMPORT_COLUMNS = ('email', 'value', 'weight')
+
+# Import grades from CSV lines with columns email, value, weight (header in the first line) with GradeWriter.
+# Students are taken from classes taught by the teacher, wrong rows are reported and skipped,
+# all correct rows are saved in one transaction (the file is read line by line).
+def import_grades_csv(writer, lines):
+    # All students which can get grades from this teacher: email -> (student id, class id)
+    students = {email.lower(): (student_id, class_id) for email, student_id, class_id in writer.conn.execute('''
+                SELECT u.email, s.id, s.class_id FROM user u
+                JOIN student s ON s.id = u.id
+                WHERE s.class_id IN (SELECT class_id FROM teacher_class WHERE teacher_id = ?)''', (writer.teacher_id,))}
+
+    reader = csv.DictReader(lines)
+    missing = [column for column in IMPORT_COLUMNS if column not in (reader.fieldnames or [])]
+    if missing:
+        raise GradeError(f'Missing columns in file: {", ".join(missing)}.')
+
+    errors = []
+    def grades():
+        for row in reader:
+            try:
+                email = (row['email'] or '').strip().lower()
+                if email not in students:
+                    raise GradeError(f'Student {email} does not exist or is not in your class.')
+                student_id, class_id = students[email]
+                yield student_id, class_id, parse_grade(row['value']), parse_weight(row['weight'])
+            except GradeError as error:
+                errors.append((reader.line_num, str(error)))
+
+    result = writer.write(grades())
+    return ImportResult(result.inserted, errors, result.student_ids, result.class_ids)
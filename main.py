@@ -1,15 +1,26 @@
-import sqlite3
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import base64
-from io import BytesIO
-from flask import Flask, render_template, request, flash, redirect, url_for, session
+import os
+import io
+import hmac
+import time
+import csv
+import click
+from flask import Flask, render_template, request, flash, redirect, url_for, session, abort, make_response, jsonify, Response
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
-from werkzeug.security import generate_password_hash, check_password_hash 
 from models import DatabaseOperations
+import database
+from cache import ChartCache, TTLCache, data_version
+import charts
+import metrics
+from admin_tables import TABLES, table_page
+from exports import EXPORTS, FORMATS, export_lines, stream_export
+from snapshots import create_snapshot, restore_snapshot
+from dataset import SCALES, school_size, generate_dataset
+from passwords import PasswordPool, PasswordPoolBusy
+from dashboard import student_dashboard_data
+from rankings import refresh_rankings
+from grade_stats import class_stats
+from grades import GradeError, GradeWriter, class_roster, import_grades_csv
 from datetime import datetime, timedelta, timezone
-from statistics import median, mode
 
 # Substring function to check that provided email is correct for each role in Adding New User page.
 def mid(string, dotmail):
@@ -22,6 +33,20 @@ def check_word(word):
 # Creating the flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'MiszkielMocio'
+app.config['DATABASE'] = os.environ.get('SCHOOL_DATABASE', 'school_database.db') # Path to the database file
+app.config['DATABASE_PROFILE'] = os.environ.get('SCHOOL_DATABASE_PROFILE', 'dev') # SQLite settings: dev, prod or bench (database.py)
+app.config['DATABASE_POOL_SIZE'] = int(os.environ.get('SCHOOL_DATABASE_POOL_SIZE', 8)) # Maximum number of opened connections
+app.config['EXPORT_BATCH_SIZE'] = int(os.environ.get('SCHOOL_EXPORT_BATCH_SIZE', 1000)) # Rows read at once by exports
+app.config['CHART_BACKEND'] = os.environ.get('SCHOOL_CHART_BACKEND', 'svg') # Drawing of charts: svg or matplotlib (charts.py)
+app.config['CHART_CACHE_ENTRIES'] = int(os.environ.get('SCHOOL_CHART_CACHE_ENTRIES', 512)) # Maximum number of cached charts
+app.config['CHART_CACHE_BYTES'] = int(os.environ.get('SCHOOL_CHART_CACHE_BYTES', 64 * 1024 * 1024)) # Maximum size of cached charts
+app.config['USER_CACHE_ENTRIES'] = int(os.environ.get('SCHOOL_USER_CACHE_ENTRIES', 10000)) # Maximum number of logged users kept in memory
+app.config['USER_CACHE_TTL'] = float(os.environ.get('SCHOOL_USER_CACHE_TTL', 60)) # Seconds after which user is read from database again
+app.config['PASSWORD_HASH_METHOD'] = os.environ.get('SCHOOL_PASSWORD_HASH_METHOD', 'pbkdf2:sha256') # Method of new hashes, old hashes are changed at login
+app.config['PASSWORD_WORKERS'] = int(os.environ.get('SCHOOL_PASSWORD_WORKERS', os.cpu_count() or 1)) # Processes which check passwords
+app.config['PASSWORD_QUEUE'] = int(os.environ.get('SCHOOL_PASSWORD_QUEUE', 32)) # Logins waiting for a process, next get 503
+app.config['METRICS'] = bool(int(os.environ.get('SCHOOL_METRICS', 1))) # Time of pages, SQL, charts and caches shown at /metrics
+app.config['METRICS_TOKEN'] = os.environ.get('SCHOOL_METRICS_TOKEN') # Token of Prometheus (Authorization: Bearer <token>), without it only admin reads /metrics
 
 # Automatic logout after 5 minutes of no activity
 timeout_duration = timedelta(minutes=5)
@@ -38,29 +63,150 @@ def is_session_expired():
         return datetime.now(timezone.utc) - last_activity_utc > timeout_duration
     return False
 
+# Backend drawing charts for dashboards and rendered charts (limited by number of charts and size in bytes)
+chart_backend = charts.get_backend(app.config['CHART_BACKEND'])
+chart_cache = ChartCache(max_entries=app.config['CHART_CACHE_ENTRIES'], max_bytes=app.config['CHART_CACHE_BYTES'])
+# Logged users (load_user), one database query less on every page
+user_cache = TTLCache(max_entries=app.config['USER_CACHE_ENTRIES'], ttl=app.config['USER_CACHE_TTL'])
+# Processes which hash and check passwords of logging users (passwords.py)
+password_pool = PasswordPool(method=app.config['PASSWORD_HASH_METHOD'], workers=app.config['PASSWORD_WORKERS'], max_queue=app.config['PASSWORD_QUEUE'])
+
 login_manager = LoginManager()
 login_manager.init_app(app)
 
-# Make a connection with database and create cursor 
-conn = sqlite3.connect("school_database.db", check_same_thread=False)
-cursor = conn.cursor()
-
-# Connection with class in models.py to do specific operations
-operation = DatabaseOperations(cursor, conn)
-operation.generate_database() # if not exist, create database
-operation.add_data() # if tables empty add dataset, uncomment data in models.py and comment empty data lists above data
+# Pool of connections with database, every request takes its own connection (database.get_db)
+# With metrics connections count SQL statements and their time (metrics.py)
+if app.config['METRICS']:
+    metrics.init_app(app)
+    metrics.watch_cache('chart', chart_cache)
+    metrics.watch_cache('user', user_cache)
+pool = database.init_app(app, factory=metrics.InstrumentedConnection if app.config['METRICS'] else None)
+
+# Create tables, apply migrations and add data. It's not done when the app is imported (every worker and test would wait for it),
+# run it once after deployment: flask --app main init-db (python main.py does it before starting the app)
+def init_db():
+    # Connection with class in models.py to do specific operations
+    with pool.connection() as conn:
+        operation = DatabaseOperations(conn.cursor(), conn)
+        operation.generate_database() # if not exist, create database
+        operation.migrate() # add indexes and other schema changes which are not in database yet
+        operation.add_data() # if tables empty add dataset, uncomment data in models.py and comment empty data lists above data
+        refresh_rankings(conn) # Rankings of seeded classes are ready before the first dashboard
+
+@app.cli.command('init-db')
+def init_db_command():
+    init_db()
+    click.echo('Database is ready.')
+
+# Rankings of the whole school calculated again at once with NumPy (analytics.py): flask --app main rebuild-rankings
+@app.cli.command('rebuild-rankings')
+def rebuild_rankings_command():
+    from analytics import rebuild_rankings # numpy is loaded only by commands which need it
+    start = time.perf_counter()
+    with pool.connection() as conn:
+        analytics = rebuild_rankings(conn)
+    click.echo(f'Rankings of {len(analytics.student_keys)} students and subjects written in {time.perf_counter() - start:.2f} s.')
+
+# Copy of the database for tests and dev environments: flask --app main snapshot-db fixtures/school.db
+@app.cli.command('snapshot-db')
+@click.argument('path')
+def snapshot_db_command(path):
+    with pool.connection() as conn:
+        try:
+            create_snapshot(conn, path)
+        except FileExistsError as error:
+            raise click.ClickException(str(error))
+    click.echo(f'Snapshot saved to {path}.')
+
+# Database from snapshot (instead of init-db with seeding): flask --app main restore-db fixtures/school.db
+@app.cli.command('restore-db')
+@click.argument('path', default=os.path.join('fixtures', 'school.db'))
+def restore_db_command(path):
+    pool.close() # Connections to the old database file
+    try:
+        restore_snapshot(path, app.config['DATABASE'])
+    except FileNotFoundError as error:
+        raise click.ClickException(str(error))
+    with pool.connection() as conn:
+        DatabaseOperations(conn.cursor(), conn).migrate() # Snapshot could be made before the latest migrations
+    click.echo(f'Database {app.config["DATABASE"]} restored from {path}.')
+
+# Synthetic school for scale tests, in a new database file:
+# SCHOOL_DATABASE=school_10k.db flask --app main generate-dataset --scale 10k
+@app.cli.command('generate-dataset')
+@click.option('--scale', type=click.Choice(list(SCALES)), default='small', help='size of school, options below change it')
+@click.option('--classes', type=click.IntRange(1), help='number of classes')
+@click.option('--students-per-class', type=click.IntRange(1), help='number of students in every class')
+@click.option('--teachers', type=click.IntRange(1), help='number of teachers')
+@click.option('--grades-per-student', type=click.IntRange(0), help='number of grades of every student')
+@click.option('--password', default='password', help='password of every generated user')
+@click.option('--seed', type=int, default=0, help='seed of random generator (the same seed gives the same school)')
+def generate_dataset_command(scale, classes, students_per_class, teachers, grades_per_student, password, seed):
+    from analytics import rebuild_rankings # numpy is loaded only by commands which need it
+    size = school_size(scale, classes=classes, students_per_class=students_per_class,
+                       teachers=teachers, grades_per_student=grades_per_student)
+    start = time.perf_counter()
+    with pool.connection() as conn:
+        operation = DatabaseOperations(conn.cursor(), conn)
+        operation.generate_database()
+        operation.migrate()
+        try:
+            counts = generate_dataset(conn, password=password, seed=seed, **size)
+        except ValueError as error:
+            raise click.ClickException(str(error))
+        rebuild_rankings(conn) # Rankings of all classes are ready before the first dashboard
+    for table, count in counts.items():
+        click.echo(f'{table}: {count} rows')
+    click.echo(f'Dataset generated in {time.perf_counter() - start:.1f} s.')
+
+# Import from command line: flask --app main import-grades grades.csv --teacher jkowalski@uw.edu.pl
+@app.cli.command('import-grades')
+@click.argument('file', type=click.File('r', encoding='utf-8-sig'))
+@click.option('--teacher', required=True, help='email of teacher who gives the grades')
+def import_grades_command(file, teacher):
+    with pool.connection() as conn:
+        teacher_row = conn.execute("SELECT id FROM user WHERE email = ? AND role = 'teacher'", (teacher,)).fetchone()
+        if teacher_row is None:
+            raise click.ClickException(f'Teacher {teacher} does not exist.')
+        try:
+            result = import_grades_csv(GradeWriter(conn, teacher_row[0]), file)
+        except GradeError as error:
+            raise click.ClickException(str(error))
+    for line, message in result.errors:
+        click.echo(f'Line {line}: {message}', err=True)
+    click.echo(f'Grades added: {result.inserted}, wrong lines: {len(result.errors)}.')
+
+# Export from command line: flask --app main export grades --format csv --output grades.csv
+@app.cli.command('export')
+@click.argument('name', type=click.Choice(list(EXPORTS)))
+@click.option('--format', 'output_format', type=click.Choice(list(FORMATS)), default='csv')
+@click.option('--output', type=click.File('w', encoding='utf-8'), default='-', help='file (default: standard output)')
+def export_command(name, output_format, output):
+    with pool.connection() as conn:
+        for line in export_lines(conn, name, output_format, app.config['EXPORT_BATCH_SIZE']):
+            output.write(line)
 
 # Loading active user to python memory
 class User(UserMixin):
     pass
 @login_manager.user_loader
 def load_user(user_id):
+    try:
+        user_id = int(user_id)
+    except (TypeError, ValueError):
+        return None
+    # User is taken from the database only if it's not in cache (user_cache) or it's older than USER_CACHE_TTL
+    user = user_cache.get(user_id)
+    if user is not None:
+        return user
     user = User()
+    cursor = database.get_db().cursor()
     try:
-        (user.id, user.email, user.first_name, user.second_name, user.password, user.role) = cursor.execute(f"""
-        SELECT id, email, first_name, second_name, password, role FROM user WHERE id='{user_id}'""").fetchone()
+        (user.id, user.email, user.first_name, user.second_name, user.password, user.role) = cursor.execute("""
+        SELECT id, email, first_name, second_name, password, role FROM user WHERE id = ?""", (user_id,)).fetchone()
     except TypeError:
-        user = None
+        return None
+    user_cache.put(user_id, user)
     return user
 
 # Basic link to the local host opens welcome page
@@ -78,133 +224,42 @@ def student_dashboard():
             return redirect(url_for('logout'))
         
         update_last_activity()  # The latest page refresh
+        conn = database.get_db() # Connection of this request from the pool
+
+        # Handle the selected subject from the form
+        selected_subject_id = request.form.get('selected_subject') if request.method == 'POST' else None
+        try:
+            subject_id = int(selected_subject_id) if selected_subject_id else None
+        except ValueError:
+            subject_id = None
 
-        # Get information about the class to which the student is assigned
-        class_info = cursor.execute(f'''SELECT c.id, c.name, c.profile
-                                        FROM class c
-                                        JOIN student s ON c.id = s.class_id
-                                        WHERE s.id = {current_user.id}''').fetchone()
-
-        # Get the number of students in the class
-        num_students = cursor.execute(f'SELECT COUNT(*) FROM student WHERE class_id = {class_info[0]}').fetchone()[0]
-
-        # Get the subjects to which the student is enrolled
-        subjects = cursor.execute(f'''SELECT s.id, s.name
-                                      FROM subject s
-                                      JOIN teacher_class tc ON s.id = tc.subject_id
-                                      JOIN student st ON st.class_id = tc.class_id
-                                      WHERE st.id = {current_user.id}''').fetchall()
-
-        # Sort subjects alphabetically
-        subjects = sorted(subjects, key=lambda x: x[1])
-
-        # Get the information about the student's latest grade
-        latest_grade_info = cursor.execute(f'''SELECT g.value, s.name AS subject_name, 
-                                                  (u.first_name || ' ' || u.second_name) AS teacher_name
-                                               FROM grade g
-                                               JOIN subject s ON g.subject_id = s.id
-                                               JOIN teacher_class tc ON tc.subject_id = s.id 
-                                               AND tc.class_id = (SELECT class_id FROM student WHERE id = {current_user.id})
-                                               JOIN teacher t ON tc.teacher_id = t.id
-                                               JOIN user u ON t.id = u.id
-                                               WHERE g.student_id = {current_user.id}
-                                               ORDER BY g.id DESC''').fetchone()
-
-        # Get the grades of the student with weights
-        grades = cursor.execute(f'''SELECT CAST(g.value AS INTEGER), g.weight
-                                    FROM grade g
-                                    WHERE g.student_id = {current_user.id}''').fetchall()
-
-        # Calculate the weighted average of the student
-        weighted_sum = sum(grade[0] * grade[1] for grade in grades)
-        total_weight = sum(grade[1] for grade in grades)
-        total_average = weighted_sum / total_weight if total_weight > 0 else 0
-
-        # Get the class average grade list
-        class_avg_list = cursor.execute(f'''SELECT s.id, 
-                                                SUM(CAST(g.value AS INTEGER) * g.weight) / SUM(g.weight) AS avg_grade
-                                            FROM student s
-                                            JOIN grade g ON s.id = g.student_id
-                                            WHERE s.class_id = {class_info[0]}
-                                            GROUP BY s.id
-                                            ORDER BY avg_grade DESC''').fetchall()
-
-        # Find the position of the logged-in student in the list
-        student_rank = next((i + 1 for i, (student_id, _) in enumerate(class_avg_list) if student_id == current_user.id), None)
-
-        # DATA FOR CHART
-        # Get student's grades from all subjects
-        student_grades = cursor.execute(f'''SELECT s.name AS subject, 
-                                              SUM(CAST(g.value AS INTEGER) * g.weight) / SUM(g.weight) AS avg_grade
-                                           FROM grade g
-                                           JOIN subject s ON g.subject_id = s.id
-                                           WHERE g.student_id = {current_user.id}
-                                           GROUP BY s.id
-                                           ORDER BY avg_grade ASC''').fetchall()
-
-        # Get the names of subjects and average grades
-        subject_list = [student_grade[0] for student_grade in student_grades]
-        avg_grade = [float(student_grade[1]) for student_grade in student_grades]
-
-        # Clear the current plot before creating a new one
-        plt.clf()
-
-        # CREATING A PLOT
-        plt.figure(figsize=(15, 5))
-        plt.barh(subject_list, avg_grade, color='skyblue', edgecolor='black')
-        plt.title('Average Grades per Subject')
-        plt.xlabel('Average Grade')
-        plt.ylabel('Subjects')
-        for index, value in enumerate(avg_grade):
-            plt.text(value + 0.1, index, f'{value:.2f}', ha='center', fontsize=10)
-
-        # Save the plot as an image in base64 format
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png')
-        buffer.seek(0)
-        plot_data_s = base64.b64encode(buffer.read()).decode('utf-8')
+        # All data of the dashboard in one query: class, subjects, latest grade, averages and rankings (dashboard.py)
+        data = student_dashboard_data(conn, current_user.id, subject_id)
+
+        # Chart is loaded by browser from separate link (student_chart_image), the page doesn't wait for it.
+        # Student without grades has no ranking and nothing to draw
+        chart_url = None
+        if data.class_rank is not None:
+            chart_url = url_for('student_chart_image', student_id=current_user.id, ext=chart_backend.extension)
 
         # SELECTED SUBJECT SECTION
-        selected_subject = None
-        selected_subject_id = None
+        selected_subject = next((subject for subject in data.subjects if subject[0] == subject_id), None)
         subject_average = None
         class_subject_avg = None
-
-        if request.method == 'POST':
-            # Handle the selected subject from the form
-            selected_subject_id = request.form.get('selected_subject')
-            selected_subject = next((subject for subject in subjects if subject[0] == int(selected_subject_id)), None)
-
-            # Get grades from the selected subject and calculate the average
-            selected_subject_grades = cursor.execute(f'''SELECT CAST(g.value AS INTEGER), g.weight
-                                                         FROM grade g
-                                                         WHERE g.student_id = {current_user.id}
-                                                         AND g.subject_id = {selected_subject_id}''').fetchall()
-
-            # Calculate the weighted average from the selected subject
-            weighted_sum_subject = sum(grade[0] * grade[1] for grade in selected_subject_grades)
-            total_weight_subject = sum(grade[1] for grade in selected_subject_grades)
-            subject_average = weighted_sum_subject / total_weight_subject if total_weight_subject > 0 else 0
-
-            # Get grades of students from the selected subject in the class
-            class_subject_grades = cursor.execute(f'''SELECT CAST(g.value AS INTEGER), g.weight
-                                                      FROM grade g
-                                                      JOIN student s ON g.student_id = s.id
-                                                      WHERE s.class_id = {class_info[0]}
-                                                      AND g.subject_id = {selected_subject[0]}''').fetchall()
-
-            # Calculate the average grades of students from the selected subject in the class
-            class_subject_weighted_sum = sum(grade[0] * grade[1] for grade in class_subject_grades)
-            class_subject_total_weight = sum(grade[1] for grade in class_subject_grades)
-            class_subject_avg = class_subject_weighted_sum / class_subject_total_weight if class_subject_total_weight > 0 else 0
+        subject_rank = None
+        if selected_subject:
+            subject_average = data.subject_average
+            class_subject_avg = data.class_subject_average
+            subject_rank = data.subject_rank
 
         # Pass the results to the template
-        return render_template("student_dashboard.html", user=current_user, num_students=num_students,
-                               subjects=subjects, selected_subject_id=selected_subject_id,
-                               selected_subject=selected_subject, latest_grade_info=latest_grade_info,
-                               class_name=class_info[1], class_profile=class_info[2], total_average=total_average,
-                               subject_average=subject_average, student_rank=student_rank,
-                               class_subject_avg=class_subject_avg,plot_data_s=plot_data_s)
+        return render_template("student_dashboard.html", user=current_user, num_students=data.num_students,
+                               subjects=data.subjects, selected_subject_id=selected_subject_id,
+                               selected_subject=selected_subject, latest_grade_info=data.latest_grade,
+                               class_name=data.class_name, class_profile=data.class_profile, total_average=data.total_average,
+                               subject_average=subject_average, student_rank=data.class_rank,
+                               school_rank=data.school_rank, num_school_students=data.num_school_students, subject_rank=subject_rank,
+                               class_subject_avg=class_subject_avg, chart_url=chart_url)
     elif current_user.role == 'teacher':
         return redirect(url_for('teacher_dashboard'))
     elif current_user.role == 'admin':
@@ -222,6 +277,8 @@ def teacher_dashboard():
             return redirect(url_for('logout'))
         
         update_last_activity()  # The latest page refresh
+        conn = database.get_db() # Connection of this request from the pool
+        cursor = conn.cursor()
 
         # Get information about the subject that the teacher teaches
         teacher_info = cursor.execute(f'''SELECT subject.id, subject.name
@@ -243,32 +300,25 @@ def teacher_dashboard():
         selected_class_id = None
         class_average = None
         class_median = None
-        class_mode = None
+        class_modes = None
         students_in_class = None
         highest_avg_student = None
         lowest_avg_student = None
+        chart_url = None
 
         if request.method == 'POST':
             # Handle the selected class from the form
             selected_class_id = request.form.get('selected_class')
             selected_class = next((class_taught for class_taught in classes_taught if class_taught[0] == int(selected_class_id)), None)
 
-            # Get grades for the selected class
-            class_grades = cursor.execute(f'''SELECT CAST(g.value AS INTEGER), g.weight
-                                              FROM grade g
-                                              JOIN student s ON g.student_id = s.id
-                                              WHERE s.class_id = {selected_class[0]}''').fetchall()
-
+            # Statistics of grades for the selected class, from the number of every grade value (grade_stats.py)
+            stats = class_stats(conn, selected_class[0])
             # Calculate the average grades for the class
-            weighted_sum_class = sum(grade[0] * grade[1] for grade in class_grades)
-            total_weight_class = sum(grade[1] for grade in class_grades)
-            class_average = weighted_sum_class / total_weight_class if total_weight_class > 0 else 0
-
-            class_grades_values = [grade[0] for grade in class_grades]
+            class_average = stats.weighted_mean() or 0
             # Calculate the median grades for the class
-            class_median = median(class_grades_values)
-            # Calculate the mode grades for the class
-            class_mode = mode(class_grades_values)
+            class_median = stats.median()
+            # Calculate the mode grades for the class (all grades which are equally the most frequent)
+            class_modes = stats.modes()
 
             # Get the list of students in the selected class
             students_in_class = cursor.execute(f'''SELECT u.id, u.first_name, u.second_name
@@ -279,54 +329,27 @@ def teacher_dashboard():
 
             # Query for students ranking based on average grades
             students_rank = cursor.execute(f'''SELECT u.id, u.first_name, u.second_name, 
-                                                  SUM(CAST(g.value AS INTEGER) * g.weight) / SUM(g.weight) AS avg_grade
+                                                  ga.weighted_sum / ga.total_weight AS avg_grade
                                                FROM user u
                                                JOIN student s ON u.id = s.id
-                                               LEFT JOIN grade g ON g.student_id = s.id
-                                               WHERE s.class_id = {selected_class[0]} AND g.subject_id = {teacher_info[0]}
-                                               GROUP BY u.id
+                                               JOIN grade_aggregate ga ON ga.student_id = s.id
+                                               WHERE s.class_id = {selected_class[0]} AND ga.subject_id = {teacher_info[0]}
+                                               AND ga.grade_count > 0
                                                ORDER BY avg_grade DESC''').fetchall()
 
             if students_rank:
                 highest_avg_student = students_rank[0]
                 lowest_avg_student = students_rank[-1]
 
-                # Get the names of students
-                student_names = [f"{student[1]} {student[2]}" for student in students_rank]
-
-                # Transform grades to float type
-                avg_grades = [float(student[3]) for student in students_rank]
-
-                # Clear the current plot before creating a new one
-                plt.clf()
-
-                # CREATING A PLOT
-                plt.figure(figsize=(15, 10))
-                bars = plt.bar(student_names, avg_grades, color='skyblue', width=0.5, edgecolor='black')
-                plt.xticks([])
-                plt.title(f"Grades Bar Chart - class {selected_class[1]}", fontsize=16, weight='bold')
-                plt.xlabel("Students")
-                plt.ylabel("Average Grades")
-                plt.ylim(0, 6.49)
-                
-                for bar, grade, student_name in zip(bars, avg_grades, student_names):
-                    plt.text(bar.get_x() + bar.get_width() / 2 - 0.1, bar.get_height() + 0.1, f'{grade:.2f}',
-                             ha='center', color='black')
-                    # Add student name on the bar
-                    plt.text(bar.get_x() + bar.get_width() / 2, 0.09, f'{student_name}', ha='center', color='black',
-                             rotation=90, fontsize=10)
-
-                # Save the plot as an image in base64 format
-                buffer = BytesIO()
-                plt.savefig(buffer, format='png')
-                buffer.seek(0)
-                plot_data_t = base64.b64encode(buffer.read()).decode('utf-8')
+                # Chart is loaded by browser from separate link (class_chart_image)
+                chart_url = url_for('class_chart_image', class_id=selected_class[0], subject_id=teacher_info[0],
+                                    ext=chart_backend.extension)
 
             return render_template("teacher_dashboard.html", user=current_user, subject_name=teacher_info[1],
                                    classes_taught=classes_taught, selected_class_id=selected_class_id,
                                    selected_class=selected_class, class_average=class_average,
-                                   class_median=class_median, class_mode=class_mode,
-                                   students_in_class=students_in_class, plot_data_t=plot_data_t,
+                                   class_median=class_median, class_modes=class_modes,
+                                   students_in_class=students_in_class, chart_url=chart_url,
                                    highest_avg_student=highest_avg_student, lowest_avg_student=lowest_avg_student)
         else:
             return render_template("teacher_dashboard.html", user=current_user, subject_name=teacher_info[1],
@@ -345,14 +368,8 @@ def admin_panel():
         if is_session_expired():
             return redirect(url_for('logout'))
         update_last_activity() # The latest page refresh
-        operation.create_views() # Refreshing the views every time the admin panel is opened
-        # Taking all from views
-        vuser = cursor.execute('SELECT * FROM vw_users').fetchall()
-        vsubject = cursor.execute('SELECT * FROM vw_subjects').fetchall()
-        vclass = cursor.execute('SELECT * FROM vw_classes').fetchall()
-        vgrade = cursor.execute('SELECT * FROM vw_grades').fetchall()
-        vassign = cursor.execute('SELECT * FROM vw_assigns').fetchall()
-        return render_template("admin_panel.html", user = current_user, vuser = vuser, vsubject = vsubject, vclass = vclass, vgrade = vgrade, vassign = vassign)
+        # Rows of tables are loaded by DataTables page by page (admin_panel_data)
+        return render_template("admin_panel.html", user = current_user)
     
     elif current_user.role == 'student':
         return redirect(url_for('student_dashboard'))
@@ -361,16 +378,62 @@ def admin_panel():
     elif not current_user.is_authenticated:
         return redirect(url_for('welcome'))
 
+# One page of table on admin panel (DataTables server-side processing, admin_tables.py)
+@app.route('/admin_panel/data/<table>')
+@login_required
+def admin_panel_data(table):
+    if current_user.role != 'admin' or is_session_expired():
+        abort(403)
+    if table not in TABLES:
+        abort(404)
+    return jsonify(table_page(database.get_db(), table, request.args))
+
+# Download of the whole table (exports.py), rows are sent while they are read from database.
+# The download reads by its own read-only connection, not by a connection of the pool (slow client would keep it
+# until the end), request context is not kept, so the connection of this request goes back to the pool at once
+@app.route('/export/<name>.<output_format>')
+@login_required
+def export(name, output_format):
+    if current_user.role != 'admin' or is_session_expired():
+        abort(403)
+    if name not in EXPORTS or output_format not in FORMATS:
+        abort(404)
+    lines = stream_export(database.get_pool().connect_readonly(), name, output_format, app.config['EXPORT_BATCH_SIZE'])
+    response = Response(lines, mimetype=FORMATS[output_format])
+    response.headers['Content-Disposition'] = f'attachment; filename={name}.{output_format}'
+    return response
+
+# Check password from login page in the password pool (passwords.py), not on the request thread.
+# Hash made with old method is changed to the current one. Too many logins at once: 503 at once, user can try again.
+def check_login_password(user_data, password):
+    try:
+        if not password_pool.check(user_data[2], password or ''):
+            return False
+    except PasswordPoolBusy:
+        response = make_response('Too many users are logging in right now, try again in a moment.', 503)
+        response.headers['Retry-After'] = '2'
+        abort(response)
+    if password_pool.needs_rehash(user_data[2]):
+        try:
+            conn = database.get_db()
+            conn.execute('UPDATE user SET password = ? WHERE id = ?', (password_pool.hash(password), user_data[0]))
+            conn.commit()
+            user_cache.invalidate(user_data[0])
+        except PasswordPoolBusy:
+            pass # Hash will be changed at the next login
+    return True
+
 @app.route('/login_student', methods=['GET', 'POST'])
 def login_student():
     if request.method == 'POST': # After submiting entered values
+        cursor = database.get_db().cursor() # Connection of this request from the pool
         # Get email and password from page
         email = request.form.get('email')
         password = request.form.get('password')
         # check that user exists in database
         user_data = cursor.execute("SELECT id, email, password, role FROM user WHERE email = ?", (email,)).fetchone()
         if user_data: # If exists
-            if check_password_hash(user_data[2], password) and user_data[3] == 'student': # Check that password and role is correct
+            if user_data[3] == 'student' and check_login_password(user_data, password): # Check that role and password is correct
                 flash('Logged in successfully!', category='success')
                 # Login user to the journal
                 user = load_user(user_data[0])
@@ -389,13 +452,14 @@ def login_student():
 @app.route('/login_teacher', methods=['GET', 'POST'])
 def login_teacher():
     if request.method == 'POST': # After submiting entered values
+        cursor = database.get_db().cursor() # Connection of this request from the pool
         # Get email and password from page
         email = request.form.get('email')
         password = request.form.get('password')
         # check that user exists in database
         user_data = cursor.execute("SELECT id, email, password, role FROM user WHERE email = ?", (email,)).fetchone()
         if user_data: # If exists
-            if check_password_hash(user_data[2], password) and user_data[3] == 'teacher': # Check that password and role is correct
+            if user_data[3] == 'teacher' and check_login_password(user_data, password): # Check that role and password is correct
                 flash('Logged in successfully!', category='success')
                 # Login user to the journal
                 user = load_user(user_data[0])
@@ -413,13 +477,14 @@ def login_teacher():
 @app.route('/login_admin', methods=['GET', 'POST'])
 def login_admin():
     if request.method == 'POST': # After submiting entered values
+        cursor = database.get_db().cursor() # Connection of this request from the pool
         # Get email and password from page
         email = request.form.get('email')
         password = request.form.get('password')
         # check that user exists in database
         user_data = cursor.execute("SELECT id, email, password, role FROM user WHERE email = ?", (email,)).fetchone()
         if user_data: # If exists
-            if check_password_hash(user_data[2], password) and user_data[3] == 'admin': # Check that password and role is correct
+            if user_data[3] == 'admin' and check_login_password(user_data, password): # Check that role and password is correct
                 flash('Logged in successfully!', category='success')
                 # Login user to the journal
                 user = load_user(user_data[0])
@@ -460,6 +525,8 @@ def add_user():
         if is_session_expired():
             return redirect(url_for('logout'))
         update_last_activity() # The latest page refresh
+        conn = database.get_db() # Connection of this request from the pool
+        cursor = conn.cursor()
         # Get all subjects and classes
         subjects = cursor.execute("SELECT id, name FROM subject").fetchall()
         classes = cursor.execute("SELECT id, name, profile FROM class").fetchall()
@@ -498,14 +565,14 @@ def add_user():
                 if role == 'student': # If it's student, get selected class and add information to database
                     class_id = request.form.get('classes')
                     cursor.execute("INSERT INTO user(email, first_name, second_name, password, role) VALUES (?, ?, ?, ?, ?)",
-                                (email, firstname, secondname, generate_password_hash(password, method='pbkdf2:sha256'), role))
+                                (email, firstname, secondname, password_pool.hash(password), role))
                     # Get our student's ID and add information to second database
                     user_id = cursor.lastrowid
                     cursor.execute("INSERT INTO student(id, class_id) VALUES (?, ?)", (user_id, class_id))
                 elif role == 'teacher': # If it's teacher, get selected subject and add information to database
                     subject_id = request.form.get('subjects')
                     cursor.execute("INSERT INTO user(email, first_name, second_name, password, role) VALUES (?, ?, ?, ?, ?)",
-                                (email, firstname, secondname, generate_password_hash(password, method='pbkdf2:sha256'), role))
+                                (email, firstname, secondname, password_pool.hash(password), role))
                     # Get our teacher's ID and add information to second database
                     user_id = cursor.lastrowid
                     cursor.execute("INSERT INTO teacher(id, subject_id) VALUES (?, ?)", (user_id, subject_id))
@@ -513,6 +580,7 @@ def add_user():
                     flash('Invalid role', category='error')
                     return render_template("add_user.html", subjects=subjects, classes=classes)
                 conn.commit() # Save changes
+                user_cache.invalidate(user_id) # Old user with the same ID can't be taken from cache
                 flash('User added successfully.', category='success')
                 return redirect(url_for('add_user'))
             except Exception as e:
@@ -532,6 +600,8 @@ def assign_teacher_to_class():
         if is_session_expired():
             return redirect(url_for('logout'))
         update_last_activity() # The latest page refresh
+        conn = database.get_db() # Connection of this request from the pool
+        cursor = conn.cursor()
         # Get all subjects and classes
         subjects = cursor.execute("SELECT id, name FROM subject").fetchall()
         classes = cursor.execute("SELECT id, name, profile FROM class").fetchall()
@@ -584,6 +654,8 @@ def enter_grades():
         if is_session_expired():
             return redirect(url_for('logout'))
         update_last_activity() # The latest page refresh
+        conn = database.get_db() # Connection of this request from the pool
+        cursor = conn.cursor()
         # Get list of classes which logged teacher teach
         classes = cursor.execute(f'''SELECT c.id, c.name FROM teacher_class tc
                                      LEFT JOIN class c ON tc.class_id = c.id
@@ -593,49 +665,23 @@ def enter_grades():
             if action == 'update1': # First submit button (choose class page)
                 selected_class = request.form.get('selectedClass') # Selected class
                 # List of students in selected class
-                students = cursor.execute(f'''SELECT u.first_name, u.second_name FROM user u
-                                              LEFT JOIN student s ON s.id = u.id
-                                              WHERE u.role = 'student' AND s.class_id = {selected_class}''').fetchall()
+                students = [student[1:] for student in class_roster(conn, selected_class)]
                 return render_template('enter_grades_step2.html', selected_class=selected_class, students=students)
             elif action == 'update2': # Second submit button (enter grades page)
                 selected_class = request.form.get('selectedClass') # Selected class
                 weight = request.form.get('weight') # Selected weight
-                grades = request.form.getlist('grades') # List of grades
+                grades = request.form.getlist('grades') # List of grades (len(grades) = number of students in class)
+                if not (selected_class or '').isdigit():
+                    flash('Invalid class!', 'error')
+                    return redirect(url_for('enter_grades'))
                 try:
-                    weight = float(weight) # Check that value is numeric
-                    if not (0 < weight <= 1): # Check that value is between 0 and 1
-                        flash('Invalid weight. Must be between 0 (exclusive) and 1 (inclusive).', 'error')
-                        return redirect(url_for('enter_grades'))
-                except ValueError:
-                    flash('Invalid weight. Must be a numeric value.', 'error')
+                    # Grades are checked and saved in one transaction (grades.py)
+                    writer = GradeWriter(conn, current_user.id)
+                    writer.add_hook(invalidate_grade_charts)
+                    writer.write_class(int(selected_class), grades, weight)
+                except GradeError as error:
+                    flash(str(error), 'error')
                     return redirect(url_for('enter_grades'))
-                # All possibilities to enter grade (len(grades) = number of students in class)
-                for grade_value in grades:
-                    if grade_value: # If grade was entered
-                        try:
-                            grade_value = int(grade_value) # Check that value is an integer
-                            if not (1 <= grade_value <= 6): # Check that value is between 1 and 6
-                                flash('Invalid grade. Must be an integer between 1 and 6 (inclusive).', 'error')
-                                return redirect(url_for('enter_grades'))
-                        except ValueError:
-                            flash('Invalid grade. Must be an integer value.', 'error')
-                            return redirect(url_for('enter_grades'))
-                # Get information about logged teacher
-                teacher = cursor.execute(f'''SELECT * FROM teacher
-                                            WHERE id = {current_user.id}
-                                            ''').fetchone()
-                subject_id = teacher[1] # Teacher's subject
-                teacher_id = teacher[0] # Teacher's ID
-                # List of students in class
-                students = cursor.execute(f'''SELECT u.id FROM user u
-                                              LEFT JOIN student s ON s.id = u.id
-                                              WHERE u.role = 'student' AND s.class_id = {selected_class}''').fetchall()
-                # Data from table in page
-                for student, grade_value in zip(students, grades):
-                    if grade_value != '': # If grade was entered, add information to database
-                        cursor.execute("INSERT INTO grade(value, weight, subject_id, student_id, teacher_id) VALUES (?, ?, ?, ?, ?)", 
-                                       (grade_value, weight, subject_id, student[0], teacher_id))
-                conn.commit() # Save all changes
                 flash('Grades added!', 'success')
                 return redirect(url_for('enter_grades'))
             else:
@@ -649,6 +695,50 @@ def enter_grades():
     elif not current_user.is_authenticated:
         return redirect(url_for('welcome'))
 
+# Import of many grades from CSV file (columns: email, value, weight) for teacher's subject
+@app.route('/import_grades', methods=['GET', 'POST'])
+@login_required
+def import_grades():
+    if current_user.role == 'teacher':
+        if is_session_expired():
+            return redirect(url_for('logout'))
+        update_last_activity() # The latest page refresh
+        if request.method == 'POST': # If file submitted
+            file = request.files.get('file')
+            if not file or not file.filename:
+                flash('Choose CSV file with grades.', 'error')
+                return redirect(url_for('import_grades'))
+            # The file is read line by line, not loaded to memory at once
+            lines = io.TextIOWrapper(file.stream, encoding='utf-8-sig', newline='')
+            try:
+                writer = GradeWriter(database.get_db(), current_user.id)
+                writer.add_hook(invalidate_grade_charts)
+                result = import_grades_csv(writer, lines)
+            except (GradeError, UnicodeDecodeError, csv.Error) as error:
+                flash(f'Error: {str(error)}', 'error')
+                return redirect(url_for('import_grades'))
+            flash(f'Grades added: {result.inserted}.', 'success')
+            # Wrong rows are skipped, show the first of them
+            for line, message in result.errors[:20]:
+                flash(f'Line {line}: {message}', 'error')
+            if len(result.errors) > 20:
+                flash(f'... and {len(result.errors) - 20} more wrong lines.', 'error')
+            return redirect(url_for('import_grades'))
+        return render_template('import_grades.html')
+    elif current_user.role == 'student':
+        return redirect(url_for('student_dashboard'))
+    elif current_user.role == 'admin':
+        return redirect(url_for('admin_panel'))
+    elif not current_user.is_authenticated:
+        return redirect(url_for('welcome'))
+
+# Charts with new grades have to be drawn again (hook of GradeWriter, called before commit)
+def invalidate_grade_charts(conn, result):
+    for student_id in result.student_ids:
+        chart_cache.invalidate_chart('student', student_id)
+    for class_id in result.class_ids:
+        chart_cache.invalidate_chart('class', (class_id, result.subject_id))
+
 @app.route('/add_subject', methods=['GET', 'POST'])
 @login_required
 def add_subject():
@@ -656,7 +746,8 @@ def add_subject():
         if is_session_expired():
             return redirect(url_for('logout'))
         update_last_activity() # The latest page refresh
-        operation.create_views() # Refreshing the views every time the admin panel is opened
+        conn = database.get_db() # Connection of this request from the pool
+        cursor = conn.cursor()
         # Get all subjects from views
         vsubject = cursor.execute('SELECT * FROM vw_subjects').fetchall()
         if request.method == 'POST': # If values in page submitted
@@ -677,6 +768,99 @@ def add_subject():
                 return redirect(url_for('add_subject'))
         return render_template("add_subject.html", vsubject=vsubject)
     
+# Data for the chart on student dashboard: names of subjects and averages, the lowest average first
+def student_chart_data(cursor, student_id):
+    student_grades = cursor.execute('''SELECT s.name AS subject, 
+                                         ga.weighted_sum / ga.total_weight AS avg_grade
+                                      FROM grade_aggregate ga
+                                      JOIN subject s ON ga.subject_id = s.id
+                                      WHERE ga.student_id = ? AND ga.grade_count > 0
+                                      ORDER BY avg_grade ASC''', (student_id,)).fetchall()
+    subject_list = [student_grade[0] for student_grade in student_grades]
+    avg_grade = [float(student_grade[1]) for student_grade in student_grades]
+    return subject_list, avg_grade
+
+# Data for the chart on teacher dashboard: name of class, names of students and their averages from subject, the best first
+def class_chart_data(cursor, class_id, subject_id):
+    class_name = cursor.execute('SELECT name FROM class WHERE id = ?', (class_id,)).fetchone()[0]
+    students_rank = cursor.execute('''SELECT u.first_name, u.second_name, 
+                                        ga.weighted_sum / ga.total_weight AS avg_grade
+                                     FROM user u
+                                     JOIN student s ON u.id = s.id
+                                     JOIN grade_aggregate ga ON ga.student_id = s.id
+                                     WHERE s.class_id = ? AND ga.subject_id = ? AND ga.grade_count > 0
+                                     ORDER BY avg_grade DESC''', (class_id, subject_id)).fetchall()
+    student_names = [f"{student[0]} {student[1]}" for student in students_rank]
+    avg_grades = [float(student[2]) for student in students_rank]
+    return class_name, student_names, avg_grades
+
+# Response with chart image. ETag is the version of data on the chart, so browser asks again
+# every time (no-cache) but gets the image only when data changed (304 Not Modified otherwise).
+def chart_response(kind, scope, version, render):
+    response = make_response()
+    response.set_etag(version)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    if request.if_none_match.contains(version):
+        response.status_code = 304
+        return response
+    # Take the chart from cache if the data on it didn't change, if not draw it (chart_backend)
+    image = chart_cache.get_chart(kind, scope, version)
+    if image is None:
+        start = time.perf_counter()
+        image = render()
+        metrics.CHART_RENDER_SECONDS.observe(time.perf_counter() - start, kind, chart_backend.name)
+        chart_cache.put_chart(kind, scope, version, image)
+    response.set_data(image)
+    response.mimetype = chart_backend.mimetype
+    return response
+
+@app.route('/charts/student/<int:student_id>.<ext>')
+@login_required
+def student_chart_image(student_id, ext):
+    if ext != chart_backend.extension: # Only format of the chosen backend (png/svg)
+        abort(404)
+    # Only the student can see the chart from his dashboard
+    if current_user.role != 'student' or current_user.id != student_id or is_session_expired():
+        abort(403)
+    cursor = database.get_db().cursor() # Connection of this request from the pool
+    subject_list, avg_grade = student_chart_data(cursor, student_id)
+    return chart_response('student', student_id, data_version(chart_backend.name, subject_list, avg_grade),
+                          lambda: chart_backend.student_chart(subject_list, avg_grade))
+
+@app.route('/charts/class/<int:class_id>/subject/<int:subject_id>.<ext>')
+@login_required
+def class_chart_image(class_id, subject_id, ext):
+    if ext != chart_backend.extension: # Only format of the chosen backend (png/svg)
+        abort(404)
+    if current_user.role != 'teacher' or is_session_expired():
+        abort(403)
+    cursor = database.get_db().cursor() # Connection of this request from the pool
+    # Only the teacher who teaches this subject in this class can see the chart (like teacher dashboard)
+    teaches = cursor.execute('''SELECT 1 FROM teacher_class tc
+                                 JOIN teacher t ON t.id = tc.teacher_id
+                                 WHERE tc.teacher_id = ? AND tc.class_id = ? AND t.subject_id = ?''',
+                             (current_user.id, class_id, subject_id)).fetchone()
+    if not teaches:
+        abort(403)
+    class_name, student_names, avg_grades = class_chart_data(cursor, class_id, subject_id)
+    return chart_response('class', (class_id, subject_id), data_version(chart_backend.name, class_name, student_names, avg_grades),
+                          lambda: chart_backend.class_chart(class_name, student_names, avg_grades))
+
+# Metrics for Prometheus (metrics.py): time and SQL of every page, drawing of charts, caches.
+# Read by logged admin or with METRICS_TOKEN (Prometheus can't log in)
+@app.route('/metrics')
+def metrics_page():
+    if not app.config['METRICS']:
+        abort(404)
+    token = app.config['METRICS_TOKEN']
+    authorization = request.headers.get('Authorization', '')
+    if not (token and hmac.compare_digest(authorization.encode('utf-8'), f'Bearer {token}'.encode('utf-8'))):
+        if not current_user.is_authenticated or current_user.role != 'admin' or is_session_expired():
+            abort(403)
+    return Response(metrics.registry.render(), content_type=metrics.CONTENT_TYPE)
+
 # Run the app, debug = True for automate changing app when changes in code
 if __name__ == '__main__':
+    init_db()
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,321 @@
+import math
+import sqlite3
+import threading
+import time
+from bisect import bisect_left
+from flask import g, request
+
+# Metrics of the app in Prometheus text format (page /metrics): time of every page, SQL statements of every request,
+# time of drawing charts and hit rates of caches.
+# Every thread writes to its own dict (shard), so counting needs no lock. Shards are added together only when
+# /metrics is read. Shards of finished threads are merged into one dict, so numbers are not lost.
+# Nothing is counted until init_app is called (SCHOOL_METRICS=0: metrics and instrumented connections do nothing).
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Upper bounds of histogram buckets: seconds of a page, seconds of SQL in a page, SQL statements in a page
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SQL_SECONDS_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+STATEMENT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+class Registry():
+
+    def __init__(self):
+        self.metrics = [] # Metrics in order of registration
+        self._local = threading.local() # Shard of the current thread
+        self._shards = [] # (thread, shard) of every thread which wrote a value
+        self._finished = {} # Values of finished threads
+        self._cleanup_at = 64 # Number of shards after which finished threads are merged
+        self._lock = threading.Lock() # Only for adding and merging shards
+        self.enabled = False # Set by init_app, disabled metrics ignore values
+
+    # Values written by the current thread: (metric name, label values): number or list of histogram buckets
+    def shard(self):
+        try:
+            return self._local.values
+        except AttributeError:
+            values = self._local.values = {}
+            with self._lock:
+                self._shards.append((threading.current_thread(), values))
+                # Every request can have a new thread (threaded dev server), shards of finished ones are merged
+                if len(self._shards) >= self._cleanup_at:
+                    self._merge_finished()
+                    self._cleanup_at = max(64, 2 * len(self._shards))
+            return values
+
+    def _merge_finished(self):
+        alive = []
+        for thread, values in self._shards:
+            if thread.is_alive():
+                alive.append((thread, values))
+            else:
+                add_values(self._finished, values)
+        self._shards = alive
+
+    # Sum of values of all threads
+    def collect(self):
+        with self._lock:
+            self._merge_finished()
+            total = {}
+            add_values(total, self._finished)
+            for _, values in self._shards:
+                add_values(total, values.copy()) # copy() of dict is atomic, its owner can write at the same time
+        return total
+
+    def counter(self, name, description, labels=()):
+        return self._register(Counter(self, name, description, labels))
+
+    def histogram(self, name, description, labels=(), buckets=SECONDS_BUCKETS):
+        return self._register(Histogram(self, name, description, labels, buckets))
+
+    # Metric read from function at every /metrics, function returns [(label values, value)]
+    def callback(self, name, description, kind, function, labels=()):
+        return self._register(CallbackMetric(self, name, description, kind, labels, function))
+
+    def _register(self, metric):
+        if any(other.name == metric.name for other in self.metrics):
+            raise ValueError(f'Metric {metric.name} is already registered.')
+        self.metrics.append(metric)
+        return metric
+
+    # All metrics in Prometheus text format
+    def render(self):
+        values = self.collect()
+        lines = []
+        for metric in self.metrics:
+            lines.append(f'# HELP {metric.name} {metric.description}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            lines.extend(metric.lines(values))
+        return '\n'.join(lines) + '\n'
+
+# Add values of one shard to other (numbers are added, histogram buckets are added one by one)
+def add_values(total, values):
+    for key, value in values.items():
+        if isinstance(value, list):
+            value = list(value)
+            if key in total:
+                total[key] = [a + b for a, b in zip(total[key], value)]
+            else:
+                total[key] = value
+        else:
+            total[key] = total.get(key, 0) + value
+
+def format_value(value):
+    if isinstance(value, float):
+        if math.isinf(value):
+            return '+Inf' if value > 0 else '-Inf'
+        return repr(value)
+    return str(value)
+
+def format_labels(names, values):
+    if not names:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for value in values)
+    return '{' + ','.join(f'{name}="{value}"' for name, value in zip(names, escaped)) + '}'
+
+class Metric():
+    kind = 'untyped'
+
+    def __init__(self, registry, name, description, labels):
+        self.registry = registry
+        self.name = name
+        self.description = description # Text of # HELP line
+        self.labels = tuple(labels) # Names of labels, values are given in the same order
+
+    def _items(self, values):
+        return sorted((key[1], value) for key, value in values.items() if key[0] == self.name)
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, *label_values, amount=1):
+        if not self.registry.enabled:
+            return
+        values = self.registry.shard()
+        key = (self.name, label_values)
+        values[key] = values.get(key, 0) + amount
+
+    def lines(self, values):
+        return [f'{self.name}{format_labels(self.labels, label_values)} {format_value(value)}'
+                for label_values, value in self._items(values)]
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, registry, name, description, labels, buckets):
+        super().__init__(registry, name, description, labels)
+        self.buckets = tuple(buckets)
+
+    # Shard keeps number of values in every bucket (not cumulative), in +Inf bucket and sum of values
+    def observe(self, value, *label_values):
+        if not self.registry.enabled:
+            return
+        values = self.registry.shard()
+        key = (self.name, label_values)
+        counts = values.get(key)
+        if counts is None:
+            counts = values[key] = [0] * (len(self.buckets) + 2)
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def lines(self, values):
+        lines = []
+        names = self.labels + ('le',)
+        for label_values, counts in self._items(values):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{format_labels(names, label_values + (format_value(float(bound)),))} {cumulative}')
+            labels = format_labels(self.labels, label_values)
+            lines.append(f'{self.name}_sum{labels} {format_value(counts[-1])}')
+            lines.append(f'{self.name}_count{labels} {cumulative}')
+        return lines
+
+class CallbackMetric(Metric):
+
+    def __init__(self, registry, name, description, kind, labels, function):
+        super().__init__(registry, name, description, labels)
+        self.kind = kind
+        self.function = function
+
+    def lines(self, values):
+        return [f'{self.name}{format_labels(self.labels, tuple(label_values))} {format_value(value)}'
+                for label_values, value in sorted(self.function())]
+
+registry = Registry()
+
+REQUESTS = registry.counter('school_requests_total', 'Requests by endpoint, method and status.', ('endpoint', 'method', 'status'))
+REQUEST_SECONDS = registry.histogram('school_request_seconds', 'Time of handling a request.', ('endpoint', 'method'))
+REQUEST_SQL_STATEMENTS = registry.histogram('school_request_sql_statements', 'SQL statements run by a request.',
+                                            ('endpoint',), STATEMENT_BUCKETS)
+REQUEST_SQL_SECONDS = registry.histogram('school_request_sql_seconds', 'Time of SQL in a request.',
+                                         ('endpoint',), SQL_SECONDS_BUCKETS)
+SQL_STATEMENTS = registry.counter('school_sql_statements_total', 'SQL statements run on pooled connections (also in triggers).')
+SQL_SECONDS = registry.counter('school_sql_seconds_total', 'Time of SQL calls on pooled connections.')
+CHART_RENDER_SECONDS = registry.histogram('school_chart_render_seconds', 'Time of drawing a chart (not cached).',
+                                          ('kind', 'backend'))
+
+# Caches shown in metrics: name: LRUCache (cache.py)
+caches = {}
+
+def watch_cache(name, cache):
+    caches[name] = cache
+
+registry.callback('school_cache_hits_total', 'Values found in cache.', 'counter',
+                  lambda: [((name,), cache.hits) for name, cache in caches.items()], ('cache',))
+registry.callback('school_cache_misses_total', 'Values not found in cache.', 'counter',
+                  lambda: [((name,), cache.misses) for name, cache in caches.items()], ('cache',))
+registry.callback('school_cache_hit_ratio', 'Hits / (hits + misses) since start.', 'gauge',
+                  lambda: [((name,), cache.hit_rate()) for name, cache in caches.items()], ('cache',))
+
+# SQL of the request handled by this thread: [statements, seconds], None outside of requests
+_request_sql = threading.local()
+
+# Trace callback of pooled connections, called by SQLite when a statement starts
+def count_statement(statement):
+    SQL_STATEMENTS.inc()
+    sql = getattr(_request_sql, 'sql', None)
+    if sql is not None:
+        sql[0] += 1
+
+def add_sql_time(seconds):
+    SQL_SECONDS.inc(amount=seconds)
+    sql = getattr(_request_sql, 'sql', None)
+    if sql is not None:
+        sql[1] += seconds
+
+# Cursor which measures time of execute and fetch calls (rows read by iterating over cursor are not measured,
+# so e.g. loading of all grades with np.fromiter stays as fast as without metrics)
+class InstrumentedCursor(sqlite3.Cursor):
+
+    def _timed(self, function, *args):
+        if not registry.enabled:
+            return function(*args)
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            add_sql_time(time.perf_counter() - start)
+
+    def execute(self, *args):
+        return self._timed(super().execute, *args)
+
+    def executemany(self, *args):
+        return self._timed(super().executemany, *args)
+
+    def executescript(self, *args):
+        return self._timed(super().executescript, *args)
+
+    def fetchone(self):
+        return self._timed(super().fetchone)
+
+    def fetchmany(self, *args):
+        return self._timed(super().fetchmany, *args)
+
+    def fetchall(self):
+        return self._timed(super().fetchall)
+
+# Connection of the pool with metrics (database.ConnectionPool factory): statements are counted by trace callback,
+# time is measured by InstrumentedCursor (also conn.execute, which in sqlite3 doesn't use conn.cursor())
+class InstrumentedConnection(sqlite3.Connection):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if registry.enabled:
+            self.set_trace_callback(count_statement)
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, *args):
+        return self.cursor().execute(*args)
+
+    def executemany(self, *args):
+        return self.cursor().executemany(*args)
+
+    def executescript(self, *args):
+        return self.cursor().executescript(*args)
+
+    def commit(self):
+        if not registry.enabled:
+            return super().commit()
+        start = time.perf_counter()
+        try:
+            super().commit()
+        finally:
+            add_sql_time(time.perf_counter() - start)
+
+    def rollback(self):
+        if not registry.enabled:
+            return super().rollback()
+        start = time.perf_counter()
+        try:
+            super().rollback()
+        finally:
+            add_sql_time(time.perf_counter() - start)
+
+def start_request():
+    g.metrics_start = time.perf_counter()
+    _request_sql.sql = [0, 0.0]
+
+# Also called for error pages (abort, 500), response of streamed pages (exports) is measured until the first byte
+def finish_request(response):
+    start = g.pop('metrics_start', None)
+    if start is not None:
+        endpoint = request.endpoint or 'unmatched'
+        REQUEST_SECONDS.observe(time.perf_counter() - start, endpoint, request.method)
+        REQUESTS.inc(endpoint, request.method, str(response.status_code))
+        statements, seconds = getattr(_request_sql, 'sql', None) or (0, 0.0)
+        REQUEST_SQL_STATEMENTS.observe(statements, endpoint)
+        REQUEST_SQL_SECONDS.observe(seconds, endpoint)
+    return response
+
+def end_request(exception=None):
+    _request_sql.sql = None
+
+# Measure every request of the app
+def init_app(app):
+    registry.enabled = True
+    app.before_request(start_request)
+    app.after_request(finish_request)
+    app.teardown_request(end_request)
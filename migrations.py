@@ -0,0 +1,311 @@
+import hashlib
+from rankings import rank_classes
+
+# Versioned changes of the database schema.
+# The number of the last applied migration is saved in the database file (PRAGMA user_version),
+# so every migration runs only once and running all of them again at startup does nothing.
+# Views are kept in VIEWS and created again only when their SQL changes (ensure_views).
+
+# Statements of grade_aggregate triggers, {row} is NEW (added grade) or OLD (removed grade),
+# {value} is the grade value as integer (before migration 5 value was TEXT and needed CAST)
+AGGREGATE_ADD = '''INSERT INTO grade_aggregate (student_id, subject_id, weighted_sum, total_weight, grade_count,
+                                           count_1, count_2, count_3, count_4, count_5, count_6)
+                   SELECT {row}.student_id, {row}.subject_id, {value} * {row}.weight, {row}.weight, 1,
+                          {value} = 1, {value} = 2, {value} = 3,
+                          {value} = 4, {value} = 5, {value} = 6
+                   WHERE {row}.student_id IS NOT NULL AND {row}.subject_id IS NOT NULL
+                   ON CONFLICT (student_id, subject_id) DO UPDATE SET
+                       weighted_sum = weighted_sum + excluded.weighted_sum,
+                       total_weight = total_weight + excluded.total_weight,
+                       grade_count = grade_count + 1,
+                       count_1 = count_1 + excluded.count_1,
+                       count_2 = count_2 + excluded.count_2,
+                       count_3 = count_3 + excluded.count_3,
+                       count_4 = count_4 + excluded.count_4,
+                       count_5 = count_5 + excluded.count_5,
+                       count_6 = count_6 + excluded.count_6;'''
+AGGREGATE_REMOVE = '''UPDATE grade_aggregate SET
+                          weighted_sum = weighted_sum - {value} * {row}.weight,
+                          total_weight = total_weight - {row}.weight,
+                          grade_count = grade_count - 1,
+                          count_1 = count_1 - ({value} = 1),
+                          count_2 = count_2 - ({value} = 2),
+                          count_3 = count_3 - ({value} = 3),
+                          count_4 = count_4 - ({value} = 4),
+                          count_5 = count_5 - ({value} = 5),
+                          count_6 = count_6 - ({value} = 6)
+                      WHERE student_id = {row}.student_id AND subject_id = {row}.subject_id;'''
+
+# Triggers which keep grade_aggregate up to date, {row}.value in value is the grade value as integer
+def grade_aggregate_triggers(value):
+    return [
+        f'''CREATE TRIGGER IF NOT EXISTS trg_grade_aggregate_insert AFTER INSERT ON grade
+            BEGIN
+                {AGGREGATE_ADD.format(row='NEW', value=value.format(row='NEW'))}
+            END''',
+        f'''CREATE TRIGGER IF NOT EXISTS trg_grade_aggregate_delete AFTER DELETE ON grade
+            BEGIN
+                {AGGREGATE_REMOVE.format(row='OLD', value=value.format(row='OLD'))}
+            END''',
+        f'''CREATE TRIGGER IF NOT EXISTS trg_grade_aggregate_update AFTER UPDATE OF value, weight, subject_id, student_id ON grade
+            BEGIN
+                {AGGREGATE_REMOVE.format(row='OLD', value=value.format(row='OLD'))}
+                {AGGREGATE_ADD.format(row='NEW', value=value.format(row='NEW'))}
+            END''',
+    ]
+
+GRADE_COPY_BATCH = 100000 # Rows copied by one statement when grade table is rebuilt
+
+# Migration 5: grade.value was TEXT, every query needed CAST(value AS INTEGER). SQLite can't change type of a column,
+# so the table is created again with typed columns and rows are copied in batches (by id). Views are dropped first
+# (they are created again by ensure_views after migrations), index and triggers of grade are created again.
+# Grade which is not an integer 1-6 or weight not in (0, 1] stops the migration (CHECK constraint).
+def rebuild_grade_table(conn):
+    for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'view'").fetchall():
+        conn.execute(f'DROP VIEW {name}')
+    conn.execute('DELETE FROM schema_view')
+    conn.execute('''CREATE TABLE grade_typed (
+                        id INTEGER PRIMARY KEY,
+                        value INTEGER NOT NULL CHECK (value BETWEEN 1 AND 6 AND typeof(value) = 'integer'),
+                        weight REAL CHECK (weight > 0 AND weight <= 1),
+                        subject_id INTEGER REFERENCES subject(id),
+                        student_id INTEGER REFERENCES student(id),
+                        teacher_id INTEGER REFERENCES teacher(id)
+                    )''')
+    # Text values ('1' - '6') are changed to integers by INTEGER column affinity
+    last_id = -2 ** 63
+    while True:
+        batch_end = conn.execute('SELECT MAX(id) FROM (SELECT id FROM grade WHERE id > ? ORDER BY id LIMIT ?)',
+                                 (last_id, GRADE_COPY_BATCH)).fetchone()[0]
+        if batch_end is None:
+            break
+        conn.execute('''INSERT INTO grade_typed (id, value, weight, subject_id, student_id, teacher_id)
+                        SELECT id, value, weight, subject_id, student_id, teacher_id
+                        FROM grade WHERE id > ? AND id <= ?''', (last_id, batch_end))
+        last_id = batch_end
+    conn.execute('DROP TABLE grade')
+    conn.execute('ALTER TABLE grade_typed RENAME TO grade')
+    conn.execute('''CREATE INDEX idx_grade_student_subject
+                    ON grade(student_id, subject_id, value, weight)''')
+    for statement in grade_aggregate_triggers('{row}.value'):
+        conn.execute(statement)
+
+# List of migrations (version, description, SQL statements), versions must be increasing
+MIGRATIONS = [
+    (1, 'indexes for dashboard queries', [
+        # Grades of one student (student dashboard) and of students from one class (teacher dashboard),
+        # value and weight are in the index so averages are calculated without reading the table
+        '''CREATE INDEX IF NOT EXISTS idx_grade_student_subject
+           ON grade(student_id, subject_id, value, weight)''',
+        # Students of one class
+        '''CREATE INDEX IF NOT EXISTS idx_student_class
+           ON student(class_id, id)''',
+        # Classes taught by one teacher and subjects taught in one class
+        '''CREATE INDEX IF NOT EXISTS idx_teacher_class_teacher
+           ON teacher_class(teacher_id, class_id)''',
+        '''CREATE INDEX IF NOT EXISTS idx_teacher_class_class
+           ON teacher_class(class_id, subject_id, teacher_id)''',
+    ]),
+    (2, 'grade aggregates per student and subject', [
+        # Sums needed for weighted averages and number of every grade value (1-6),
+        # kept up to date by triggers on grade, so dashboards don't read all grades of a student/class
+        '''CREATE TABLE IF NOT EXISTS grade_aggregate (
+               student_id INTEGER NOT NULL REFERENCES student(id),
+               subject_id INTEGER NOT NULL REFERENCES subject(id),
+               weighted_sum REAL NOT NULL DEFAULT 0,
+               total_weight REAL NOT NULL DEFAULT 0,
+               grade_count INTEGER NOT NULL DEFAULT 0,
+               count_1 INTEGER NOT NULL DEFAULT 0,
+               count_2 INTEGER NOT NULL DEFAULT 0,
+               count_3 INTEGER NOT NULL DEFAULT 0,
+               count_4 INTEGER NOT NULL DEFAULT 0,
+               count_5 INTEGER NOT NULL DEFAULT 0,
+               count_6 INTEGER NOT NULL DEFAULT 0,
+               PRIMARY KEY (student_id, subject_id)
+           ) WITHOUT ROWID''',
+        '''CREATE INDEX IF NOT EXISTS idx_grade_aggregate_subject
+           ON grade_aggregate(subject_id, student_id)''',
+        # Aggregates of grades which are already in database
+        '''INSERT INTO grade_aggregate (student_id, subject_id, weighted_sum, total_weight, grade_count,
+                                        count_1, count_2, count_3, count_4, count_5, count_6)
+           SELECT student_id, subject_id, TOTAL(CAST(value AS INTEGER) * weight), TOTAL(weight), COUNT(*),
+                  TOTAL(CAST(value AS INTEGER) = 1), TOTAL(CAST(value AS INTEGER) = 2), TOTAL(CAST(value AS INTEGER) = 3),
+                  TOTAL(CAST(value AS INTEGER) = 4), TOTAL(CAST(value AS INTEGER) = 5), TOTAL(CAST(value AS INTEGER) = 6)
+           FROM grade
+           WHERE student_id IS NOT NULL AND subject_id IS NOT NULL
+           GROUP BY student_id, subject_id''',
+        *grade_aggregate_triggers('CAST({row}.value AS INTEGER)'),
+    ]),
+    (3, 'stored class and school rankings', [
+        # Position of every student in class and school, subject_id = 0 is ranking by average from all subjects (rankings.py)
+        '''CREATE TABLE IF NOT EXISTS student_ranking (
+               student_id INTEGER NOT NULL REFERENCES student(id),
+               subject_id INTEGER NOT NULL,
+               class_id INTEGER REFERENCES class(id),
+               average REAL NOT NULL,
+               class_rank INTEGER NOT NULL,
+               school_rank INTEGER,
+               PRIMARY KEY (student_id, subject_id)
+           ) WITHOUT ROWID''',
+        '''CREATE INDEX IF NOT EXISTS idx_student_ranking_class
+           ON student_ranking(class_id, subject_id, class_rank)''',
+        # Classes which ranking has to be calculated again
+        '''CREATE TABLE IF NOT EXISTS ranking_dirty (
+               class_id INTEGER PRIMARY KEY
+           )''',
+        '''CREATE TRIGGER IF NOT EXISTS trg_ranking_aggregate_insert AFTER INSERT ON grade_aggregate
+           BEGIN
+               INSERT INTO ranking_dirty (class_id) SELECT class_id FROM student WHERE id = NEW.student_id AND class_id IS NOT NULL
+               ON CONFLICT DO NOTHING;
+           END''',
+        '''CREATE TRIGGER IF NOT EXISTS trg_ranking_aggregate_update AFTER UPDATE ON grade_aggregate
+           BEGIN
+               INSERT INTO ranking_dirty (class_id) SELECT class_id FROM student WHERE id = NEW.student_id AND class_id IS NOT NULL
+               ON CONFLICT DO NOTHING;
+           END''',
+        '''CREATE TRIGGER IF NOT EXISTS trg_ranking_student_update AFTER UPDATE OF class_id ON student
+           BEGIN
+               INSERT INTO ranking_dirty (class_id) SELECT OLD.class_id WHERE OLD.class_id IS NOT NULL
+               UNION SELECT NEW.class_id WHERE NEW.class_id IS NOT NULL
+               ON CONFLICT DO NOTHING;
+           END''',
+        '''CREATE TRIGGER IF NOT EXISTS trg_ranking_student_delete AFTER DELETE ON student
+           BEGIN
+               INSERT INTO ranking_dirty (class_id) SELECT OLD.class_id WHERE OLD.class_id IS NOT NULL
+               ON CONFLICT DO NOTHING;
+           END''',
+        # Calculate rankings of all classes before the first read
+        '''INSERT OR IGNORE INTO ranking_dirty (class_id) SELECT DISTINCT class_id FROM student WHERE class_id IS NOT NULL''',
+    ]),
+    (4, 'hashes of view definitions', [
+        # Hash of SQL used to create every view from VIEWS, view is created again only when its SQL changes
+        '''CREATE TABLE IF NOT EXISTS schema_view (
+               name TEXT PRIMARY KEY,
+               definition_hash TEXT NOT NULL
+           )''',
+    ]),
+    (5, 'integer grade values with checks', [
+        # Table is rebuilt with the same grades, so aggregates and rankings don't change
+        rebuild_grade_table,
+    ]),
+    (6, 'rankings of added students', [
+        # Grades can be saved before the student (e.g. seeding in add_data), then no class was marked by grade triggers
+        '''CREATE TRIGGER IF NOT EXISTS trg_ranking_student_insert AFTER INSERT ON student
+           BEGIN
+               INSERT INTO ranking_dirty (class_id) SELECT NEW.class_id WHERE NEW.class_id IS NOT NULL
+               ON CONFLICT DO NOTHING;
+           END''',
+        # Databases seeded before this migration have no rankings, calculate all of them again
+        '''INSERT OR IGNORE INTO ranking_dirty (class_id) SELECT DISTINCT class_id FROM student WHERE class_id IS NOT NULL''',
+    ]),
+    (7, 'school ranks counted when read', [
+        # Position in school is counted from averages of the same subject (rankings.school_rank_sql), so refresh
+        # of one class doesn't write ranks of every student in the school
+        '''CREATE INDEX IF NOT EXISTS idx_student_ranking_subject
+           ON student_ranking(subject_id, average, student_id)''',
+        'ALTER TABLE student_ranking DROP COLUMN school_rank',
+        # Classes marked by migrations 3 and 6 are ranked now, not by the first student who reads his dashboard
+        # (school ranks of other students would not count them until then)
+        rank_classes,
+    ]),
+    (8, 'number of students in school', [
+        # Kept by triggers on student, so dashboards don't count the whole student table
+        '''CREATE TABLE IF NOT EXISTS student_count (
+               id INTEGER PRIMARY KEY CHECK (id = 1),
+               students INTEGER NOT NULL
+           )''',
+        '''INSERT OR REPLACE INTO student_count (id, students) SELECT 1, COUNT(*) FROM student''',
+        '''CREATE TRIGGER IF NOT EXISTS trg_student_count_insert AFTER INSERT ON student
+           BEGIN
+               UPDATE student_count SET students = students + 1 WHERE id = 1;
+           END''',
+        '''CREATE TRIGGER IF NOT EXISTS trg_student_count_delete AFTER DELETE ON student
+           BEGIN
+               UPDATE student_count SET students = students - 1 WHERE id = 1;
+           END''',
+    ]),
+]
+
+# Views for admin panel and add subject page (created by ensure_views)
+VIEWS = {
+    'vw_users': '''SELECT id, email, first_name, second_name, role FROM user''',
+    'vw_subjects': '''SELECT id, name FROM subject''',
+    'vw_classes': '''SELECT id, name, profile FROM class''',
+    # Changing ID numbers to values in Grade View
+    'vw_grades': '''SELECT g.id AS ID, g.value AS Value, g.weight AS Weight, 
+                           s.id || ": " || u_s.first_name || " " || u_s.second_name AS "ID: Student",
+                           t.id || ": " || u_t.first_name || " " || u_t.second_name AS "ID: Teacher"  
+                    FROM grade g
+                    LEFT JOIN student s ON g.student_id = s.id
+                    LEFT JOIN user u_s ON s.id = u_s.id
+                    LEFT JOIN teacher t ON g.teacher_id = t.id
+                    LEFT JOIN user u_t ON t.id = u_t.id''',
+    # Changing ID numbers to values in Assing View
+    'vw_assigns': '''SELECT tc.id AS ID,
+                            u.first_name || " " || u.second_name AS Teacher,
+                            c.name || " - " || c.profile AS "Class and profile",
+                            s.name AS subject
+                     FROM teacher_class tc
+                     LEFT JOIN user u ON u.id = tc.teacher_id
+                     LEFT JOIN class c ON c.id = tc.class_id
+                     LEFT JOIN subject s ON s.id = tc.subject_id''',
+}
+
+# Version of the schema saved in the database file
+def schema_version(conn):
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+# The newest version known by this code
+def latest_version():
+    return MIGRATIONS[-1][0] if MIGRATIONS else 0
+
+# Views which definition in VIEWS is different than in database
+def changed_views(conn):
+    saved = dict(conn.execute('SELECT name, definition_hash FROM schema_view').fetchall())
+    existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'view'")}
+    return [name for name, sql in VIEWS.items()
+            if name not in existing or saved.get(name) != hashlib.sha1(sql.encode('utf-8')).hexdigest()]
+
+# Create views which are missing or changed, returns names of created views.
+# Usually nothing is changed, so requests don't take write lock and don't lose prepared statements.
+def ensure_views(conn):
+    if not changed_views(conn):
+        return []
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        names = changed_views(conn)
+        for name in names:
+            sql = VIEWS[name]
+            conn.execute(f'DROP VIEW IF EXISTS {name}')
+            conn.execute(f'CREATE VIEW {name} AS {sql}')
+            conn.execute('INSERT OR REPLACE INTO schema_view (name, definition_hash) VALUES (?, ?)',
+                         (name, hashlib.sha1(sql.encode('utf-8')).hexdigest()))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return names
+
+# Apply all migrations newer than the version saved in database, returns list of applied versions
+def run_migrations(conn):
+    applied = []
+    for version, description, statements in MIGRATIONS:
+        if version <= schema_version(conn):
+            continue
+        # Write lock before checking version again, so two workers starting together don't apply it twice
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if version > schema_version(conn):
+                for statement in statements:
+                    if callable(statement):
+                        statement(conn)
+                    else:
+                        conn.execute(statement)
+                conn.execute(f'PRAGMA user_version = {version}')
+                applied.append(version)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    ensure_views(conn)
+    return applied
@@ -1,4 +1,5 @@
-from werkzeug.security import generate_password_hash
+from passwords import hash_passwords
+from migrations import run_migrations
 import random
 
 # This is class to do some operation with our database
@@ -11,6 +12,7 @@ class DatabaseOperations():
 
     def generate_database(self): 
         # If database don't exist, create new database with all tables (empty tables)
+        # (grade table is created again with INTEGER value and checks by migration 5, migrations.py)
         self.cursor.execute('''
             CREATE TABLE IF NOT EXISTS user (
                 id INTEGER PRIMARY KEY,
@@ -66,49 +68,9 @@ class DatabaseOperations():
         ''')
         self.conn.commit()
 
-    def create_views(self):
-        # Create views for all tables to admin panel and add subject
-
-        # Delete all views (important to refresh admin panel every time)
-        for view in ['vw_users', 'vw_subjects', 'vw_classes', 'vw_grades', 'vw_assigns']:
-            self.cursor.execute(f"DROP VIEW IF EXISTS {view};")
-        # Create new views
-        self.cursor.execute('''
-            CREATE VIEW IF NOT EXISTS vw_users AS
-            SELECT id, email, first_name, second_name, role FROM user;
-        ''')
-        self.cursor.execute('''
-            CREATE VIEW IF NOT EXISTS vw_subjects AS
-            SELECT id, name FROM subject;
-        ''')
-        self.cursor.execute('''
-            CREATE VIEW IF NOT EXISTS vw_classes AS
-            SELECT id, name, profile FROM class;
-        ''')
-        # Changing ID numbers to values in Grade View
-        self.cursor.execute('''
-            CREATE VIEW IF NOT EXISTS vw_grades AS
-            SELECT g.id AS ID, g.value AS Value, g.weight AS Weight, 
-                   s.id || ": " || u_s.first_name || " " || u_s.second_name AS "ID: Student",
-                   t.id || ": " || u_t.first_name || " " || u_t.second_name AS "ID: Teacher"  
-            FROM grade g
-            LEFT JOIN student s ON g.student_id = s.id
-            LEFT JOIN user u_s ON s.id = u_s.id
-            LEFT JOIN teacher t ON g.teacher_id = t.id
-            LEFT JOIN user u_t ON t.id = u_t.id;
-        ''')
-        # Changing ID numbers to values in Assing View
-        self.cursor.execute('''
-            CREATE VIEW IF NOT EXISTS vw_assigns AS
-            SELECT tc.id AS ID,
-                   u.first_name || " " || u.second_name AS Teacher,
-                   c.name || " - " || c.profile AS "Class and profile",
-                   s.name AS subject
-            FROM teacher_class tc
-            LEFT JOIN user u ON u.id = tc.teacher_id
-            LEFT JOIN class c ON c.id = tc.class_id
-            LEFT JOIN subject s ON s.id = tc.subject_id;
-        ''')
+    def migrate(self):
+        # Apply new schema changes (indexes etc.) from migrations.py, already applied are skipped
+        return run_migrations(self.conn)
 
     def add_data(self):
         # If anyone table is empty, add data (If you still have empty data, uncomment apropirate data below and comment empty list for this data)
@@ -122,39 +84,37 @@ class DatabaseOperations():
         empty_teacher = self.cursor.execute("SELECT COUNT(*) FROM teacher").fetchone()[0] == 0
         empty_student = self.cursor.execute("SELECT COUNT(*) FROM student").fetchone()[0] == 0
         try:
-            # If any table is empty, add the data and save changes after for loop
+            # If any table is empty, add the data (all rows with one executemany) and save changes
             if empty_subject:
-                for subject_info in subject_data:
-                    self.cursor.execute("INSERT INTO subject (id, name) VALUES (?, ?)", subject_info)
+                self.cursor.executemany("INSERT INTO subject (id, name) VALUES (?, ?)", subject_data)
                 self.conn.commit()
             if empty_class:
-                for class_info in class_data:
-                    self.cursor.execute("INSERT INTO class (id, name, profile) VALUES (?, ?, ?)", class_info)
+                self.cursor.executemany("INSERT INTO class (id, name, profile) VALUES (?, ?, ?)", class_data)
                 self.conn.commit()
             if empty_user:
-                for user_info in user_data:
-                    self.cursor.execute("INSERT INTO user (id, email, first_name, second_name, password, role) VALUES (?, ?, ?, ?, ?, ?)", user_info)
+                # Passwords in user_data are plain text (or hashes), they are hashed here in parallel, not when module is loaded
+                hashes = hash_passwords(user_info[4] for user_info in user_data)
+                self.cursor.executemany("INSERT INTO user (id, email, first_name, second_name, password, role) VALUES (?, ?, ?, ?, ?, ?)",
+                                        [user_info[:4] + (password_hash,) + user_info[5:] for user_info, password_hash in zip(user_data, hashes)])
                 self.conn.commit()
             if empty_assign:
-                for assign_info in assign_data:
-                    self.cursor.execute("INSERT INTO teacher_class (id, teacher_id, class_id, subject_id) VALUES (?, ?, ?, ?)", assign_info)
+                self.cursor.executemany("INSERT INTO teacher_class (id, teacher_id, class_id, subject_id) VALUES (?, ?, ?, ?)", assign_data)
                 self.conn.commit()
             if empty_grade:
-                for grade_info in grade_data:
-                    self.cursor.execute("INSERT INTO grade (id, value, weight, subject_id, student_id, teacher_id) VALUES (?, ?, ?, ?, ?, ?)", grade_info)
+                self.cursor.executemany("INSERT INTO grade (id, value, weight, subject_id, student_id, teacher_id) VALUES (?, ?, ?, ?, ?, ?)", grade_data)
                 self.conn.commit()
             if empty_teacher:
-                for teacher_info in teacher_data:
-                    self.cursor.execute("INSERT INTO teacher (id, subject_id) VALUES (?, ?)", teacher_info)
+                self.cursor.executemany("INSERT INTO teacher (id, subject_id) VALUES (?, ?)", teacher_data)
                 self.conn.commit()
             if empty_student:
-                for student_info in student_data:
-                    self.cursor.execute("INSERT INTO student (id, class_id) VALUES (?, ?)", student_info)
+                self.cursor.executemany("INSERT INTO student (id, class_id) VALUES (?, ?)", student_data)
                 self.conn.commit()
         except:
             pass
 
 # The data below is commented becaues it's quite large dataset as a text. It provides to very big delays in opening the app.
+# Passwords in user_data are plain text (first letters of name), add_data hashes them in parallel processes (passwords.py).
+# Instead of seeding, copy the prepared database: flask --app main restore-db fixtures/school.db
 # If you need to add the data below, comment the empty list, uncomment the data, save changes and run main.py file.
 # Remember to comment data again and uncomment empty list and save changes. It will be better for your computer :)
 
@@ -211,329 +171,329 @@ class_data = [
 ]
 
 user_data = [
-(1, 'admin@admin.uw.edu.pl', 'admin', 'admin', generate_password_hash('aa', method='pbkdf2:sha256'), 'admin'),
-(2, 'm.miszkiel2@student.uw.edu.pl', 'Marcin', 'Miszkiel', generate_password_hash('mm', method='pbkdf2:sha256'), 'admin'),
-(3, 'k.mocio@student.uw.edu.pl', 'Katarzyna', 'Mocio', generate_password_hash('km', method='pbkdf2:sha256'), 'admin'),
-(4, 'jkowalski@uw.edu.pl', 'Jan', 'Kowalski', generate_password_hash('jk', method='pbkdf2:sha256'), 'teacher'),
-(5, 'anowak@uw.edu.pl', 'Adam', 'Nowak', generate_password_hash('an', method='pbkdf2:sha256'), 'teacher'),
-(6, 'bking@uw.edu.pl', 'Bryan', 'King', generate_password_hash('bk', method='pbkdf2:sha256'), 'teacher'),
-(7, 'tholland@uw.edu.pl', 'Tom', 'Holland', generate_password_hash('th', method='pbkdf2:sha256'), 'teacher'),
-(8, 'mgreen@uw.edu.pl', 'Matt', 'Green', generate_password_hash('mg', method='pbkdf2:sha256'), 'teacher'),
-(9, 'wpers@uw.edu.pl', 'Witold', 'Pers', generate_password_hash('wp', method='pbkdf2:sha256'), 'teacher'),
-(10, 'kwysoki@uw.edu.pl', 'Kacper', 'Wysoki', generate_password_hash('kw', method='pbkdf2:sha256'), 'teacher'),
-(11, 'pstrong@uw.edu.pl', 'Peter', 'Strong', generate_password_hash('ps', method='pbkdf2:sha256'), 'teacher'),
-(12, 'jbatman@uw.edu.pl', 'Joanna', 'Batman', generate_password_hash('jb', method='pbkdf2:sha256'), 'teacher'),
-(13, 'hwielki@uw.edu.pl', 'Hubert', 'Wielki', generate_password_hash('hw', method='pbkdf2:sha256'), 'teacher'),
-(14, 'asmok@uw.edu.pl', 'Anna', 'Smok', generate_password_hash('as', method='pbkdf2:sha256'), 'teacher'),
-(15, 'gface@uw.edu.pl', 'Gabriela', 'Face', generate_password_hash('gf', method='pbkdf2:sha256'), 'teacher'),
-(16, 'skwiat@uw.edu.pl', 'Sebastian', 'Kwiat', generate_password_hash('sk', method='pbkdf2:sha256'), 'teacher'),
-(17, 'hwolt@uw.edu.pl', 'Halina', 'Wolt', generate_password_hash('hw', method='pbkdf2:sha256'), 'teacher'),
-(18, 'mstar@uw.edu.pl', 'Maciej', 'Star', generate_password_hash('ms', method='pbkdf2:sha256'), 'teacher'),
-(19, 'fgoliat@uw.edu.pl', 'Fryderyk', 'Goliat', generate_password_hash('fb', method='pbkdf2:sha256'), 'teacher'),
-(20, 'bwidok@uw.edu.pl', 'Barbara', 'Widok', generate_password_hash('bw', method='pbkdf2:sha256'), 'teacher'),
-(21, 'mskoczek@uw.edu.pl', 'Marcin', 'Skoczek', generate_password_hash('ms', method='pbkdf2:sha256'), 'teacher'),
-(22, 'gplon@uw.edu.pl', 'Gabriel', 'Plon', generate_password_hash('gp', method='pbkdf2:sha256'), 'teacher'),
-(23, 'ewalicowa@uw.edu.pl', 'Ewa', 'Walicowa', generate_password_hash('ew', method='pbkdf2:sha256'), 'teacher'),
-(24, 'aadams@student.uw.edu.pl', 'Adam', 'Adams', generate_password_hash('aa', method='pbkdf2:sha256'), 'student'),
-(25, 'aallen@student.uw.edu.pl', 'Adrian', 'Allen', generate_password_hash('aa', method='pbkdf2:sha256'), 'student'),
-(26, 'aanderson@student.uw.edu.pl', 'Agata', 'Anderson', generate_password_hash('aa', method='pbkdf2:sha256'), 'student'),
-(27, 'abaker@student.uw.edu.pl', 'Alan', 'Baker', generate_password_hash('ab', method='pbkdf2:sha256'), 'student'),
-(28, 'abarnes@student.uw.edu.pl', 'Albert', 'Barnes', generate_password_hash('ab', method='pbkdf2:sha256'), 'student'),
-(29, 'abennett@student.uw.edu.pl', 'Aleksander', 'Bennett', generate_password_hash('ab', method='pbkdf2:sha256'), 'student'),
-(30, 'abrooks@student.uw.edu.pl', 'Aleksandra', 'Brooks', generate_password_hash('ab', method='pbkdf2:sha256'), 'student'),
-(31, 'abrown@student.uw.edu.pl', 'Alex', 'Brown', generate_password_hash('ab', method='pbkdf2:sha256'), 'student'),
-(32, 'abryant@student.uw.edu.pl', 'Alexandra', 'Bryant', generate_password_hash('ab', method='pbkdf2:sha256'), 'student'),
-(33, 'aburke@student.uw.edu.pl', 'Alicia', 'Burke', generate_password_hash('ab', method='pbkdf2:sha256'), 'student'),
-(34, 'abutler@student.uw.edu.pl', 'Amelia', 'Butler', generate_password_hash('ab', method='pbkdf2:sha256'), 'student'),
-(35, 'acampbell@student.uw.edu.pl', 'Andre', 'Campbell', generate_password_hash('ac', method='pbkdf2:sha256'), 'student'),
-(36, 'acarter@student.uw.edu.pl', 'Andrea', 'Carter', generate_password_hash('ac', method='pbkdf2:sha256'), 'student'),
-(37, 'aclark@student.uw.edu.pl', 'Andrew', 'Clark', generate_password_hash('ac', method='pbkdf2:sha256'), 'student'),
-(38, 'acoleman@student.uw.edu.pl', 'Anita', 'Coleman', generate_password_hash('ac', method='pbkdf2:sha256'), 'student'),
-(39, 'acollins@student.uw.edu.pl', 'Anthony', 'Collins', generate_password_hash('ac', method='pbkdf2:sha256'), 'student'),
-(40, 'acook@student.uw.edu.pl', 'Anton', 'Cook', generate_password_hash('ac', method='pbkdf2:sha256'), 'student'),
-(41, 'acooper@student.uw.edu.pl', 'Ariel', 'Cooper', generate_password_hash('ac', method='pbkdf2:sha256'), 'student'),
-(42, 'acox@student.uw.edu.pl', 'Arthur', 'Cox', generate_password_hash('ac', method='pbkdf2:sha256'), 'student'),
-(43, 'acrawford@student.uw.edu.pl', 'Arthur', 'Crawford', generate_password_hash('ac', method='pbkdf2:sha256'), 'student'),
-(44, 'acruz@student.uw.edu.pl', 'Audrey', 'Cruz', generate_password_hash('ac', method='pbkdf2:sha256'), 'student'),
-(45, 'adavis@student.uw.edu.pl', 'Austin', 'Davis', generate_password_hash('ad', method='pbkdf2:sha256'), 'student'),
-(46, 'bdiaz@student.uw.edu.pl', 'Barbara', 'Diaz', generate_password_hash('bd', method='pbkdf2:sha256'), 'student'),
-(47, 'bedwards@student.uw.edu.pl', 'Bart', 'Edwards', generate_password_hash('be', method='pbkdf2:sha256'), 'student'),
-(48, 'bevans@student.uw.edu.pl', 'Ben', 'Evans', generate_password_hash('be', method='pbkdf2:sha256'), 'student'),
-(49, 'bfisher@student.uw.edu.pl', 'Benjamin', 'Fisher', generate_password_hash('bf', method='pbkdf2:sha256'), 'student'),
-(50, 'bflores@student.uw.edu.pl', 'Bernard', 'Flores', generate_password_hash('bf', method='pbkdf2:sha256'), 'student'),
-(51, 'bfoster@student.uw.edu.pl', 'Bianca', 'Foster', generate_password_hash('bf', method='pbkdf2:sha256'), 'student'),
-(52, 'bgarcia@student.uw.edu.pl', 'Bill', 'Garcia', generate_password_hash('bg', method='pbkdf2:sha256'), 'student'),
-(53, 'bgardner@student.uw.edu.pl', 'Brian', 'Gardner', generate_password_hash('bg', method='pbkdf2:sha256'), 'student'),
-(54, 'bgibson@student.uw.edu.pl', 'Bridget', 'Gibson', generate_password_hash('bg', method='pbkdf2:sha256'), 'student'),
-(55, 'bgonzalez@student.uw.edu.pl', 'Bruce', 'Gonzalez', generate_password_hash('bg', method='pbkdf2:sha256'), 'student'),
-(56, 'cgray@student.uw.edu.pl', 'Clara', 'Gray', generate_password_hash('cg', method='pbkdf2:sha256'), 'student'),
-(57, 'cgreen@student.uw.edu.pl', 'Carmen', 'Green', generate_password_hash('cg', method='pbkdf2:sha256'), 'student'),
-(58, 'cgriffin@student.uw.edu.pl', 'Carol', 'Griffin', generate_password_hash('cg', method='pbkdf2:sha256'), 'student'),
-(59, 'chall@student.uw.edu.pl', 'Caroline', 'Hall', generate_password_hash('ch', method='pbkdf2:sha256'), 'student'),
-(60, 'chamilton@student.uw.edu.pl', 'Charles', 'Hamilton', generate_password_hash('ch', method='pbkdf2:sha256'), 'student'),
-(61,"charris@student.uw.edu.pl","Charlotte","Harris",generate_password_hash('ch', method='pbkdf2:sha256'),"student"),
-(62,"chayes@student.uw.edu.pl","Cheryl","Hayes",generate_password_hash('ch', method='pbkdf2:sha256'),"student"),
-(63,"chenderson@student.uw.edu.pl","Chris","Henderson",generate_password_hash('ch', method='pbkdf2:sha256'),"student"),
-(64,"chernandez@student.uw.edu.pl","Christian","Hernandez",generate_password_hash('ch', method='pbkdf2:sha256'),"student"),
-(65,"chill@student.uw.edu.pl","Christina","Hill",generate_password_hash('ch', method='pbkdf2:sha256'),"student"),
-(66,"choffman@student.uw.edu.pl","Christopher","Hoffman",generate_password_hash('ch', method='pbkdf2:sha256'),"student"),
-(67,"chughes@student.uw.edu.pl","Cindy","Hughes",generate_password_hash('ch', method='pbkdf2:sha256'),"student"),
-(68,"cjackson@student.uw.edu.pl","Claire","Jackson",generate_password_hash('cj', method='pbkdf2:sha256'),"student"),
-(69,"cjames@student.uw.edu.pl","Clara","James",generate_password_hash('cj', method='pbkdf2:sha256'),"student"),
-(70,"cjenkins@student.uw.edu.pl","Clarence","Jenkins",generate_password_hash('cj', method='pbkdf2:sha256'),"student"),
-(71,"cjohnson@student.uw.edu.pl","Claudia","Johnson",generate_password_hash('cj', method='pbkdf2:sha256'),"student"),
-(72,"cjones@student.uw.edu.pl","Connor","Jones",generate_password_hash('cj', method='pbkdf2:sha256'),"student"),
-(73,"cjordan@student.uw.edu.pl","Craig","Jordan",generate_password_hash('cj', method='pbkdf2:sha256'),"student"),
-(74,"ckelly@student.uw.edu.pl","Crystal","Kelly",generate_password_hash('ck', method='pbkdf2:sha256'),"student"),
-(75,"ckennedy@student.uw.edu.pl","Curtis","Kennedy",generate_password_hash('ck', method='pbkdf2:sha256'),"student"),
-(76,"cking@student.uw.edu.pl","Cynthia","King",generate_password_hash('ck', method='pbkdf2:sha256'),"student"),
-(77,"dlee@student.uw.edu.pl","Damien","Lee",generate_password_hash('dl', method='pbkdf2:sha256'),"student"),
-(78,"dlewis@student.uw.edu.pl","Dana","Lewis",generate_password_hash('dl', method='pbkdf2:sha256'),"student"),
-(79,"dlong@student.uw.edu.pl","Daniel","Long",generate_password_hash('dl', method='pbkdf2:sha256'),"student"),
-(80,"dlopez@student.uw.edu.pl","Danielle","Lopez",generate_password_hash('dl', method='pbkdf2:sha256'),"student"),
-(81,"dmartinez@student.uw.edu.pl","David","Martinez",generate_password_hash('dm', method='pbkdf2:sha256'),"student"),
-(82,"dmason@student.uw.edu.pl","David","Mason",generate_password_hash('dm', method='pbkdf2:sha256'),"student"),
-(83,"dmatthews@student.uw.edu.pl","Denise","Matthews",generate_password_hash('dm', method='pbkdf2:sha256'),"student"),
-(84,"dmiller@student.uw.edu.pl","Dennis","Miller",generate_password_hash('dm', method='pbkdf2:sha256'),"student"),
-(85,"dmitchell@student.uw.edu.pl","Diana","Mitchell",generate_password_hash('dm', method='pbkdf2:sha256'),"student"),
-(86,"dmoore@student.uw.edu.pl","Diane","Moore",generate_password_hash('dm', method='pbkdf2:sha256'),"student"),
-(87,"dmorales@student.uw.edu.pl","Donald","Morales",generate_password_hash('dm', method='pbkdf2:sha256'),"student"),
-(88,"dmorgan@student.uw.edu.pl","Donna","Morgan",generate_password_hash('dm', method='pbkdf2:sha256'),"student"),
-(89,"dmorris@student.uw.edu.pl","Doris","Morris",generate_password_hash('dm', method='pbkdf2:sha256'),"student"),
-(90,"dmurphy@student.uw.edu.pl","Douglas","Murphy",generate_password_hash('dm', method='pbkdf2:sha256'),"student"),
-(91,"dnelson@student.uw.edu.pl","Dylan","Nelson",generate_password_hash('dn', method='pbkdf2:sha256'),"student"),
-(92,"enguyen@student.uw.edu.pl","Edith","Nguyen",generate_password_hash('en', method='pbkdf2:sha256'),"student"),
-(93,"eortiz@student.uw.edu.pl","Edward","Ortiz",generate_password_hash('eo', method='pbkdf2:sha256'),"student"),
-(94,"eparker@student.uw.edu.pl","Elaine","Parker",generate_password_hash('ep', method='pbkdf2:sha256'),"student"),
-(95,"epatel@student.uw.edu.pl","Eleanor","Patel",generate_password_hash('ep', method='pbkdf2:sha256'),"student"),
-(96,"epeterson@student.uw.edu.pl","Elizabeth","Peterson",generate_password_hash('ep', method='pbkdf2:sha256'),"student"),
-(97,"ephillips@student.uw.edu.pl","Ella","Phillips",generate_password_hash('ep', method='pbkdf2:sha256'),"student"),
-(98,"epowell@student.uw.edu.pl","Emily","Powell",generate_password_hash('ep', method='pbkdf2:sha256'),"student"),
-(99,"eprice@student.uw.edu.pl","Emma","Price",generate_password_hash('ep', method='pbkdf2:sha256'),"student"),
-(100,"eramirez@student.uw.edu.pl","Eric","Ramirez",generate_password_hash('er', method='pbkdf2:sha256'),"student"),
-(101,"ereed@student.uw.edu.pl","Erica","Reed",generate_password_hash('er', method='pbkdf2:sha256'),"student"),
-(102,"ereyes@student.uw.edu.pl","Erik","Reyes",generate_password_hash('er', method='pbkdf2:sha256'),"student"),
-(103,"ereynolds@student.uw.edu.pl","Erin","Reynolds",generate_password_hash('er', method='pbkdf2:sha256'),"student"),
-(104,"erichardson@student.uw.edu.pl","Ethan","Richardson",generate_password_hash('er', method='pbkdf2:sha256'),"student"),
-(105,"erivera@student.uw.edu.pl","Eugene","Rivera",generate_password_hash('er', method='pbkdf2:sha256'),"student"),
-(106,"eroberts@student.uw.edu.pl","Eva","Roberts",generate_password_hash('er', method='pbkdf2:sha256'),"student"),
-(107,"erobinson@student.uw.edu.pl","Evan","Robinson",generate_password_hash('er', method='pbkdf2:sha256'),"student"),
-(108,"erodriguez@student.uw.edu.pl","Evelyn","Rodriguez",generate_password_hash('er', method='pbkdf2:sha256'),"student"),
-(109,"frogers@student.uw.edu.pl","Frances","Rogers",generate_password_hash('fr', method='pbkdf2:sha256'),"student"),
-(110,"fross@student.uw.edu.pl","Frank","Ross",generate_password_hash('fr', method='pbkdf2:sha256'),"student"),
-(111,"grussel@student.uw.edu.pl","Gabriela","Russel",generate_password_hash('gr', method='pbkdf2:sha256'),"student"),
-(112,"gryan@student.uw.edu.pl","Gabriel","Ryan",generate_password_hash('gr', method='pbkdf2:sha256'),"student"),
-(113,"gsanchez@student.uw.edu.pl","Gabriel","Sanchez",generate_password_hash('gs', method='pbkdf2:sha256'),"student"),
-(114,"gsanders@student.uw.edu.pl","Gary","Sanders",generate_password_hash('gs', method='pbkdf2:sha256'),"student"),
-(115,"gscott@student.uw.edu.pl","George","Scott",generate_password_hash('gs', method='pbkdf2:sha256'),"student"),
-(116,"gsimmons@student.uw.edu.pl","Gerald","Simmons",generate_password_hash('gs', method='pbkdf2:sha256'),"student"),
-(117,"gsmith@student.uw.edu.pl","Gloria","Smith",generate_password_hash('gs', method='pbkdf2:sha256'),"student"),
-(118,"gsnyder@student.uw.edu.pl","Grace","Snyder",generate_password_hash('gs', method='pbkdf2:sha256'),"student"),
-(119,"gspencer@student.uw.edu.pl","Gregory","Spencer",generate_password_hash('gs', method='pbkdf2:sha256'),"student"),
-(120,"hstewart@student.uw.edu.pl","Hannah","Stewart",generate_password_hash('hs', method='pbkdf2:sha256'),"student"),
-(121,"htaylor@student.uw.edu.pl","Harold","Taylor",generate_password_hash('ht', method='pbkdf2:sha256'),"student"),
-(122,"hthomas@student.uw.edu.pl","Harry","Thomas",generate_password_hash('ht', method='pbkdf2:sha256'),"student"),
-(123,"hthompson@student.uw.edu.pl","Heather","Thompson",generate_password_hash('ht', method='pbkdf2:sha256'),"student"),
-(124,"htorres@student.uw.edu.pl","Helen","Torres",generate_password_hash('ht', method='pbkdf2:sha256'),"student"),
-(125,"hturner@student.uw.edu.pl","Henry","Turner",generate_password_hash('ht', method='pbkdf2:sha256'),"student"),
-(126,"hvasquez@student.uw.edu.pl","Howard","Vasquez",generate_password_hash('hv', method='pbkdf2:sha256'),"student"),
-(127,"iwagner@student.uw.edu.pl","Ian","Wagner",generate_password_hash('iw', method='pbkdf2:sha256'),"student"),
-(128,"iwalker@student.uw.edu.pl","Ingrid","Walker",generate_password_hash('iw', method='pbkdf2:sha256'),"student"),
-(129,"iwallace@student.uw.edu.pl","Irene","Wallace",generate_password_hash('iw', method='pbkdf2:sha256'),"student"),
-(130,"iward@student.uw.edu.pl","Iris","Ward",generate_password_hash('iw', method='pbkdf2:sha256'),"student"),
-(131,"iwarren@student.uw.edu.pl","Isabel","Warren",generate_password_hash('iw', method='pbkdf2:sha256'),"student"),
-(132,"jwashington@student.uw.edu.pl","Jack","Washington",generate_password_hash('jw', method='pbkdf2:sha256'),"student"),
-(133,"jwatson@student.uw.edu.pl","Jackson","Watson",generate_password_hash('jw', method='pbkdf2:sha256'),"student"),
-(134,"jwhite@student.uw.edu.pl","Jacob","White",generate_password_hash('jw', method='pbkdf2:sha256'),"student"),
-(135,"jwilliams@student.uw.edu.pl","Jacqueline","Williams",generate_password_hash('jw', method='pbkdf2:sha256'),"student"),
-(136,"jwilson@student.uw.edu.pl","James","Wilson",generate_password_hash('jw', method='pbkdf2:sha256'),"student"),
-(137,"jwood@student.uw.edu.pl","Jamie","Wood",generate_password_hash('jw', method='pbkdf2:sha256'),"student"),
-(138,"jwright@student.uw.edu.pl","Jan","Wright",generate_password_hash('jw', method='pbkdf2:sha256'),"student"),
-(139,"jyoung@student.uw.edu.pl","Jane","Young",generate_password_hash('jy', method='pbkdf2:sha256'),"student"),
-(140,"jadams@student.uw.edu.pl","Janet","Adams",generate_password_hash('ja', method='pbkdf2:sha256'),"student"),
-(141,"jallen@student.uw.edu.pl","Janice","Allen",generate_password_hash('ja', method='pbkdf2:sha256'),"student"),
-(142,"janderson@student.uw.edu.pl","Jason","Anderson",generate_password_hash('ja', method='pbkdf2:sha256'),"student"),
-(143,"jbaker@student.uw.edu.pl","Jean","Baker",generate_password_hash('jb', method='pbkdf2:sha256'),"student"),
-(144,"jbarnes@student.uw.edu.pl","Jeffrey","Barnes",generate_password_hash('jb', method='pbkdf2:sha256'),"student"),
-(145,"jbennet@student.uw.edu.pl","Jenna","Bennett",generate_password_hash('jb', method='pbkdf2:sha256'),"student"),
-(146,"jbrooks@student.uw.edu.pl","Jennifer","Brooks",generate_password_hash('jb', method='pbkdf2:sha256'),"student"),
-(147,"jbrown@student.uw.edu.pl","Jerry","Brown",generate_password_hash('jb', method='pbkdf2:sha256'),"student"),
-(148,"jbryant@student.uw.edu.pl","Jesse","Bryant",generate_password_hash('jb', method='pbkdf2:sha256'),"student"),
-(149,"jbruke@student.uw.edu.pl","Jessica","Bruke",generate_password_hash('jb', method='pbkdf2:sha256'),"student"),
-(150,"jbutler@student.uw.edu.pl","Jim","Butler",generate_password_hash('jb', method='pbkdf2:sha256'),"student"),
-(151,"jcampbell@student.uw.edu.pl","Joan","Campbell",generate_password_hash('jc', method='pbkdf2:sha256'),"student"),
-(152,"jcarter@student.uw.edu.pl","Joanna","Carter",generate_password_hash('jc', method='pbkdf2:sha256'),"student"),
-(153,"jclark@student.uw.edu.pl","Joe","Clark",generate_password_hash('jc', method='pbkdf2:sha256'),"student"),
-(154,"jcoleman@student.uw.edu.pl","John","Coleman",generate_password_hash('jc', method='pbkdf2:sha256'),"student"),
-(155,"jcollins@student.uw.edu.pl","Jonathan","Collins",generate_password_hash('jc', method='pbkdf2:sha256'),"student"),
-(156,"jcook@student.uw.edu.pl","Jordan","Cook",generate_password_hash('jc', method='pbkdf2:sha256'),"student"),
-(157,"jcooper@student.uw.edu.pl","Joseph","Cooper",generate_password_hash('jc', method='pbkdf2:sha256'),"student"),
-(158,"jcox@student.uw.edu.pl","Joshua","Cox",generate_password_hash('jc', method='pbkdf2:sha256'),"student"),
-(159,"jcrawford@student.uw.edu.pl","Joyce","Crawford",generate_password_hash('jc', method='pbkdf2:sha256'),"student"),
-(160,"jcruz@student.uw.edu.pl","Juan","Cruz",generate_password_hash('jc', method='pbkdf2:sha256'),"student"),
-(161,"jdavis@student.uw.edu.pl","Judy","Davis",generate_password_hash('jd', method='pbkdf2:sha256'),"student"),
-(162,"jdiaz@student.uw.edu.pl","Julia","Diaz",generate_password_hash('jd', method='pbkdf2:sha256'),"student"),
-(163,"jedwards@student.uw.edu.pl","Julian","Edwards",generate_password_hash('je', method='pbkdf2:sha256'),"student"),
-(164,"jevans@student.uw.edu.pl","Julie","Evans",generate_password_hash('je', method='pbkdf2:sha256'),"student"),
-(165,"jfisher@student.uw.edu.pl","Justin","Fisher",generate_password_hash('jf', method='pbkdf2:sha256'),"student"),
-(166,"kflores@student.uw.edu.pl","Karen","Flores",generate_password_hash('kf', method='pbkdf2:sha256'),"student"),
-(167,"kfoster@student.uw.edu.pl","Karl","Foster",generate_password_hash('kf', method='pbkdf2:sha256'),"student"),
-(168,"kgarcia@student.uw.edu.pl","Kate","Garcia",generate_password_hash('kg', method='pbkdf2:sha256'),"student"),
-(169,"kgardner@student.uw.edu.pl","Kate","Gardner",generate_password_hash('kg', method='pbkdf2:sha256'),"student"),
-(170,"kgibson@student.uw.edu.pl","Kathleen","Gibson",generate_password_hash('kg', method='pbkdf2:sha256'),"student"),
-(171,"kgonzalez@student.uw.edu.pl","Kathryn","Gonzalez",generate_password_hash('kg', method='pbkdf2:sha256'),"student"),
-(172,"kgray@student.uw.edu.pl","Kathy","Gray",generate_password_hash('kg', method='pbkdf2:sha256'),"student"),
-(173,"kgreen@student.uw.edu.pl","Katie","Green",generate_password_hash('kg', method='pbkdf2:sha256'),"student"),
-(174,"kgriffin@student.uw.edu.pl","Keith","Griffin",generate_password_hash('kg', method='pbkdf2:sha256'),"student"),
-(175,"khall@student.uw.edu.pl","Kelly","Hall",generate_password_hash('kh', method='pbkdf2:sha256'),"student"),
-(176,"khamilton@student.uw.edu.pl","Kenneth","Hamilton",generate_password_hash('kh', method='pbkdf2:sha256'),"student"),
-(177,"kharris@student.uw.edu.pl","Kevin","Harris",generate_password_hash('kh', method='pbkdf2:sha256'),"student"),
-(178,"khayes@student.uw.edu.pl","Kim","Hayes",generate_password_hash('kh', method='pbkdf2:sha256'),"student"),
-(179,"khenderson@student.uw.edu.pl","Kimberly","Henderson",generate_password_hash('kh', method='pbkdf2:sha256'),"student"),
-(180,"khernandez@student.uw.edu.pl","Kristen","Hernandez",generate_password_hash('kh', method='pbkdf2:sha256'),"student"),
-(181,"khill@student.uw.edu.pl","Kyle","Hill",generate_password_hash('kh', method='pbkdf2:sha256'),"student"),
-(182,"lhoffman@student.uw.edu.pl","Laura","Hoffman",generate_password_hash('lh', method='pbkdf2:sha256'),"student"),
-(183,"lhughes@student.uw.edu.pl","Lauren","Hughes",generate_password_hash('lh', method='pbkdf2:sha256'),"student"),
-(184,"ljackson@student.uw.edu.pl","Lawrence","Jackson",generate_password_hash('lj', method='pbkdf2:sha256'),"student"),
-(185,"ljames@student.uw.edu.pl","Leah","James",generate_password_hash('lj', method='pbkdf2:sha256'),"student"),
-(186,"ljenkins@student.uw.edu.pl","Lee","Jenkins",generate_password_hash('lj', method='pbkdf2:sha256'),"student"),
-(187,"ljohnson@student.uw.edu.pl","Leonard","Johnson",generate_password_hash('lj', method='pbkdf2:sha256'),"student"),
-(188,"ljones@student.uw.edu.pl","Leslie","Jones",generate_password_hash('lj', method='pbkdf2:sha256'),"student"),
-(189,"ljordan@student.uw.edu.pl","Liam","Jordan",generate_password_hash('lj', method='pbkdf2:sha256'),"student"),
-(190,"lkelly@student.uw.edu.pl","Lillian","Kelly",generate_password_hash('lk', method='pbkdf2:sha256'),"student"),
-(191,"lkennedy@student.uw.edu.pl","Linda","Kennedy",generate_password_hash('lk', method='pbkdf2:sha256'),"student"),
-(192,"lking@student.uw.edu.pl","Lisa","King",generate_password_hash('lk', method='pbkdf2:sha256'),"student"),
-(193,"llee@student.uw.edu.pl","Lois","Lee",generate_password_hash('ll', method='pbkdf2:sha256'),"student"),
-(194,"llewis@student.uw.edu.pl","Lori","Lewis",generate_password_hash('ll', method='pbkdf2:sha256'),"student"),
-(195,"llong@student.uw.edu.pl","Louise","Long",generate_password_hash('ll', method='pbkdf2:sha256'),"student"),
-(196,"llopez@student.uw.edu.pl","Lucas","Lopez",generate_password_hash('ll', method='pbkdf2:sha256'),"student"),
-(197,"lmartinez@student.uw.edu.pl","Lucy","Martinez",generate_password_hash('lm', method='pbkdf2:sha256'),"student"),
-(198,"lmason@student.uw.edu.pl","Luis","Mason",generate_password_hash('lm', method='pbkdf2:sha256'),"student"),
-(199,"lmatthews@student.uw.edu.pl","Luke","Matthews",generate_password_hash('lm', method='pbkdf2:sha256'),"student"),
-(200,"lmiller@student.uw.edu.pl","Lyndia","Miller",generate_password_hash('lm', method='pbkdf2:sha256'),"student"),
-(201,"lmitchell@student.uw.edu.pl","Lynn","Mitchell",generate_password_hash('lm', method='pbkdf2:sha256'),"student"),
-(202,"mmoore@student.uw.edu.pl","Maggie","Moore",generate_password_hash('mm', method='pbkdf2:sha256'),"student"),
-(203,"mmorales@student.uw.edu.pl","Marc","Morales",generate_password_hash('mm', method='pbkdf2:sha256'),"student"),
-(204,"mmorgan@student.uw.edu.pl","Margaret","Morgan",generate_password_hash('mm', method='pbkdf2:sha256'),"student"),
-(205,"mmorris@student.uw.edu.pl","Maria","Morris",generate_password_hash('mm', method='pbkdf2:sha256'),"student"),
-(206,"mmurphy@student.uw.edu.pl","Marian","Murphy",generate_password_hash('mm', method='pbkdf2:sha256'),"student"),
-(207,"mnelson@student.uw.edu.pl","Marie","Nelson",generate_password_hash('mn', method='pbkdf2:sha256'),"student"),
-(208,"mnguyen@student.uw.edu.pl","Marilyn","Nguyen",generate_password_hash('mn', method='pbkdf2:sha256'),"student"),
-(209,"mortiz@student.uw.edu.pl","Mark","Ortiz",generate_password_hash('mo', method='pbkdf2:sha256'),"student"),
-(210,"mparker@student.uw.edu.pl","Marsha","Parker",generate_password_hash('mp', method='pbkdf2:sha256'),"student"),
-(211,"mpatel@student.uw.edu.pl","Martin","Patel",generate_password_hash('mp', method='pbkdf2:sha256'),"student"),
-(212,"mpeterson@student.uw.edu.pl","Mary","Peterson",generate_password_hash('mp', method='pbkdf2:sha256'),"student"),
-(213,"mphillips@student.uw.edu.pl","Matthew","Phillips",generate_password_hash('mp', method='pbkdf2:sha256'),"student"),
-(214,"mpowell@student.uw.edu.pl","Megan","Powell",generate_password_hash('mp', method='pbkdf2:sha256'),"student"),
-(215,"mprice@student.uw.edu.pl","Melanie","Price",generate_password_hash('mp', method='pbkdf2:sha256'),"student"),
-(216,"mramirez@student.uw.edu.pl","Melissa","Ramirez",generate_password_hash('mr', method='pbkdf2:sha256'),"student"),
-(217,"mreed@student.uw.edu.pl","Michael","Reed",generate_password_hash('mr', method='pbkdf2:sha256'),"student"),
-(218,"mreyes@student.uw.edu.pl","Michelle","Reyes",generate_password_hash('mr', method='pbkdf2:sha256'),"student"),
-(219,"mreynolds@student.uw.edu.pl","Mike","Reynolds",generate_password_hash('mr', method='pbkdf2:sha256'),"student"),
-(220,"mrichardson@student.uw.edu.pl","Molly","Richardson",generate_password_hash('mr', method='pbkdf2:sha256'),"student"),
-(221,"mrivera@student.uw.edu.pl","Monica","Rivera",generate_password_hash('mr', method='pbkdf2:sha256'),"student"),
-(222,"mroberts@student.uw.edu.pl","Morgan","Roberts",generate_password_hash('mr', method='pbkdf2:sha256'),"student"),
-(223,"nrobinson@student.uw.edu.pl","Nancy","Robinson",generate_password_hash('nr', method='pbkdf2:sha256'),"student"),
-(224,"nrodriguez@student.uw.edu.pl","Naomi","Rodriguez",generate_password_hash('nr', method='pbkdf2:sha256'),"student"),
-(225,"nrogers@student.uw.edu.pl","Natalie","Rogers",generate_password_hash('nr', method='pbkdf2:sha256'),"student"),
-(226,"nross@student.uw.edu.pl","Nathan","Ross",generate_password_hash('nr', method='pbkdf2:sha256'),"student"),
-(227,"nrussell@student.uw.edu.pl","Nathan","Russell",generate_password_hash('nr', method='pbkdf2:sha256'),"student"),
-(228,"nryan@student.uw.edu.pl","Nicole","Ryan",generate_password_hash('nr', method='pbkdf2:sha256'),"student"),
-(229,"nsanchez@student.uw.edu.pl","Nina","Sanchez",generate_password_hash('ns', method='pbkdf2:sha256'),"student"),
-(230,"nsanders@student.uw.edu.pl","Noah","Sanders",generate_password_hash('ns', method='pbkdf2:sha256'),"student"),
-(231,"nscott@student.uw.edu.pl","Norma","Scott",generate_password_hash('ns', method='pbkdf2:sha256'),"student"),
-(232,"osimmons@student.uw.edu.pl","Olivier","Simmons",generate_password_hash('os', method='pbkdf2:sha256'),"student"),
-(233,"osmith@student.uw.edu.pl","Olivia","Smith",generate_password_hash('os', method='pbkdf2:sha256'),"student"),
-(234,"osnyder@student.uw.edu.pl","Oscar","Snyder",generate_password_hash('os', method='pbkdf2:sha256'),"student"),
-(235,"ospencer@student.uw.edu.pl","Owen","Spencer",generate_password_hash('os', method='pbkdf2:sha256'),"student"),
-(236,"pstewart@student.uw.edu.pl","Pamela","Stewart",generate_password_hash('ps', method='pbkdf2:sha256'),"student"),
-(237,"ptaylor@student.uw.edu.pl","Patricia","Taylor",generate_password_hash('pt', method='pbkdf2:sha256'),"student"),
-(238,"pthomas@student.uw.edu.pl","Patrick","Thomas",generate_password_hash('pt', method='pbkdf2:sha256'),"student"),
-(239,"pthompson@student.uw.edu.pl","Paul","Thompson",generate_password_hash('pt', method='pbkdf2:sha256'),"student"),
-(240,"ptorres@student.uw.edu.pl","Paula","Torres",generate_password_hash('pt', method='pbkdf2:sha256'),"student"),
-(241,"ptuner@student.uw.edu.pl","Peggy","Tuner",generate_password_hash('pt', method='pbkdf2:sha256'),"student"),
-(242,"pvasquez@student.uw.edu.pl","Peter","Vasquez",generate_password_hash('pv', method='pbkdf2:sha256'),"student"),
-(243,"pwagner@student.uw.edu.pl","Philip","Wagner",generate_password_hash('pw', method='pbkdf2:sha256'),"student"),
-(244,"pwalker@student.uw.edu.pl","Phylis","Walker",generate_password_hash('pw', method='pbkdf2:sha256'),"student"),
-(245,"rwallace@student.uw.edu.pl","Rachel","Wallace",generate_password_hash('rw', method='pbkdf2:sha256'),"student"),
-(246,"rward@student.uw.edu.pl","Ralph","Ward",generate_password_hash('rw', method='pbkdf2:sha256'),"student"),
-(247,"rwarren@student.uw.edu.pl","Raymond","Warren",generate_password_hash('rw', method='pbkdf2:sha256'),"student"),
-(248,"rwashington@student.uw.edu.pl","Rebecca","Washington",generate_password_hash('rw', method='pbkdf2:sha256'),"student"),
-(249,"rwatson@student.uw.edu.pl","Regina","Watson",generate_password_hash('rw', method='pbkdf2:sha256'),"student"),
-(250,"rwhite@student.uw.edu.pl","Renee","White",generate_password_hash('rw', method='pbkdf2:sha256'),"student"),
-(251,"rwilliams@student.uw.edu.pl","Richard","Williams",generate_password_hash('rw', method='pbkdf2:sha256'),"student"),
-(252,"rwilson@student.uw.edu.pl","Rita","Wilson",generate_password_hash('rw', method='pbkdf2:sha256'),"student"),
-(253,"rwood@student.uw.edu.pl","Robert","Wood",generate_password_hash('rw', method='pbkdf2:sha256'),"student"),
-(254,"rwright@student.uw.edu.pl","Robin","Wright",generate_password_hash('rw', method='pbkdf2:sha256'),"student"),
-(255,"ryoung@student.uw.edu.pl","Roger","Young",generate_password_hash('ry', method='pbkdf2:sha256'),"student"),
-(256,"radams@student.uw.edu.pl","Ronald","Adams",generate_password_hash('ra', method='pbkdf2:sha256'),"student"),
-(257,"rallen@student.uw.edu.pl","Rose","Allen",generate_password_hash('ra', method='pbkdf2:sha256'),"student"),
-(258,"radnerson@student.uw.edu.pl","Ruby","Anderson",generate_password_hash('ra', method='pbkdf2:sha256'),"student"),
-(259,"rbaker@student.uw.edu.pl","Russell","Baker",generate_password_hash('rb', method='pbkdf2:sha256'),"student"),
-(260,"rbarnes@student.uw.edu.pl","Ryan","Barnes",generate_password_hash('rb', method='pbkdf2:sha256'),"student"),
-(261,"sbennet@student.uw.edu.pl","Sabina","Bennet",generate_password_hash('sb', method='pbkdf2:sha256'),"student"),
-(262,"sbrooks@student.uw.edu.pl","Samuel","Brooks",generate_password_hash('sb', method='pbkdf2:sha256'),"student"),
-(263,"sbrown@student.uw.edu.pl","Sandra","Brown",generate_password_hash('sb', method='pbkdf2:sha256'),"student"),
-(264,"sbryant@student.uw.edu.pl","Sara","Bryant",generate_password_hash('sb', method='pbkdf2:sha256'),"student"),
-(265,"sburke@student.uw.edu.pl","Sarah","Burke",generate_password_hash('sb', method='pbkdf2:sha256'),"student"),
-(266,"sbutler@student.uw.edu.pl","Scott","Butler",generate_password_hash('sb', method='pbkdf2:sha256'),"student"),
-(267,"scampbell@student.uw.edu.pl","Sean","Campbell",generate_password_hash('sc', method='pbkdf2:sha256'),"student"),
-(268,"scarter@student.uw.edu.pl","Seth","Carter",generate_password_hash('sc', method='pbkdf2:sha256'),"student"),
-(269,"sclark@student.uw.edu.pl","Shane","Clark",generate_password_hash('sc', method='pbkdf2:sha256'),"student"),
-(270,"scoleman@student.uw.edu.pl","Shannon","Coleman",generate_password_hash('sc', method='pbkdf2:sha256'),"student"),
-(271,"scollins@student.uw.edu.pl","Sharon","Collins",generate_password_hash('sc', method='pbkdf2:sha256'),"student"),
-(272,"scook@student.uw.edu.pl","Shelia","Cook",generate_password_hash('sc', method='pbkdf2:sha256'),"student"),
-(273,"scooper@student.uw.edu.pl","Shelley","Cooper",generate_password_hash('sc', method='pbkdf2:sha256'),"student"),
-(274,"scox@student.uw.edu.pl","Sherri","Cox",generate_password_hash('sc', method='pbkdf2:sha256'),"student"),
-(275,"scrawford@student.uw.edu.pl","Shirley","Crawford",generate_password_hash('sc', method='pbkdf2:sha256'),"student"),
-(276,"scruz@student.uw.edu.pl","Sidney","Cruz",generate_password_hash('sc', method='pbkdf2:sha256'),"student"),
-(277,"sdavis@student.uw.edu.pl","Sophia","Davis",generate_password_hash('sd', method='pbkdf2:sha256'),"student"),
-(278,"sdiaz@student.uw.edu.pl","Sofia","Diaz",generate_password_hash('sd', method='pbkdf2:sha256'),"student"),
-(279,"sedwards@student.uw.edu.pl","Stanley","Edwards",generate_password_hash('se', method='pbkdf2:sha256'),"student"),
-(280,"sevans@student.uw.edu.pl","Stephanie","Evans",generate_password_hash('se', method='pbkdf2:sha256'),"student"),
-(281,"sfisher@student.uw.edu.pl","Stephen","Fisher",generate_password_hash('sf', method='pbkdf2:sha256'),"student"),
-(282,"sflores@student.uw.edu.pl","Steve","Flores",generate_password_hash('sf', method='pbkdf2:sha256'),"student"),
-(283,"sfoster@student.uw.edu.pl","Steven","Foster",generate_password_hash('sf', method='pbkdf2:sha256'),"student"),
-(284,"sgarcia@student.uw.edu.pl","Susan","Garcia",generate_password_hash('sg', method='pbkdf2:sha256'),"student"),
-(285,"sgardner@student.uw.edu.pl","Suzanne","Gardner",generate_password_hash('sg', method='pbkdf2:sha256'),"student"),
-(286,"sgibson@student.uw.edu.pl","Sylvia","Gibson",generate_password_hash('sg', method='pbkdf2:sha256'),"student"),
-(287,"tgonzalez@student.uw.edu.pl","Tamara","Gonzalez",generate_password_hash('tg', method='pbkdf2:sha256'),"student"),
-(288,"tgray@student.uw.edu.pl","Tanya","Gray",generate_password_hash('tg', method='pbkdf2:sha256'),"student"),
-(289,"tgreen@student.uw.edu.pl","Taylor","Green",generate_password_hash('tg', method='pbkdf2:sha256'),"student"),
-(290,"tgriffin@student.uw.edu.pl","Teresa","Griffin",generate_password_hash('tg', method='pbkdf2:sha256'),"student"),
-(291,"thall@student.uw.edu.pl","Terry","Hall",generate_password_hash('th', method='pbkdf2:sha256'),"student"),
-(292,"thamilton@student.uw.edu.pl","Theodore","Hamilton",generate_password_hash('th', method='pbkdf2:sha256'),"student"),
-(293,"tharris@student.uw.edu.pl","Theresa","Harris",generate_password_hash('th', method='pbkdf2:sha256'),"student"),
-(294,"thayes@student.uw.edu.pl","Thomas","Hayes",generate_password_hash('th', method='pbkdf2:sha256'),"student"),
-(295,"thenderson@student.uw.edu.pl","Tiffany","Henderson",generate_password_hash('th', method='pbkdf2:sha256'),"student"),
-(296,"thernandez@student.uw.edu.pl","Timothy","Hernandez",generate_password_hash('th', method='pbkdf2:sha256'),"student"),
-(297,"thill@student.uw.edu.pl","Tina","Hill",generate_password_hash('th', method='pbkdf2:sha256'),"student"),
-(298,"thoffman@student.uw.edu.pl","Todd","Hoffman",generate_password_hash('th', method='pbkdf2:sha256'),"student"),
-(299,"thughes@student.uw.edu.pl","Tony","Hughes",generate_password_hash('th', method='pbkdf2:sha256'),"student"),
-(300,"tjackson@student.uw.edu.pl","Tracy","Jackson",generate_password_hash('tj', method='pbkdf2:sha256'),"student"),
-(301,"tjames@student.uw.edu.pl","Travis","James",generate_password_hash('tj', method='pbkdf2:sha256'),"student"),
-(302,"tjenkins@student.uw.edu.pl","Trevor","Jenkins",generate_password_hash('tj', method='pbkdf2:sha256'),"student"),
-(303,"tjohnson@student.uw.edu.pl","Tyler","Johnson",generate_password_hash('tj', method='pbkdf2:sha256'),"student"),
-(304,"vjones@student.uw.edu.pl","Valerie","Jones",generate_password_hash('vj', method='pbkdf2:sha256'),"student"),
-(305,"vjordan@student.uw.edu.pl","Vanessa","Jordan",generate_password_hash('vj', method='pbkdf2:sha256'),"student"),
-(306,"vkelly@student.uw.edu.pl","Vera","Kelly",generate_password_hash('vk', method='pbkdf2:sha256'),"student"),
-(307,"vkennedy@student.uw.edu.pl","Veronica","Kennedy",generate_password_hash('vk', method='pbkdf2:sha256'),"student"),
-(308,"vking@student.uw.edu.pl","Victor","King",generate_password_hash('vk', method='pbkdf2:sha256'),"student"),
-(309,"vlee@student.uw.edu.pl","Victoria","Lee",generate_password_hash('vl', method='pbkdf2:sha256'),"student"),
-(310,"vlewis@student.uw.edu.pl","Vincent","Lewis",generate_password_hash('vl', method='pbkdf2:sha256'),"student"),
-(311,"vlong@student.uw.edu.pl","Virginia","Long",generate_password_hash('vl', method='pbkdf2:sha256'),"student"),
-(312,"vlopez@student.uw.edu.pl","Vivian","Lopez",generate_password_hash('vl', method='pbkdf2:sha256'),"student"),
-(313,"wmartinez@student.uw.edu.pl","Walter","Martinez",generate_password_hash('wm', method='pbkdf2:sha256'),"student"),
-(314,"wmason@student.uw.edu.pl","Watter","Mason",generate_password_hash('wm', method='pbkdf2:sha256'),"student"),
-(315,"wmatthews@student.uw.edu.pl","Wayne","Matthews",generate_password_hash('wm', method='pbkdf2:sha256'),"student"),
-(316,"wmiller@student.uw.edu.pl","Wendy","Miller",generate_password_hash('wm', method='pbkdf2:sha256'),"student"),
-(317,"wmitchell@student.uw.edu.pl","Wesley","Mitchell",generate_password_hash('wm', method='pbkdf2:sha256'),"student"),
-(318,"wmoore@student.uw.edu.pl","Willian","Moore",generate_password_hash('wm', method='pbkdf2:sha256'),"student"),
-(319,"wmorales@student.uw.edu.pl","Willie","Morales",generate_password_hash('wm', method='pbkdf2:sha256'),"student"),
-(320,"xmorgan@student.uw.edu.pl","Xavier","Morgan",generate_password_hash('xm', method='pbkdf2:sha256'),"student"),
-(321,"ymorris@student.uw.edu.pl","Yvonne","Morris",generate_password_hash('ym', method='pbkdf2:sha256'),"student"),
-(322,"zmurphy@student.uw.edu.pl","Zachary","Murphy",generate_password_hash('zm', method='pbkdf2:sha256'),"student"),
-(323,"znelson@student.uw.edu.pl","Zoe","Nelson",generate_password_hash('zn', method='pbkdf2:sha256'),"student")
+(1, 'admin@admin.uw.edu.pl', 'admin', 'admin', 'aa', 'admin'),
+(2, 'm.miszkiel2@student.uw.edu.pl', 'Marcin', 'Miszkiel', 'mm', 'admin'),
+(3, 'k.mocio@student.uw.edu.pl', 'Katarzyna', 'Mocio', 'km', 'admin'),
+(4, 'jkowalski@uw.edu.pl', 'Jan', 'Kowalski', 'jk', 'teacher'),
+(5, 'anowak@uw.edu.pl', 'Adam', 'Nowak', 'an', 'teacher'),
+(6, 'bking@uw.edu.pl', 'Bryan', 'King', 'bk', 'teacher'),
+(7, 'tholland@uw.edu.pl', 'Tom', 'Holland', 'th', 'teacher'),
+(8, 'mgreen@uw.edu.pl', 'Matt', 'Green', 'mg', 'teacher'),
+(9, 'wpers@uw.edu.pl', 'Witold', 'Pers', 'wp', 'teacher'),
+(10, 'kwysoki@uw.edu.pl', 'Kacper', 'Wysoki', 'kw', 'teacher'),
+(11, 'pstrong@uw.edu.pl', 'Peter', 'Strong', 'ps', 'teacher'),
+(12, 'jbatman@uw.edu.pl', 'Joanna', 'Batman', 'jb', 'teacher'),
+(13, 'hwielki@uw.edu.pl', 'Hubert', 'Wielki', 'hw', 'teacher'),
+(14, 'asmok@uw.edu.pl', 'Anna', 'Smok', 'as', 'teacher'),
+(15, 'gface@uw.edu.pl', 'Gabriela', 'Face', 'gf', 'teacher'),
+(16, 'skwiat@uw.edu.pl', 'Sebastian', 'Kwiat', 'sk', 'teacher'),
+(17, 'hwolt@uw.edu.pl', 'Halina', 'Wolt', 'hw', 'teacher'),
+(18, 'mstar@uw.edu.pl', 'Maciej', 'Star', 'ms', 'teacher'),
+(19, 'fgoliat@uw.edu.pl', 'Fryderyk', 'Goliat', 'fb', 'teacher'),
+(20, 'bwidok@uw.edu.pl', 'Barbara', 'Widok', 'bw', 'teacher'),
+(21, 'mskoczek@uw.edu.pl', 'Marcin', 'Skoczek', 'ms', 'teacher'),
+(22, 'gplon@uw.edu.pl', 'Gabriel', 'Plon', 'gp', 'teacher'),
+(23, 'ewalicowa@uw.edu.pl', 'Ewa', 'Walicowa', 'ew', 'teacher'),
+(24, 'aadams@student.uw.edu.pl', 'Adam', 'Adams', 'aa', 'student'),
+(25, 'aallen@student.uw.edu.pl', 'Adrian', 'Allen', 'aa', 'student'),
+(26, 'aanderson@student.uw.edu.pl', 'Agata', 'Anderson', 'aa', 'student'),
+(27, 'abaker@student.uw.edu.pl', 'Alan', 'Baker', 'ab', 'student'),
+(28, 'abarnes@student.uw.edu.pl', 'Albert', 'Barnes', 'ab', 'student'),
+(29, 'abennett@student.uw.edu.pl', 'Aleksander', 'Bennett', 'ab', 'student'),
+(30, 'abrooks@student.uw.edu.pl', 'Aleksandra', 'Brooks', 'ab', 'student'),
+(31, 'abrown@student.uw.edu.pl', 'Alex', 'Brown', 'ab', 'student'),
+(32, 'abryant@student.uw.edu.pl', 'Alexandra', 'Bryant', 'ab', 'student'),
+(33, 'aburke@student.uw.edu.pl', 'Alicia', 'Burke', 'ab', 'student'),
+(34, 'abutler@student.uw.edu.pl', 'Amelia', 'Butler', 'ab', 'student'),
+(35, 'acampbell@student.uw.edu.pl', 'Andre', 'Campbell', 'ac', 'student'),
+(36, 'acarter@student.uw.edu.pl', 'Andrea', 'Carter', 'ac', 'student'),
+(37, 'aclark@student.uw.edu.pl', 'Andrew', 'Clark', 'ac', 'student'),
+(38, 'acoleman@student.uw.edu.pl', 'Anita', 'Coleman', 'ac', 'student'),
+(39, 'acollins@student.uw.edu.pl', 'Anthony', 'Collins', 'ac', 'student'),
+(40, 'acook@student.uw.edu.pl', 'Anton', 'Cook', 'ac', 'student'),
+(41, 'acooper@student.uw.edu.pl', 'Ariel', 'Cooper', 'ac', 'student'),
+(42, 'acox@student.uw.edu.pl', 'Arthur', 'Cox', 'ac', 'student'),
+(43, 'acrawford@student.uw.edu.pl', 'Arthur', 'Crawford', 'ac', 'student'),
+(44, 'acruz@student.uw.edu.pl', 'Audrey', 'Cruz', 'ac', 'student'),
+(45, 'adavis@student.uw.edu.pl', 'Austin', 'Davis', 'ad', 'student'),
+(46, 'bdiaz@student.uw.edu.pl', 'Barbara', 'Diaz', 'bd', 'student'),
+(47, 'bedwards@student.uw.edu.pl', 'Bart', 'Edwards', 'be', 'student'),
+(48, 'bevans@student.uw.edu.pl', 'Ben', 'Evans', 'be', 'student'),
+(49, 'bfisher@student.uw.edu.pl', 'Benjamin', 'Fisher', 'bf', 'student'),
+(50, 'bflores@student.uw.edu.pl', 'Bernard', 'Flores', 'bf', 'student'),
+(51, 'bfoster@student.uw.edu.pl', 'Bianca', 'Foster', 'bf', 'student'),
+(52, 'bgarcia@student.uw.edu.pl', 'Bill', 'Garcia', 'bg', 'student'),
+(53, 'bgardner@student.uw.edu.pl', 'Brian', 'Gardner', 'bg', 'student'),
+(54, 'bgibson@student.uw.edu.pl', 'Bridget', 'Gibson', 'bg', 'student'),
+(55, 'bgonzalez@student.uw.edu.pl', 'Bruce', 'Gonzalez', 'bg', 'student'),
+(56, 'cgray@student.uw.edu.pl', 'Clara', 'Gray', 'cg', 'student'),
+(57, 'cgreen@student.uw.edu.pl', 'Carmen', 'Green', 'cg', 'student'),
+(58, 'cgriffin@student.uw.edu.pl', 'Carol', 'Griffin', 'cg', 'student'),
+(59, 'chall@student.uw.edu.pl', 'Caroline', 'Hall', 'ch', 'student'),
+(60, 'chamilton@student.uw.edu.pl', 'Charles', 'Hamilton', 'ch', 'student'),
+(61,"charris@student.uw.edu.pl","Charlotte","Harris",'ch',"student"),
+(62,"chayes@student.uw.edu.pl","Cheryl","Hayes",'ch',"student"),
+(63,"chenderson@student.uw.edu.pl","Chris","Henderson",'ch',"student"),
+(64,"chernandez@student.uw.edu.pl","Christian","Hernandez",'ch',"student"),
+(65,"chill@student.uw.edu.pl","Christina","Hill",'ch',"student"),
+(66,"choffman@student.uw.edu.pl","Christopher","Hoffman",'ch',"student"),
+(67,"chughes@student.uw.edu.pl","Cindy","Hughes",'ch',"student"),
+(68,"cjackson@student.uw.edu.pl","Claire","Jackson",'cj',"student"),
+(69,"cjames@student.uw.edu.pl","Clara","James",'cj',"student"),
+(70,"cjenkins@student.uw.edu.pl","Clarence","Jenkins",'cj',"student"),
+(71,"cjohnson@student.uw.edu.pl","Claudia","Johnson",'cj',"student"),
+(72,"cjones@student.uw.edu.pl","Connor","Jones",'cj',"student"),
+(73,"cjordan@student.uw.edu.pl","Craig","Jordan",'cj',"student"),
+(74,"ckelly@student.uw.edu.pl","Crystal","Kelly",'ck',"student"),
+(75,"ckennedy@student.uw.edu.pl","Curtis","Kennedy",'ck',"student"),
+(76,"cking@student.uw.edu.pl","Cynthia","King",'ck',"student"),
+(77,"dlee@student.uw.edu.pl","Damien","Lee",'dl',"student"),
+(78,"dlewis@student.uw.edu.pl","Dana","Lewis",'dl',"student"),
+(79,"dlong@student.uw.edu.pl","Daniel","Long",'dl',"student"),
+(80,"dlopez@student.uw.edu.pl","Danielle","Lopez",'dl',"student"),
+(81,"dmartinez@student.uw.edu.pl","David","Martinez",'dm',"student"),
+(82,"dmason@student.uw.edu.pl","David","Mason",'dm',"student"),
+(83,"dmatthews@student.uw.edu.pl","Denise","Matthews",'dm',"student"),
+(84,"dmiller@student.uw.edu.pl","Dennis","Miller",'dm',"student"),
+(85,"dmitchell@student.uw.edu.pl","Diana","Mitchell",'dm',"student"),
+(86,"dmoore@student.uw.edu.pl","Diane","Moore",'dm',"student"),
+(87,"dmorales@student.uw.edu.pl","Donald","Morales",'dm',"student"),
+(88,"dmorgan@student.uw.edu.pl","Donna","Morgan",'dm',"student"),
+(89,"dmorris@student.uw.edu.pl","Doris","Morris",'dm',"student"),
+(90,"dmurphy@student.uw.edu.pl","Douglas","Murphy",'dm',"student"),
+(91,"dnelson@student.uw.edu.pl","Dylan","Nelson",'dn',"student"),
+(92,"enguyen@student.uw.edu.pl","Edith","Nguyen",'en',"student"),
+(93,"eortiz@student.uw.edu.pl","Edward","Ortiz",'eo',"student"),
+(94,"eparker@student.uw.edu.pl","Elaine","Parker",'ep',"student"),
+(95,"epatel@student.uw.edu.pl","Eleanor","Patel",'ep',"student"),
+(96,"epeterson@student.uw.edu.pl","Elizabeth","Peterson",'ep',"student"),
+(97,"ephillips@student.uw.edu.pl","Ella","Phillips",'ep',"student"),
+(98,"epowell@student.uw.edu.pl","Emily","Powell",'ep',"student"),
+(99,"eprice@student.uw.edu.pl","Emma","Price",'ep',"student"),
+(100,"eramirez@student.uw.edu.pl","Eric","Ramirez",'er',"student"),
+(101,"ereed@student.uw.edu.pl","Erica","Reed",'er',"student"),
+(102,"ereyes@student.uw.edu.pl","Erik","Reyes",'er',"student"),
+(103,"ereynolds@student.uw.edu.pl","Erin","Reynolds",'er',"student"),
+(104,"erichardson@student.uw.edu.pl","Ethan","Richardson",'er',"student"),
+(105,"erivera@student.uw.edu.pl","Eugene","Rivera",'er',"student"),
+(106,"eroberts@student.uw.edu.pl","Eva","Roberts",'er',"student"),
+(107,"erobinson@student.uw.edu.pl","Evan","Robinson",'er',"student"),
+(108,"erodriguez@student.uw.edu.pl","Evelyn","Rodriguez",'er',"student"),
+(109,"frogers@student.uw.edu.pl","Frances","Rogers",'fr',"student"),
+(110,"fross@student.uw.edu.pl","Frank","Ross",'fr',"student"),
+(111,"grussel@student.uw.edu.pl","Gabriela","Russel",'gr',"student"),
+(112,"gryan@student.uw.edu.pl","Gabriel","Ryan",'gr',"student"),
+(113,"gsanchez@student.uw.edu.pl","Gabriel","Sanchez",'gs',"student"),
+(114,"gsanders@student.uw.edu.pl","Gary","Sanders",'gs',"student"),
+(115,"gscott@student.uw.edu.pl","George","Scott",'gs',"student"),
+(116,"gsimmons@student.uw.edu.pl","Gerald","Simmons",'gs',"student"),
+(117,"gsmith@student.uw.edu.pl","Gloria","Smith",'gs',"student"),
+(118,"gsnyder@student.uw.edu.pl","Grace","Snyder",'gs',"student"),
+(119,"gspencer@student.uw.edu.pl","Gregory","Spencer",'gs',"student"),
+(120,"hstewart@student.uw.edu.pl","Hannah","Stewart",'hs',"student"),
+(121,"htaylor@student.uw.edu.pl","Harold","Taylor",'ht',"student"),
+(122,"hthomas@student.uw.edu.pl","Harry","Thomas",'ht',"student"),
+(123,"hthompson@student.uw.edu.pl","Heather","Thompson",'ht',"student"),
+(124,"htorres@student.uw.edu.pl","Helen","Torres",'ht',"student"),
+(125,"hturner@student.uw.edu.pl","Henry","Turner",'ht',"student"),
+(126,"hvasquez@student.uw.edu.pl","Howard","Vasquez",'hv',"student"),
+(127,"iwagner@student.uw.edu.pl","Ian","Wagner",'iw',"student"),
+(128,"iwalker@student.uw.edu.pl","Ingrid","Walker",'iw',"student"),
+(129,"iwallace@student.uw.edu.pl","Irene","Wallace",'iw',"student"),
+(130,"iward@student.uw.edu.pl","Iris","Ward",'iw',"student"),
+(131,"iwarren@student.uw.edu.pl","Isabel","Warren",'iw',"student"),
+(132,"jwashington@student.uw.edu.pl","Jack","Washington",'jw',"student"),
+(133,"jwatson@student.uw.edu.pl","Jackson","Watson",'jw',"student"),
+(134,"jwhite@student.uw.edu.pl","Jacob","White",'jw',"student"),
+(135,"jwilliams@student.uw.edu.pl","Jacqueline","Williams",'jw',"student"),
+(136,"jwilson@student.uw.edu.pl","James","Wilson",'jw',"student"),
+(137,"jwood@student.uw.edu.pl","Jamie","Wood",'jw',"student"),
+(138,"jwright@student.uw.edu.pl","Jan","Wright",'jw',"student"),
+(139,"jyoung@student.uw.edu.pl","Jane","Young",'jy',"student"),
+(140,"jadams@student.uw.edu.pl","Janet","Adams",'ja',"student"),
+(141,"jallen@student.uw.edu.pl","Janice","Allen",'ja',"student"),
+(142,"janderson@student.uw.edu.pl","Jason","Anderson",'ja',"student"),
+(143,"jbaker@student.uw.edu.pl","Jean","Baker",'jb',"student"),
+(144,"jbarnes@student.uw.edu.pl","Jeffrey","Barnes",'jb',"student"),
+(145,"jbennet@student.uw.edu.pl","Jenna","Bennett",'jb',"student"),
+(146,"jbrooks@student.uw.edu.pl","Jennifer","Brooks",'jb',"student"),
+(147,"jbrown@student.uw.edu.pl","Jerry","Brown",'jb',"student"),
+(148,"jbryant@student.uw.edu.pl","Jesse","Bryant",'jb',"student"),
+(149,"jbruke@student.uw.edu.pl","Jessica","Bruke",'jb',"student"),
+(150,"jbutler@student.uw.edu.pl","Jim","Butler",'jb',"student"),
+(151,"jcampbell@student.uw.edu.pl","Joan","Campbell",'jc',"student"),
+(152,"jcarter@student.uw.edu.pl","Joanna","Carter",'jc',"student"),
+(153,"jclark@student.uw.edu.pl","Joe","Clark",'jc',"student"),
+(154,"jcoleman@student.uw.edu.pl","John","Coleman",'jc',"student"),
+(155,"jcollins@student.uw.edu.pl","Jonathan","Collins",'jc',"student"),
+(156,"jcook@student.uw.edu.pl","Jordan","Cook",'jc',"student"),
+(157,"jcooper@student.uw.edu.pl","Joseph","Cooper",'jc',"student"),
+(158,"jcox@student.uw.edu.pl","Joshua","Cox",'jc',"student"),
+(159,"jcrawford@student.uw.edu.pl","Joyce","Crawford",'jc',"student"),
+(160,"jcruz@student.uw.edu.pl","Juan","Cruz",'jc',"student"),
+(161,"jdavis@student.uw.edu.pl","Judy","Davis",'jd',"student"),
+(162,"jdiaz@student.uw.edu.pl","Julia","Diaz",'jd',"student"),
+(163,"jedwards@student.uw.edu.pl","Julian","Edwards",'je',"student"),
+(164,"jevans@student.uw.edu.pl","Julie","Evans",'je',"student"),
+(165,"jfisher@student.uw.edu.pl","Justin","Fisher",'jf',"student"),
+(166,"kflores@student.uw.edu.pl","Karen","Flores",'kf',"student"),
+(167,"kfoster@student.uw.edu.pl","Karl","Foster",'kf',"student"),
+(168,"kgarcia@student.uw.edu.pl","Kate","Garcia",'kg',"student"),
+(169,"kgardner@student.uw.edu.pl","Kate","Gardner",'kg',"student"),
+(170,"kgibson@student.uw.edu.pl","Kathleen","Gibson",'kg',"student"),
+(171,"kgonzalez@student.uw.edu.pl","Kathryn","Gonzalez",'kg',"student"),
+(172,"kgray@student.uw.edu.pl","Kathy","Gray",'kg',"student"),
+(173,"kgreen@student.uw.edu.pl","Katie","Green",'kg',"student"),
+(174,"kgriffin@student.uw.edu.pl","Keith","Griffin",'kg',"student"),
+(175,"khall@student.uw.edu.pl","Kelly","Hall",'kh',"student"),
+(176,"khamilton@student.uw.edu.pl","Kenneth","Hamilton",'kh',"student"),
+(177,"kharris@student.uw.edu.pl","Kevin","Harris",'kh',"student"),
+(178,"khayes@student.uw.edu.pl","Kim","Hayes",'kh',"student"),
+(179,"khenderson@student.uw.edu.pl","Kimberly","Henderson",'kh',"student"),
+(180,"khernandez@student.uw.edu.pl","Kristen","Hernandez",'kh',"student"),
+(181,"khill@student.uw.edu.pl","Kyle","Hill",'kh',"student"),
+(182,"lhoffman@student.uw.edu.pl","Laura","Hoffman",'lh',"student"),
+(183,"lhughes@student.uw.edu.pl","Lauren","Hughes",'lh',"student"),
+(184,"ljackson@student.uw.edu.pl","Lawrence","Jackson",'lj',"student"),
+(185,"ljames@student.uw.edu.pl","Leah","James",'lj',"student"),
+(186,"ljenkins@student.uw.edu.pl","Lee","Jenkins",'lj',"student"),
+(187,"ljohnson@student.uw.edu.pl","Leonard","Johnson",'lj',"student"),
+(188,"ljones@student.uw.edu.pl","Leslie","Jones",'lj',"student"),
+(189,"ljordan@student.uw.edu.pl","Liam","Jordan",'lj',"student"),
+(190,"lkelly@student.uw.edu.pl","Lillian","Kelly",'lk',"student"),
+(191,"lkennedy@student.uw.edu.pl","Linda","Kennedy",'lk',"student"),
+(192,"lking@student.uw.edu.pl","Lisa","King",'lk',"student"),
+(193,"llee@student.uw.edu.pl","Lois","Lee",'ll',"student"),
+(194,"llewis@student.uw.edu.pl","Lori","Lewis",'ll',"student"),
+(195,"llong@student.uw.edu.pl","Louise","Long",'ll',"student"),
+(196,"llopez@student.uw.edu.pl","Lucas","Lopez",'ll',"student"),
+(197,"lmartinez@student.uw.edu.pl","Lucy","Martinez",'lm',"student"),
+(198,"lmason@student.uw.edu.pl","Luis","Mason",'lm',"student"),
+(199,"lmatthews@student.uw.edu.pl","Luke","Matthews",'lm',"student"),
+(200,"lmiller@student.uw.edu.pl","Lyndia","Miller",'lm',"student"),
+(201,"lmitchell@student.uw.edu.pl","Lynn","Mitchell",'lm',"student"),
+(202,"mmoore@student.uw.edu.pl","Maggie","Moore",'mm',"student"),
+(203,"mmorales@student.uw.edu.pl","Marc","Morales",'mm',"student"),
+(204,"mmorgan@student.uw.edu.pl","Margaret","Morgan",'mm',"student"),
+(205,"mmorris@student.uw.edu.pl","Maria","Morris",'mm',"student"),
+(206,"mmurphy@student.uw.edu.pl","Marian","Murphy",'mm',"student"),
+(207,"mnelson@student.uw.edu.pl","Marie","Nelson",'mn',"student"),
+(208,"mnguyen@student.uw.edu.pl","Marilyn","Nguyen",'mn',"student"),
+(209,"mortiz@student.uw.edu.pl","Mark","Ortiz",'mo',"student"),
+(210,"mparker@student.uw.edu.pl","Marsha","Parker",'mp',"student"),
+(211,"mpatel@student.uw.edu.pl","Martin","Patel",'mp',"student"),
+(212,"mpeterson@student.uw.edu.pl","Mary","Peterson",'mp',"student"),
+(213,"mphillips@student.uw.edu.pl","Matthew","Phillips",'mp',"student"),
+(214,"mpowell@student.uw.edu.pl","Megan","Powell",'mp',"student"),
+(215,"mprice@student.uw.edu.pl","Melanie","Price",'mp',"student"),
+(216,"mramirez@student.uw.edu.pl","Melissa","Ramirez",'mr',"student"),
+(217,"mreed@student.uw.edu.pl","Michael","Reed",'mr',"student"),
+(218,"mreyes@student.uw.edu.pl","Michelle","Reyes",'mr',"student"),
+(219,"mreynolds@student.uw.edu.pl","Mike","Reynolds",'mr',"student"),
+(220,"mrichardson@student.uw.edu.pl","Molly","Richardson",'mr',"student"),
+(221,"mrivera@student.uw.edu.pl","Monica","Rivera",'mr',"student"),
+(222,"mroberts@student.uw.edu.pl","Morgan","Roberts",'mr',"student"),
+(223,"nrobinson@student.uw.edu.pl","Nancy","Robinson",'nr',"student"),
+(224,"nrodriguez@student.uw.edu.pl","Naomi","Rodriguez",'nr',"student"),
+(225,"nrogers@student.uw.edu.pl","Natalie","Rogers",'nr',"student"),
+(226,"nross@student.uw.edu.pl","Nathan","Ross",'nr',"student"),
+(227,"nrussell@student.uw.edu.pl","Nathan","Russell",'nr',"student"),
+(228,"nryan@student.uw.edu.pl","Nicole","Ryan",'nr',"student"),
+(229,"nsanchez@student.uw.edu.pl","Nina","Sanchez",'ns',"student"),
+(230,"nsanders@student.uw.edu.pl","Noah","Sanders",'ns',"student"),
+(231,"nscott@student.uw.edu.pl","Norma","Scott",'ns',"student"),
+(232,"osimmons@student.uw.edu.pl","Olivier","Simmons",'os',"student"),
+(233,"osmith@student.uw.edu.pl","Olivia","Smith",'os',"student"),
+(234,"osnyder@student.uw.edu.pl","Oscar","Snyder",'os',"student"),
+(235,"ospencer@student.uw.edu.pl","Owen","Spencer",'os',"student"),
+(236,"pstewart@student.uw.edu.pl","Pamela","Stewart",'ps',"student"),
+(237,"ptaylor@student.uw.edu.pl","Patricia","Taylor",'pt',"student"),
+(238,"pthomas@student.uw.edu.pl","Patrick","Thomas",'pt',"student"),
+(239,"pthompson@student.uw.edu.pl","Paul","Thompson",'pt',"student"),
+(240,"ptorres@student.uw.edu.pl","Paula","Torres",'pt',"student"),
+(241,"ptuner@student.uw.edu.pl","Peggy","Tuner",'pt',"student"),
+(242,"pvasquez@student.uw.edu.pl","Peter","Vasquez",'pv',"student"),
+(243,"pwagner@student.uw.edu.pl","Philip","Wagner",'pw',"student"),
+(244,"pwalker@student.uw.edu.pl","Phylis","Walker",'pw',"student"),
+(245,"rwallace@student.uw.edu.pl","Rachel","Wallace",'rw',"student"),
+(246,"rward@student.uw.edu.pl","Ralph","Ward",'rw',"student"),
+(247,"rwarren@student.uw.edu.pl","Raymond","Warren",'rw',"student"),
+(248,"rwashington@student.uw.edu.pl","Rebecca","Washington",'rw',"student"),
+(249,"rwatson@student.uw.edu.pl","Regina","Watson",'rw',"student"),
+(250,"rwhite@student.uw.edu.pl","Renee","White",'rw',"student"),
+(251,"rwilliams@student.uw.edu.pl","Richard","Williams",'rw',"student"),
+(252,"rwilson@student.uw.edu.pl","Rita","Wilson",'rw',"student"),
+(253,"rwood@student.uw.edu.pl","Robert","Wood",'rw',"student"),
+(254,"rwright@student.uw.edu.pl","Robin","Wright",'rw',"student"),
+(255,"ryoung@student.uw.edu.pl","Roger","Young",'ry',"student"),
+(256,"radams@student.uw.edu.pl","Ronald","Adams",'ra',"student"),
+(257,"rallen@student.uw.edu.pl","Rose","Allen",'ra',"student"),
+(258,"radnerson@student.uw.edu.pl","Ruby","Anderson",'ra',"student"),
+(259,"rbaker@student.uw.edu.pl","Russell","Baker",'rb',"student"),
+(260,"rbarnes@student.uw.edu.pl","Ryan","Barnes",'rb',"student"),
+(261,"sbennet@student.uw.edu.pl","Sabina","Bennet",'sb',"student"),
+(262,"sbrooks@student.uw.edu.pl","Samuel","Brooks",'sb',"student"),
+(263,"sbrown@student.uw.edu.pl","Sandra","Brown",'sb',"student"),
+(264,"sbryant@student.uw.edu.pl","Sara","Bryant",'sb',"student"),
+(265,"sburke@student.uw.edu.pl","Sarah","Burke",'sb',"student"),
+(266,"sbutler@student.uw.edu.pl","Scott","Butler",'sb',"student"),
+(267,"scampbell@student.uw.edu.pl","Sean","Campbell",'sc',"student"),
+(268,"scarter@student.uw.edu.pl","Seth","Carter",'sc',"student"),
+(269,"sclark@student.uw.edu.pl","Shane","Clark",'sc',"student"),
+(270,"scoleman@student.uw.edu.pl","Shannon","Coleman",'sc',"student"),
+(271,"scollins@student.uw.edu.pl","Sharon","Collins",'sc',"student"),
+(272,"scook@student.uw.edu.pl","Shelia","Cook",'sc',"student"),
+(273,"scooper@student.uw.edu.pl","Shelley","Cooper",'sc',"student"),
+(274,"scox@student.uw.edu.pl","Sherri","Cox",'sc',"student"),
+(275,"scrawford@student.uw.edu.pl","Shirley","Crawford",'sc',"student"),
+(276,"scruz@student.uw.edu.pl","Sidney","Cruz",'sc',"student"),
+(277,"sdavis@student.uw.edu.pl","Sophia","Davis",'sd',"student"),
+(278,"sdiaz@student.uw.edu.pl","Sofia","Diaz",'sd',"student"),
+(279,"sedwards@student.uw.edu.pl","Stanley","Edwards",'se',"student"),
+(280,"sevans@student.uw.edu.pl","Stephanie","Evans",'se',"student"),
+(281,"sfisher@student.uw.edu.pl","Stephen","Fisher",'sf',"student"),
+(282,"sflores@student.uw.edu.pl","Steve","Flores",'sf',"student"),
+(283,"sfoster@student.uw.edu.pl","Steven","Foster",'sf',"student"),
+(284,"sgarcia@student.uw.edu.pl","Susan","Garcia",'sg',"student"),
+(285,"sgardner@student.uw.edu.pl","Suzanne","Gardner",'sg',"student"),
+(286,"sgibson@student.uw.edu.pl","Sylvia","Gibson",'sg',"student"),
+(287,"tgonzalez@student.uw.edu.pl","Tamara","Gonzalez",'tg',"student"),
+(288,"tgray@student.uw.edu.pl","Tanya","Gray",'tg',"student"),
+(289,"tgreen@student.uw.edu.pl","Taylor","Green",'tg',"student"),
+(290,"tgriffin@student.uw.edu.pl","Teresa","Griffin",'tg',"student"),
+(291,"thall@student.uw.edu.pl","Terry","Hall",'th',"student"),
+(292,"thamilton@student.uw.edu.pl","Theodore","Hamilton",'th',"student"),
+(293,"tharris@student.uw.edu.pl","Theresa","Harris",'th',"student"),
+(294,"thayes@student.uw.edu.pl","Thomas","Hayes",'th',"student"),
+(295,"thenderson@student.uw.edu.pl","Tiffany","Henderson",'th',"student"),
+(296,"thernandez@student.uw.edu.pl","Timothy","Hernandez",'th',"student"),
+(297,"thill@student.uw.edu.pl","Tina","Hill",'th',"student"),
+(298,"thoffman@student.uw.edu.pl","Todd","Hoffman",'th',"student"),
+(299,"thughes@student.uw.edu.pl","Tony","Hughes",'th',"student"),
+(300,"tjackson@student.uw.edu.pl","Tracy","Jackson",'tj',"student"),
+(301,"tjames@student.uw.edu.pl","Travis","James",'tj',"student"),
+(302,"tjenkins@student.uw.edu.pl","Trevor","Jenkins",'tj',"student"),
+(303,"tjohnson@student.uw.edu.pl","Tyler","Johnson",'tj',"student"),
+(304,"vjones@student.uw.edu.pl","Valerie","Jones",'vj',"student"),
+(305,"vjordan@student.uw.edu.pl","Vanessa","Jordan",'vj',"student"),
+(306,"vkelly@student.uw.edu.pl","Vera","Kelly",'vk',"student"),
+(307,"vkennedy@student.uw.edu.pl","Veronica","Kennedy",'vk',"student"),
+(308,"vking@student.uw.edu.pl","Victor","King",'vk',"student"),
+(309,"vlee@student.uw.edu.pl","Victoria","Lee",'vl',"student"),
+(310,"vlewis@student.uw.edu.pl","Vincent","Lewis",'vl',"student"),
+(311,"vlong@student.uw.edu.pl","Virginia","Long",'vl',"student"),
+(312,"vlopez@student.uw.edu.pl","Vivian","Lopez",'vl',"student"),
+(313,"wmartinez@student.uw.edu.pl","Walter","Martinez",'wm',"student"),
+(314,"wmason@student.uw.edu.pl","Watter","Mason",'wm',"student"),
+(315,"wmatthews@student.uw.edu.pl","Wayne","Matthews",'wm',"student"),
+(316,"wmiller@student.uw.edu.pl","Wendy","Miller",'wm',"student"),
+(317,"wmitchell@student.uw.edu.pl","Wesley","Mitchell",'wm',"student"),
+(318,"wmoore@student.uw.edu.pl","Willian","Moore",'wm',"student"),
+(319,"wmorales@student.uw.edu.pl","Willie","Morales",'wm',"student"),
+(320,"xmorgan@student.uw.edu.pl","Xavier","Morgan",'xm',"student"),
+(321,"ymorris@student.uw.edu.pl","Yvonne","Morris",'ym',"student"),
+(322,"zmurphy@student.uw.edu.pl","Zachary","Murphy",'zm',"student"),
+(323,"znelson@student.uw.edu.pl","Zoe","Nelson",'zn',"student")
 ]
 
 assign_data = [
@@ -0,0 +1,85 @@
+import os
+import threading
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from werkzeug.security import generate_password_hash, check_password_hash
+
+# Hashing of passwords. pbkdf2 is slow on purpose (about 0.1-0.5 s for one password),
+# so many passwords (e.g. seeding the database) are hashed in parallel processes
+# and logins check passwords in a bounded pool of processes (PasswordPool), not on request threads.
+
+HASH_METHOD = 'pbkdf2:sha256'
+
+# Value saved in database is already a hash (e.g. copied from other database), it is not hashed again
+def is_password_hash(value):
+    return value.startswith(('pbkdf2:', 'scrypt:'))
+
+# Hashes of many passwords in the same order, calculated in a pool of processes (workers = number of CPUs by default)
+def hash_passwords(passwords, method=HASH_METHOD, workers=None):
+    passwords = list(passwords)
+    to_hash = [password for password in passwords if not is_password_hash(password)]
+    workers = min(workers or os.cpu_count() or 1, len(to_hash))
+    if workers <= 1:
+        hashes = [generate_password_hash(password, method=method) for password in to_hash]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            hashes = list(executor.map(partial(generate_password_hash, method=method), to_hash,
+                                       chunksize=max(len(to_hash) // (workers * 4), 1)))
+    hashes = iter(hashes)
+    return [password if is_password_hash(password) else next(hashes) for password in passwords]
+
+# Raised when too many passwords are waiting for the pool (e.g. whole school logs in at 8:00), request gets 503
+class PasswordPoolBusy(Exception):
+    pass
+
+# Pool of processes which hash and check passwords. At most workers + max_queue passwords are in the pool,
+# next request fails at once (PasswordPoolBusy) instead of waiting and blocking its thread.
+# Processes are started with the first password, not at import.
+class PasswordPool():
+
+    def __init__(self, method=HASH_METHOD, workers=None, max_queue=32, timeout=10):
+        self.method = method # Hash method of new hashes, e.g. pbkdf2:sha256, pbkdf2:sha256:1000000, scrypt
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout # Maximum time (seconds) of waiting for one password
+        self._slots = threading.BoundedSemaphore(self.workers + max_queue)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _run(self, function, *args):
+        if not self._slots.acquire(blocking=False):
+            raise PasswordPoolBusy('Too many passwords are checked right now.')
+        try:
+            if self._executor is None:
+                with self._lock:
+                    if self._executor is None:
+                        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            future = self._executor.submit(function, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # Slot is free when the password is really checked (or removed from queue), not when the request
+        # stops waiting, so passwords of requests which timed out still count to workers + max_queue
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            future.cancel() # Only possible if the password is still waiting in queue
+            raise PasswordPoolBusy(f'Password was not checked in {self.timeout} seconds.')
+
+    def check(self, password_hash, password):
+        return self._run(check_password_hash, password_hash, password)
+
+    def hash(self, password):
+        return self._run(partial(generate_password_hash, method=self.method), password)
+
+    # Hash was made with other method or parameters than the current ones (only given parameters are compared,
+    # e.g. pbkdf2:sha256 accepts any number of iterations, pbkdf2:sha256:1000000 only 1000000)
+    def needs_rehash(self, password_hash):
+        wanted = self.method.split(':')
+        used = password_hash.split('$', 1)[0].split(':')
+        return used[:len(wanted)] != wanted
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
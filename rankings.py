@@ -0,0 +1,96 @@
+# Stored rankings of students in class, overall and for every subject, and their positions in the whole school.
+# Triggers on grade_aggregate and student (migrations 3 and 6) write the class to ranking_dirty when grades of its
+# students change, the ranking of this class is calculated again before it is read (only this class, other classes
+# keep their rows). Position in the school is not stored, it is counted when it is read (school_rank_sql), so
+# refresh of one class doesn't change rows of the whole school. Changed classes which were not read yet are counted
+# with their previous averages. Classes are ranked for the first time off requests: by migrations, init-db,
+# generate-dataset and flask --app main rebuild-rankings (all classes at once).
+# subject_id = 0 in student_ranking means ranking by average from all subjects.
+
+OVERALL = 0
+
+# Averages are saved and ranked rounded to 9 decimal places. The same average calculated from sums added in other
+# order (grade_aggregate, analytics.py) can differ in the last bit (3.0 and 2.9999999999999996), after rounding
+# equal averages are really equal and students are ordered by id, whichever code calculated the ranking.
+RANK_DIGITS = 9
+
+# SQL expression with position in school of the student_ranking row ranking (alias of the table in query):
+# students of the same subject with higher average or the same average and smaller id, + 1.
+# Both counts are ranges of idx_student_ranking_subject (migration 7).
+def school_rank_sql(ranking):
+    return f'''((SELECT COUNT(*) FROM student_ranking other
+                 WHERE other.subject_id = {ranking}.subject_id AND other.average > {ranking}.average)
+                + (SELECT COUNT(*) FROM student_ranking other
+                   WHERE other.subject_id = {ranking}.subject_id AND other.average = {ranking}.average
+                   AND other.student_id < {ranking}.student_id) + 1)'''
+
+# Dirty classes which are refreshed: all of them or only class_id
+def dirty_classes(class_id):
+    if class_id is None:
+        return 'SELECT class_id FROM ranking_dirty'
+    return 'SELECT class_id FROM ranking_dirty WHERE class_id = :class_id'
+
+# Calculate again rankings of changed classes (all or only class_id), returns True if anything was changed
+def refresh_rankings(conn, class_id=None):
+    if conn.execute(f'{dirty_classes(class_id)} LIMIT 1', {'class_id': class_id}).fetchone() is None:
+        return False
+    return recalculate_rankings(conn, class_id)
+
+# The same without the first check, for callers which already read that ranking_dirty has rows (one transaction)
+def recalculate_rankings(conn, class_id=None):
+    conn.execute('BEGIN IMMEDIATE') # Other request could refresh the same classes at the same time
+    try:
+        if conn.execute(f'{dirty_classes(class_id)} LIMIT 1', {'class_id': class_id}).fetchone() is None:
+            conn.rollback()
+            return False
+        rank_classes(conn, class_id)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return True
+
+# Statements of the refresh, in transaction of the caller (also used by migrations)
+def rank_classes(conn, class_id=None):
+    dirty = dirty_classes(class_id)
+    params = {'class_id': class_id}
+    # Rows of these classes and of students who are in them now (student moved from other class)
+    conn.execute(f'DELETE FROM student_ranking WHERE class_id IN ({dirty})', params)
+    conn.execute(f'''DELETE FROM student_ranking
+                     WHERE student_id IN (SELECT id FROM student WHERE class_id IN ({dirty}))''', params)
+    # Ranking by average from all subjects
+    conn.execute(f'''INSERT INTO student_ranking (student_id, subject_id, class_id, average, class_rank)
+                     SELECT s.id, {OVERALL}, s.class_id, ROUND(SUM(ga.weighted_sum) / SUM(ga.total_weight), {RANK_DIGITS}),
+                            ROW_NUMBER() OVER (PARTITION BY s.class_id
+                                               ORDER BY ROUND(SUM(ga.weighted_sum) / SUM(ga.total_weight), {RANK_DIGITS}) DESC, s.id)
+                     FROM student s
+                     JOIN grade_aggregate ga ON ga.student_id = s.id
+                     WHERE s.class_id IN ({dirty}) AND ga.grade_count > 0
+                     GROUP BY s.id
+                     HAVING SUM(ga.total_weight) > 0''', params)
+    # Ranking by average from every subject
+    conn.execute(f'''INSERT INTO student_ranking (student_id, subject_id, class_id, average, class_rank)
+                     SELECT s.id, ga.subject_id, s.class_id, ROUND(ga.weighted_sum / ga.total_weight, {RANK_DIGITS}),
+                            ROW_NUMBER() OVER (PARTITION BY s.class_id, ga.subject_id
+                                               ORDER BY ROUND(ga.weighted_sum / ga.total_weight, {RANK_DIGITS}) DESC, s.id)
+                     FROM student s
+                     JOIN grade_aggregate ga ON ga.student_id = s.id
+                     WHERE s.class_id IN ({dirty})
+                     AND ga.grade_count > 0 AND ga.total_weight > 0''', params)
+    conn.execute(f'DELETE FROM ranking_dirty WHERE class_id IN ({dirty})', params)
+
+# Position of the student (class_rank, school_rank, average), None if the student has no grades
+def student_rank(conn, student_id, subject_id=OVERALL):
+    student = conn.execute('SELECT class_id FROM student WHERE id = ?', (student_id,)).fetchone()
+    if student is None or student[0] is None:
+        return None
+    refresh_rankings(conn, student[0])
+    return conn.execute(f'''SELECT r.class_rank, {school_rank_sql('r')}, r.average FROM student_ranking r
+                            WHERE r.student_id = ? AND r.subject_id = ?''', (student_id, subject_id)).fetchone()
+
+# Ranking of one class [(student_id, average, class_rank)], the best student first
+def class_ranking(conn, class_id, subject_id=OVERALL):
+    refresh_rankings(conn, class_id)
+    return conn.execute('''SELECT student_id, average, class_rank FROM student_ranking
+                           WHERE class_id = ? AND subject_id = ?
+                           ORDER BY class_rank''', (class_id, subject_id)).fetchall()
@@ -0,0 +1,24 @@
+import os
+import shutil
+
+# Snapshots of the database: a ready database file (schema, migrations, data) is copied in milliseconds
+# instead of seeding or generating data again, e.g. for tests and new dev environments.
+
+# Write a compact copy of the database to a new file (VACUUM INTO reads one consistent state, app can be running)
+def create_snapshot(conn, path):
+    if os.path.exists(path):
+        raise FileExistsError(f'Snapshot {path} already exists.')
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    conn.execute('VACUUM INTO ?', (path,))
+
+# Replace the database file with a copy of the snapshot, old WAL files are removed (they belong to the old database).
+# Nobody can use the database during restore.
+def restore_snapshot(path, database):
+    if not os.path.exists(path):
+        raise FileNotFoundError(f'Snapshot {path} does not exist.')
+    for suffix in ('-wal', '-shm'):
+        if os.path.exists(database + suffix):
+            os.remove(database + suffix)
+    shutil.copyfile(path, database)
@@ -0,0 +1,90 @@
+import os
+import sys
+import shutil
+import sqlite3
+import pytest
+
+# Modules of the app are in the main folder (run tests from it: python -m pytest)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import DatabaseOperations
+from snapshots import restore_snapshot
+
+# Snapshot of the sample school (flask --app main snapshot-db): admins 1-3, teachers 4-23,
+# students 24-323 in classes 1-15 (20 in every class), about 5000 grades
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fixtures', 'school.db')
+
+# New database file with all tables and migrations
+def create_database(path):
+    conn = sqlite3.connect(path)
+    operation = DatabaseOperations(conn.cursor(), conn)
+    operation.generate_database()
+    operation.migrate()
+    return conn
+
+# Log in without the login page (password checks are slow on purpose), flask_login reads the user id from session
+def login(client, user_id):
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user_id)
+        session['_fresh'] = True
+
+# Empty database with the newest schema
+@pytest.fixture
+def database(tmp_path):
+    conn = create_database(str(tmp_path / 'empty.db'))
+    yield conn
+    conn.close()
+
+# Fixture with the newest migrations (done once), every test gets its own copy (school_path)
+@pytest.fixture(scope='session')
+def school_template(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('template') / 'school.db')
+    restore_snapshot(FIXTURE, path)
+    conn = sqlite3.connect(path)
+    DatabaseOperations(conn.cursor(), conn).migrate()
+    conn.close()
+    return path
+
+@pytest.fixture
+def school_path(tmp_path, school_template):
+    path = str(tmp_path / 'school.db')
+    shutil.copyfile(school_template, path)
+    return path
+
+@pytest.fixture
+def school(school_path):
+    conn = sqlite3.connect(school_path)
+    yield conn
+    conn.close()
+
+# The app (main module) using the copy of the school, caches are empty at the start of every test
+@pytest.fixture
+def app(school_path):
+    import main
+    main.pool.close()
+    main.pool.database = school_path
+    main.user_cache.clear()
+    main.chart_cache.clear()
+    yield main
+    main.pool.close()
+
+@pytest.fixture
+def client(app):
+    return app.app.test_client()
+
+# SQL statements run on pooled connections of the app (with values of parameters), in order
+@pytest.fixture
+def sql_log(app):
+    statements = []
+    factory = app.pool.factory
+
+    class RecordingConnection(factory):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.set_trace_callback(statements.append)
+
+    app.pool.close()
+    app.pool.factory = RecordingConnection
+    yield statements
+    app.pool.close()
+    app.pool.factory = factory
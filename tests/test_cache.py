@@ -0,0 +1,39 @@
+import threading
+from cache import ChartCache
+
+def test_new_version_replaces_old_chart():
+    cache = ChartCache(max_entries=10)
+    cache.put_chart('student', 1, 'v1', b'old')
+    cache.put_chart('student', 1, 'v1', b'old')
+    cache.put_chart('student', 1, 'v2', b'new')
+    assert cache.get_chart('student', 1, 'v1') is None
+    assert cache.get_chart('student', 1, 'v2') == b'new'
+    assert len(cache) == 1 and cache._versions == {('student', 1): 'v2'}
+    cache.invalidate_chart('student', 1)
+    assert len(cache) == 0 and cache._versions == {}
+
+# Versions of charts removed by LRU limits are forgotten, so memory doesn't grow with every student ever drawn
+def test_versions_of_evicted_charts_are_removed():
+    cache = ChartCache(max_entries=3, max_bytes=100)
+    for student_id in range(50):
+        cache.put_chart('student', student_id, f'v{student_id}', b'x' * 10)
+    assert len(cache) == 3
+    assert set(cache._versions) == {('student', 47), ('student', 48), ('student', 49)}
+    assert not cache.put_chart('student', 49, 'v50', b'x' * 101) # bigger than the whole cache
+    assert ('student', 49) not in cache._versions
+
+def test_charts_from_many_threads():
+    cache = ChartCache(max_entries=20)
+
+    def work(thread):
+        for i in range(2000):
+            cache.put_chart('class', (thread, i % 30), f'v{i}', b'chart')
+            cache.invalidate_chart('class', (thread, (i + 7) % 30))
+
+    threads = [threading.Thread(target=work, args=(thread,)) for thread in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert set(cache._versions) == {key[:2] for key in cache._data}
+    assert all(cache._versions[key[:2]] == key[2] for key in cache._data)
@@ -0,0 +1,106 @@
+from conftest import login
+from dashboard import student_dashboard_data
+
+# Statements of the student dashboard, counted by trace callback of pooled connections (sql_log).
+# Refresh of rankings is one transaction: BEGIN ... COMMIT is counted as one round trip.
+
+def round_trips(statements):
+    trips = []
+    transaction = None
+    for sql in statements:
+        keyword = sql.lstrip().split(None, 1)[0].upper()
+        if transaction is not None:
+            transaction.append(sql)
+            if keyword in ('COMMIT', 'ROLLBACK', 'END'):
+                transaction = None
+        elif keyword == 'BEGIN':
+            transaction = [sql]
+            trips.append(transaction)
+        else:
+            trips.append([sql])
+    return trips
+
+def logged_student(client, school):
+    student_id, class_id, subject_id = school.execute('''SELECT s.id, s.class_id, tc.subject_id FROM student s
+                                                         JOIN teacher_class tc ON tc.class_id = s.class_id
+                                                         ORDER BY s.id, tc.subject_id LIMIT 1''').fetchone()
+    login(client, student_id)
+    assert client.get('/student_dashboard').status_code == 200 # User is loaded and cached
+    return student_id, class_id, subject_id
+
+def test_dashboard_is_one_statement(client, sql_log, school):
+    _, _, subject_id = logged_student(client, school)
+    assert school.execute('SELECT COUNT(*) FROM ranking_dirty').fetchone()[0] == 0
+    sql_log.clear()
+    assert client.get('/student_dashboard').status_code == 200
+    assert len(sql_log) == 1
+    sql_log.clear()
+    assert client.post('/student_dashboard', data={'selected_subject': str(subject_id)}).status_code == 200
+    assert len(sql_log) == 1
+
+# Changes in other classes are refreshed when their rankings are read, not by this student
+def test_dashboard_with_other_dirty_class(client, sql_log, school):
+    _, class_id, _ = logged_student(client, school)
+    school.execute('INSERT INTO ranking_dirty (class_id) SELECT DISTINCT class_id FROM student WHERE class_id != ?', (class_id,))
+    school.commit()
+    dirty = school.execute('SELECT COUNT(*) FROM ranking_dirty').fetchone()[0]
+    assert dirty > 0
+    sql_log.clear()
+    assert client.get('/student_dashboard').status_code == 200
+    assert len(sql_log) == 1
+    assert school.execute('SELECT COUNT(*) FROM ranking_dirty').fetchone()[0] == dirty
+
+def test_student_count_follows_students(school):
+    student_id, _ = school.execute('SELECT id, class_id FROM student ORDER BY id LIMIT 1').fetchone()
+    students = school.execute('SELECT COUNT(*) FROM student').fetchone()[0]
+    assert student_dashboard_data(school, student_id).num_school_students == students
+    school.execute("INSERT INTO user (id, email, role) VALUES (1000, 'new@student.uw.edu.pl', 'student')")
+    school.execute('INSERT INTO student (id, class_id) VALUES (1000, NULL)')
+    school.commit()
+    assert student_dashboard_data(school, student_id).num_school_students == students + 1
+    school.execute('DELETE FROM student WHERE id = 1000')
+    school.commit()
+    assert student_dashboard_data(school, student_id).num_school_students == students
+
+def test_dashboard_after_new_grade(client, sql_log, school):
+    student_id, class_id, subject_id = logged_student(client, school)
+    school.execute('''INSERT INTO grade (value, weight, subject_id, student_id, teacher_id)
+                      SELECT 6, 1, subject_id, ?, teacher_id FROM teacher_class WHERE class_id = ? AND subject_id = ?''',
+                   (student_id, class_id, subject_id))
+    school.commit()
+    assert school.execute('SELECT COUNT(*) FROM ranking_dirty').fetchone()[0] == 1
+    sql_log.clear()
+    assert client.get('/student_dashboard').status_code == 200
+    # Dashboard query, refresh of rankings, dashboard query again
+    trips = round_trips(sql_log)
+    assert len(trips) == 3
+    assert trips[0] == trips[2]
+    assert trips[1][0].startswith('BEGIN') and trips[1][-1] == 'COMMIT'
+    assert school.execute('SELECT COUNT(*) FROM ranking_dirty').fetchone()[0] == 0
+    sql_log.clear()
+    assert client.get('/student_dashboard').status_code == 200
+    assert len(sql_log) == 1
+
+# Student without grades has no position in rankings
+def test_dashboard_without_grades(client, school):
+    class_id = school.execute('SELECT class_id FROM student ORDER BY id LIMIT 1').fetchone()[0]
+    school.execute("INSERT INTO user (id, email, first_name, second_name, role) VALUES (1000, 'new@student.uw.edu.pl', 'New', 'Student', 'student')")
+    school.execute('INSERT INTO student (id, class_id) VALUES (1000, ?)', (class_id,))
+    school.commit()
+    login(client, 1000)
+    html = client.get('/student_dashboard').get_data(as_text=True)
+    assert 'None' not in html
+    assert '<img' not in html
+    assert html.count('No grades available') == 3
+
+# Class without grades of the teacher's subject has no chart
+def test_teacher_dashboard_without_grades(client, school):
+    teacher_id, subject_id = school.execute('SELECT id, subject_id FROM teacher ORDER BY id LIMIT 1').fetchone()
+    school.execute("INSERT INTO class (id, name, profile) VALUES (100, '9Z', 'Empty')")
+    school.execute('INSERT INTO teacher_class (teacher_id, class_id, subject_id) VALUES (?, 100, ?)', (teacher_id, subject_id))
+    school.commit()
+    login(client, teacher_id)
+    html = client.post('/teacher_dashboard', data={'selected_class': '100'}).get_data(as_text=True)
+    assert 'src="None"' not in html
+    assert '<img' not in html
+    assert 'No grades available' in html
@@ -0,0 +1,21 @@
+from conftest import login
+from exports import export_lines
+
+# Download reads by its own connection. Connection of the request goes back to the pool when the view returns
+# (before the download ends), other requests can use or close it, the download must not read by it.
+def test_export_doesnt_keep_pooled_connection(app, client, school, monkeypatch):
+    admin_id = school.execute("SELECT id FROM user WHERE role = 'admin' ORDER BY id LIMIT 1").fetchone()[0]
+    login(client, admin_id)
+    monkeypatch.setitem(app.app.config, 'EXPORT_BATCH_SIZE', 10)
+    response = client.get('/export/grades.csv', buffered=False)
+    assert response.status_code == 200
+    lines = response.iter_encoded()
+    first = next(lines)
+    monkeypatch.setattr(app.pool, 'timeout', 0.1)
+    connections = [app.pool.acquire() for _ in range(app.pool.max_size)]
+    for conn in connections:
+        conn.close()
+        app.pool.release(conn)
+    body = (first + b''.join(lines)).decode('utf-8')
+    response.close()
+    assert body == ''.join(export_lines(school, 'grades', 'csv'))
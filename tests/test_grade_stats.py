@@ -0,0 +1,49 @@
+import random
+import statistics
+import numpy as np
+from conftest import login
+from grade_stats import GradeStats, class_stats
+
+def stats_of(grades):
+    return GradeStats([grades.count(value) for value in range(1, 7)])
+
+# The same results as statistics and numpy working on the list of all grades
+def test_stats_match_list_of_grades():
+    rand = random.Random(0)
+    for size in [1, 2, 3, 10, 55, 110, 1000]:
+        for _ in range(20):
+            grades = [rand.randint(1, 6) for _ in range(size)]
+            stats = stats_of(grades)
+            assert stats.mean() == statistics.mean(grades)
+            assert stats.median() == statistics.median(grades)
+            assert stats.modes() == sorted(statistics.multimode(grades))
+            for percent in (0, 10, 25, 50, 90, 100):
+                assert abs(stats.percentile(percent) - np.percentile(grades, percent)) < 1e-9
+
+def test_equally_frequent_grades_are_all_modes():
+    assert stats_of([4] * 55 + [6] * 55 + [5] * 10).modes() == [4, 6]
+    assert stats_of([]).modes() == []
+    assert stats_of([]).median() is None
+
+def test_class_stats_from_aggregates(school):
+    grades = [row[0] for row in school.execute('''SELECT g.value FROM grade g JOIN student s ON s.id = g.student_id
+                                                  WHERE s.class_id = 1''')]
+    stats = class_stats(school, 1)
+    assert stats.count == len(grades)
+    assert stats.median() == statistics.median(grades)
+    assert stats.modes() == sorted(statistics.multimode(grades))
+
+# Teacher dashboard shows all equally frequent grades
+def test_teacher_dashboard_shows_tied_modes(app, client, school):
+    teacher_id, class_id, subject_id = school.execute('''SELECT teacher_id, class_id, subject_id FROM teacher_class
+                                                         ORDER BY teacher_id, class_id LIMIT 1''').fetchone()
+    student_id = school.execute('SELECT id FROM student WHERE class_id = ? LIMIT 1', (class_id,)).fetchone()[0]
+    counts = dict(school.execute('''SELECT g.value, COUNT(*) FROM grade g JOIN student s ON s.id = g.student_id
+                                    WHERE s.class_id = ? GROUP BY g.value''', (class_id,)).fetchall())
+    top = max(counts.values()) + 5
+    school.executemany('INSERT INTO grade (value, weight, subject_id, student_id, teacher_id) VALUES (?, 0.5, ?, ?, ?)',
+                       [(value, subject_id, student_id, teacher_id) for value in (1, 6) for _ in range(top - counts.get(value, 0))])
+    school.commit()
+    login(client, teacher_id)
+    page = client.post('/teacher_dashboard', data={'selected_class': str(class_id)}).get_data(as_text=True)
+    assert 'Class mode is <strong>1, 6</strong>' in page
@@ -0,0 +1,37 @@
+import sqlite3
+import metrics
+from conftest import login
+
+def admin_and_student(school):
+    admin_id = school.execute("SELECT id FROM user WHERE role = 'admin' ORDER BY id LIMIT 1").fetchone()[0]
+    student_id = school.execute('SELECT id FROM student ORDER BY id LIMIT 1').fetchone()[0]
+    return admin_id, student_id
+
+# The route is on even if tests run with SCHOOL_METRICS=0
+def test_metrics_only_for_admin(app, client, school, monkeypatch):
+    monkeypatch.setitem(app.app.config, 'METRICS', True)
+    admin_id, student_id = admin_and_student(school)
+    assert client.get('/metrics').status_code == 403
+    login(client, student_id)
+    assert client.get('/metrics').status_code == 403
+    login(client, admin_id)
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert 'school_requests_total' in response.get_data(as_text=True)
+
+def test_metrics_token(app, client, monkeypatch):
+    monkeypatch.setitem(app.app.config, 'METRICS', True)
+    monkeypatch.setitem(app.app.config, 'METRICS_TOKEN', 'secret')
+    assert client.get('/metrics', headers={'Authorization': 'Bearer secret'}).status_code == 200
+    assert client.get('/metrics', headers={'Authorization': 'Bearer other'}).status_code == 403
+
+# Without init_app (SCHOOL_METRICS=0) nothing is counted, also by instrumented connections
+def test_disabled_metrics_count_nothing(monkeypatch):
+    monkeypatch.setattr(metrics.registry, 'enabled', False)
+    before = metrics.registry.collect()
+    metrics.CHART_RENDER_SECONDS.observe(0.5, 'student', 'svg')
+    conn = sqlite3.connect(':memory:', factory=metrics.InstrumentedConnection)
+    conn.execute('SELECT 1').fetchone()
+    conn.commit()
+    conn.close()
+    assert metrics.registry.collect() == before
@@ -0,0 +1,122 @@
+import re
+import sqlite3
+from conftest import FIXTURE, login
+from migrations import MIGRATIONS, latest_version, run_migrations, schema_version, ensure_views
+from dashboard import student_dashboard_data
+from grade_stats import class_stats
+from grades import class_roster
+from rankings import class_ranking, student_rank
+
+# Every migration is checked with EXPLAIN QUERY PLAN of the queries which need it: grade, student and teacher_class
+# are read by index (SEARCH ... USING INDEX idx_* or primary key), never by reading the whole table (SCAN).
+
+TABLES = ('grade', 'student', 'teacher_class')
+INDEX_SEARCH = re.compile(r'SEARCH \w+ USING (COVERING )?INDEX idx_\w+')
+SCAN = re.compile(r'^SCAN (\w+)')
+
+# Statements run by function (with values of parameters, so they can be explained later)
+def traced(conn, function):
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        function()
+    finally:
+        conn.set_trace_callback(None)
+    return statements
+
+def query_plan(conn, sql):
+    return [row[3] for row in conn.execute(f'EXPLAIN QUERY PLAN {sql}')]
+
+# Names of tables and their aliases in the query, e.g. {'g': 'grade', 'grade': 'grade'}
+def table_aliases(sql):
+    aliases = {}
+    for table, alias in re.findall(r'\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?', sql, re.IGNORECASE):
+        aliases[table] = table
+        if alias and alias.upper() not in ('ON', 'WHERE', 'JOIN', 'LEFT', 'GROUP', 'ORDER', 'LIMIT', 'USING'):
+            aliases[alias] = table
+    return aliases
+
+# Plan lines which read the whole grade, student or teacher_class table
+def table_scans(conn, sql):
+    aliases = table_aliases(sql)
+    return [line for line in query_plan(conn, sql)
+            if SCAN.match(line) and aliases.get(SCAN.match(line).group(1)) in TABLES]
+
+def reads_tables(sql):
+    return any(table in TABLES for table in table_aliases(sql).values())
+
+def assert_indexed(conn, statements, allowed_scans=()):
+    queries = [sql for sql in statements if sql.lstrip().upper().startswith(('SELECT', 'WITH')) and reads_tables(sql)]
+    assert queries
+    for sql in queries:
+        scans = [line for line in table_scans(conn, sql) if line not in allowed_scans]
+        assert not scans, (sql, scans)
+        assert any(INDEX_SEARCH.match(line) for line in query_plan(conn, sql)), sql
+
+def first_teacher_class(conn):
+    return conn.execute('SELECT teacher_id, class_id FROM teacher_class ORDER BY teacher_id, class_id LIMIT 1').fetchone()
+
+def first_student(conn):
+    return conn.execute('SELECT id, class_id FROM student ORDER BY id LIMIT 1').fetchone()
+
+def test_migrations_are_applied_once(database):
+    versions = [version for version, _, _ in MIGRATIONS]
+    assert versions == sorted(versions)
+    assert schema_version(database) == latest_version()
+    assert run_migrations(database) == []
+    assert ensure_views(database) == []
+
+# Snapshot in fixtures/ (tests, restore-db) must be made again after every new migration: flask --app main restore-db
+# fixtures/school.db, then flask --app main snapshot-db to a new file which replaces the old snapshot
+def test_fixture_has_all_migrations():
+    conn = sqlite3.connect(f'file:{FIXTURE}?mode=ro', uri=True)
+    try:
+        assert schema_version(conn) == latest_version() == len(MIGRATIONS)
+        assert conn.execute('SELECT COUNT(*) FROM ranking_dirty').fetchone()[0] == 0
+    finally:
+        conn.close()
+
+def test_migration_1_indexes_used_by_teacher_pages(app, client, sql_log, school):
+    teacher_id, class_id = first_teacher_class(school)
+    login(client, teacher_id)
+    assert client.get('/teacher_dashboard').status_code == 200
+    assert client.post('/teacher_dashboard', data={'selected_class': str(class_id)}).status_code == 200
+    assert client.post('/enter_grades', data={'gradeaction': 'update1', 'selectedClass': str(class_id)}).status_code == 200
+    assert_indexed(school, sql_log + traced(school, lambda: class_roster(school, class_id)))
+
+def test_migration_2_aggregates_read_by_student_and_class(school):
+    student_id, class_id = first_student(school)
+    statements = traced(school, lambda: class_stats(school, class_id))
+    statements += traced(school, lambda: class_stats(school, class_id, 1))
+    assert_indexed(school, statements)
+
+def test_migration_3_rankings_read_by_index(school):
+    student_id, class_id = first_student(school)
+    statements = traced(school, lambda: class_ranking(school, class_id))
+    statements += traced(school, lambda: student_rank(school, student_id, 1))
+    queries = [sql for sql in statements if 'student_ranking' in sql]
+    assert queries
+    for sql in queries:
+        assert not [line for line in query_plan(school, sql) if SCAN.match(line)], sql
+
+def test_migration_4_views_created_once(database):
+    assert ensure_views(database) == []
+    assert {row[0] for row in database.execute('SELECT name FROM schema_view')} == \
+           {row[0] for row in database.execute("SELECT name FROM sqlite_master WHERE type = 'view'")}
+
+def test_migration_5_rebuilt_grade_table_keeps_index(school):
+    student_id, _ = first_student(school)
+    assert school.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_grade_student_subject'").fetchone()
+    statements = traced(school, lambda: student_dashboard_data(school, student_id))
+    statements += traced(school, lambda: student_dashboard_data(school, student_id, 1))
+    assert_indexed(school, statements)
+
+def test_migration_7_school_rank_counted_by_index(school):
+    student_id, _ = first_student(school)
+    statements = traced(school, lambda: student_rank(school, student_id))
+    sql = [sql for sql in statements if 'other.average' in sql]
+    assert sql
+    plan = query_plan(school, sql[0])
+    assert not [line for line in plan if SCAN.match(line)], plan
+    assert len([line for line in plan if 'USING COVERING INDEX idx_student_ranking_subject' in line]) == 2
+    assert not school.execute("SELECT 1 FROM pragma_table_info('student_ranking') WHERE name = 'school_rank'").fetchone()
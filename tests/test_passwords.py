@@ -0,0 +1,22 @@
+import time
+import pytest
+from passwords import PasswordPool, PasswordPoolBusy
+
+# Request which stopped waiting doesn't free the slot of its password, the pool stays bounded
+def test_timed_out_password_keeps_its_slot():
+    pool = PasswordPool(workers=1, max_queue=0, timeout=0.05)
+    try:
+        with pytest.raises(PasswordPoolBusy, match='was not checked'):
+            pool._run(time.sleep, 0.5)
+        with pytest.raises(PasswordPoolBusy, match='Too many'):
+            pool._run(abs, -1)
+        deadline = time.monotonic() + 5
+        while True:
+            try:
+                assert pool._run(abs, -1) == 1
+                break
+            except PasswordPoolBusy:
+                assert time.monotonic() < deadline
+                time.sleep(0.05)
+    finally:
+        pool.close()
@@ -0,0 +1,110 @@
+import sqlite3
+import migrations
+import models
+from analytics import rebuild_rankings
+from dashboard import student_dashboard_data
+from rankings import class_ranking, refresh_rankings, school_rank_sql, student_rank
+from snapshots import restore_snapshot
+from conftest import FIXTURE
+
+# Seed data of add_data (models.py) is commented, tests use a small school in the same format.
+# Passwords are already hashes, so they are not hashed again.
+PASSWORD_HASH = 'pbkdf2:sha256:1$salt$hash'
+SEED = {
+    'subject_data': [(1, 'Mathematics'), (2, 'Physics')],
+    'class_data': [(1, '1A', 'Information Technology'), (2, '1B', 'Medical')],
+    'user_data': [(1, 'admin@admin.uw.edu.pl', 'admin', 'admin', PASSWORD_HASH, 'admin'),
+                  (2, 'jkowalski@uw.edu.pl', 'Jan', 'Kowalski', PASSWORD_HASH, 'teacher'),
+                  (3, 'aadams@student.uw.edu.pl', 'Anna', 'Adams', PASSWORD_HASH, 'student'),
+                  (4, 'bbrown@student.uw.edu.pl', 'Bob', 'Brown', PASSWORD_HASH, 'student'),
+                  (5, 'ccole@student.uw.edu.pl', 'Celina', 'Cole', PASSWORD_HASH, 'student')],
+    'assign_data': [(1, 2, 1, 1), (2, 2, 2, 1)],
+    'grade_data': [(1, '5', 1.0, 1, 3, 2), (2, '3', 0.5, 1, 4, 2), (3, '4', 0.5, 1, 5, 2), (4, '6', 0.2, 1, 3, 2)],
+    'teacher_data': [(2, 1)],
+    'student_data': [(3, 1), (4, 1), (5, 2)],
+}
+
+def seed(conn, monkeypatch):
+    for name, rows in SEED.items():
+        monkeypatch.setattr(models, name, rows)
+    models.DatabaseOperations(conn.cursor(), conn).add_data()
+
+# add_data saves grades before students, rankings must be calculated anyway
+def test_seeded_database_has_rankings(database, monkeypatch):
+    seed(database, monkeypatch)
+    assert database.execute('SELECT COUNT(*) FROM grade').fetchone()[0] == len(SEED['grade_data'])
+    assert [row[0] for row in class_ranking(database, 1)] == [3, 4]
+    assert [row[0] for row in class_ranking(database, 2)] == [5]
+    data = student_dashboard_data(database, 4)
+    assert (data.class_rank, data.school_rank, data.num_students) == (2, 3, 2)
+
+def test_added_student_marks_class(database, monkeypatch):
+    seed(database, monkeypatch)
+    class_ranking(database, 1)
+    database.execute("INSERT INTO user (id, email, role) VALUES (6, 'ddavis@student.uw.edu.pl', 'student')")
+    database.execute("INSERT INTO grade (value, weight, subject_id, student_id, teacher_id) VALUES (6, 1, 1, 6, 2)")
+    database.execute('INSERT INTO student (id, class_id) VALUES (6, 1)')
+    database.commit()
+    assert [row[0] for row in class_ranking(database, 1)] == [6, 3, 4]
+
+# Averages of the fixture in grade_aggregate were added in other order than numpy adds them, equal averages differ
+# in the last bit (3.0 and 2.9999999999999996). Both ways must give the same rows (ties are ordered by id).
+def test_sql_and_numpy_rankings_are_the_same(tmp_path):
+    path = str(tmp_path / 'fixture.db')
+    restore_snapshot(FIXTURE, path)
+    conn = sqlite3.connect(path)
+    models.DatabaseOperations(conn.cursor(), conn).migrate()
+    conn.execute('INSERT OR IGNORE INTO ranking_dirty (class_id) SELECT DISTINCT class_id FROM student WHERE class_id IS NOT NULL')
+    conn.commit()
+    query = f'''SELECT r.student_id, r.subject_id, r.class_id, r.average, r.class_rank, {school_rank_sql('r')}
+                FROM student_ranking r ORDER BY 1, 2'''
+    refresh_rankings(conn)
+    sql_rows = conn.execute(query).fetchall()
+    analytics = rebuild_rankings(conn)
+    numpy_rows = conn.execute(query).fetchall()
+    conn.close()
+    assert sql_rows
+    assert sql_rows == numpy_rows
+    assert sql_rows == sorted((*row, rank) for row, rank in zip(analytics.ranking_rows(), analytics.school_ranks.tolist()))
+
+# Classes marked by older migrations are ranked by migration 7, school ranks count every class from the first read
+def test_migration_ranks_marked_classes(tmp_path, monkeypatch):
+    conn = sqlite3.connect(str(tmp_path / 'old.db'))
+    monkeypatch.setattr(migrations, 'MIGRATIONS', migrations.MIGRATIONS[:6])
+    models.DatabaseOperations(conn.cursor(), conn).generate_database()
+    models.DatabaseOperations(conn.cursor(), conn).migrate()
+    seed(conn, monkeypatch)
+    assert conn.execute('SELECT class_id FROM ranking_dirty ORDER BY class_id').fetchall() == [(1,), (2,)]
+    monkeypatch.undo()
+    models.DatabaseOperations(conn.cursor(), conn).migrate()
+    assert conn.execute('SELECT COUNT(*) FROM ranking_dirty').fetchone()[0] == 0
+    assert conn.execute('SELECT DISTINCT class_id FROM student_ranking ORDER BY class_id').fetchall() == [(1,), (2,)]
+    conn.close()
+
+def dirty_classes(conn):
+    return [row[0] for row in conn.execute('SELECT class_id FROM ranking_dirty ORDER BY class_id')]
+
+# Reading one class refreshes only this class, other changed classes wait for their own read
+def test_refresh_only_read_class(school):
+    student_id, class_id = school.execute('SELECT id, class_id FROM student WHERE class_id = 1 ORDER BY id LIMIT 1').fetchone()
+    other_rows = school.execute('SELECT * FROM student_ranking WHERE class_id = 2 ORDER BY 1, 2').fetchall()
+    school.execute('UPDATE grade_aggregate SET weighted_sum = 100 * total_weight WHERE student_id = ?', (student_id,))
+    school.execute('INSERT INTO ranking_dirty (class_id) VALUES (2)')
+    school.commit()
+    assert dirty_classes(school) == [1, 2]
+    assert class_ranking(school, 1)[0][:2] == (student_id, 100)
+    assert dirty_classes(school) == [2]
+    assert school.execute('SELECT * FROM student_ranking WHERE class_id = 2 ORDER BY 1, 2').fetchall() == other_rows
+    assert student_rank(school, student_id) == (1, 1, 100)
+
+# Student moved to other class: refresh of the new class takes his row, the old class is refreshed when it's read
+def test_moved_student(school):
+    student_id = school.execute('SELECT id FROM student WHERE class_id = 1 ORDER BY id LIMIT 1').fetchone()[0]
+    school.execute('UPDATE student SET class_id = 2 WHERE id = ?', (student_id,))
+    school.commit()
+    assert student_id in [row[0] for row in class_ranking(school, 2)]
+    assert dirty_classes(school) == [1]
+    graded = school.execute('''SELECT COUNT(DISTINCT s.id) FROM student s JOIN grade_aggregate ga ON ga.student_id = s.id
+                               WHERE s.class_id = 1 AND ga.grade_count > 0''').fetchone()[0]
+    assert [row[2] for row in class_ranking(school, 1)] == list(range(1, graded + 1))
+    assert dirty_classes(school) == []
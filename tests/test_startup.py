@@ -0,0 +1,9 @@
+import statistics
+from benchmarks.startup import BUDGET, measure_startup
+
+# Cold start of a worker (benchmarks/startup.py): import main is fast, doesn't load matplotlib or touch database
+def test_import_time_in_budget():
+    times, matplotlib, created = measure_startup(3)
+    assert not matplotlib
+    assert not created
+    assert statistics.median(times) <= BUDGET, times